@@ -0,0 +1 @@
+"""Benchmarks of bperf; run each module with `python -m benchmarks.<name>`."""
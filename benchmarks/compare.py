@@ -0,0 +1,109 @@
+"""Compare two JSON baselines written by `benchmarks.timing`, and flag the
+statistically significant slowdowns; exits with status 1 if any.
+
+Usage: python -m benchmarks.compare BASELINE CURRENT [--threshold 0.05]
+                                    [--confidence 0.95]
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+import numpy as np
+
+_RESAMPLES = 10000
+
+
+class Comparison(NamedTuple):
+    """Ratio of the mean time of a benchmark between two baselines, and
+    its bootstrapped confidence interval.
+    """
+
+    name: str
+    ratio: float
+    low: float
+    high: float
+    slower: bool
+
+
+def ratio_interval(
+    baseline: List[float],
+    current: List[float],
+    *,
+    confidence: float,
+    seed: int = 0,
+) -> Tuple[float, float, float]:
+    """Get the ratio of the mean of `current` to the mean of `baseline`,
+    and its confidence interval obtained by bootstrapping both samples.
+    """
+    rng = np.random.default_rng(seed)
+    baseline_, current_ = np.asarray(baseline), np.asarray(current)
+    ratio = current_.mean() / baseline_.mean()
+    ratios = rng.choice(current_, (_RESAMPLES, current_.size)).mean(
+        axis=1
+    ) / rng.choice(baseline_, (_RESAMPLES, baseline_.size)).mean(axis=1)
+    tail = 100.0 * (1.0 - confidence) / 2.0
+    low, high = np.percentile(ratios, [tail, 100.0 - tail])
+    return float(ratio), float(low), float(high)
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    *,
+    threshold: float,
+    confidence: float,
+) -> List[Comparison]:
+    """Compare the benchmarks common to `baseline` and `current`; a
+    benchmark is flagged as slower when the lower bound of the confidence
+    interval of its ratio exceeds 1 + `threshold`.
+    """
+    comparisons = []
+    for name, result in current["benchmarks"].items():
+        if name not in baseline["benchmarks"]:
+            continue
+        ratio, low, high = ratio_interval(
+            baseline["benchmarks"][name]["times"],
+            result["times"],
+            confidence=confidence,
+        )
+        slower = low > 1.0 + threshold
+        comparisons.append(Comparison(name, ratio, low, high, slower))
+    return comparisons
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path) as file:
+        return json.load(file)  # type: ignore[no-any-return]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.05)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    arguments = parser.parse_args()
+    baseline, current = _load(arguments.baseline), _load(arguments.current)
+    for key in ("python", "platform", "numpy", "commit"):
+        before = baseline["environment"].get(key)
+        after = current["environment"].get(key)
+        if before != after:
+            print(f"{key}: {before} -> {after}")
+    comparisons = compare(
+        baseline,
+        current,
+        threshold=arguments.threshold,
+        confidence=arguments.confidence,
+    )
+    for comparison in comparisons:
+        flag = "SLOWER" if comparison.slower else ""
+        print(
+            f"{comparison.name:<32}{comparison.ratio:>8.3f}"
+            f"  [{comparison.low:.3f}, {comparison.high:.3f}]  {flag}"
+        )
+    sys.exit(int(any(comparison.slower for comparison in comparisons)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Synthetic data for the benchmarks."""
+from concurrent.futures import Executor
+from typing import Any, List, Optional, Type
+
+import numpy as np
+
+from bperf.curve import SpotCurve
+from bperf.flows import Flows
+from bperf.money import Money
+from bperf.percent import Percent
+from bperf.performance import PerformanceCalculator
+from bperf.performance.effect import EffectsCalculator
+from bperf.performance.effect.carry import TwoPointsCarryEffectCalculator
+from bperf.performance.effect.curve import TwoPointsCurveEffectCalculator
+from bperf.performance.effect.spread import TwoPointsSpreadEffectCalculator
+from bperf.performance.generic import (
+    CrossSectionalPerformanceCalculator,
+    ITwoPointsPerformanceCalculator,
+    LongitudinalPerformanceCalculator,
+)
+from bperf.performance.residual import ResidualCalculator
+from bperf.performance.total import (
+    TotalPerformanceCalculator,
+    TwoPointsTotalPerformanceCalculator,
+)
+from bperf.priced import PricedFlows
+from bperf.priced.points import PricedPoints
+from bperf.priced.points.weighted import WeightedPricedPoints
+from bperf.priced.points.weighted.sequence import WeightedPricedPointsSequence
+from bperf.priced.points.weighted.table import WeightedPricedPointsTable
+from bperf.rate.continuous import ContinuousRate
+from bperf.term import Term
+from bperf.termed import Termed
+
+DAY = 1.0 / 365.0
+TENORS = (0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 7.0, 10.0, 15.0, 20.0, 30.0, 40.0)
+
+
+def make_table(
+    positions: int,
+    periods: int,
+    *,
+    flows: int = 20,
+    seed: int = 0,
+) -> WeightedPricedPointsTable:
+    """Make a table of `positions` bonds paying `flows` semi-annual flows
+    over `periods` daily periods, priced with one government curve per date.
+    """
+    rng = np.random.default_rng(seed)
+    curves = [_make_curve(rng) for _ in range(periods + 1)]
+    firsts = rng.uniform(0.1, 0.5, positions) + periods * DAY
+    coupons = rng.integers(100, 500, positions)
+    spreads = rng.uniform(0.0, 0.02, (periods + 1, positions))
+    sequences = []
+    for period in range(periods):
+        weights = rng.multinomial(10000, np.full(positions, 1.0 / positions))
+        sequences.append(
+            WeightedPricedPointsSequence(
+                WeightedPricedPoints(
+                    Percent(int(weights[position])),
+                    PricedPoints(
+                        *(
+                            PricedFlows(
+                                _make_flows(
+                                    firsts[position] - date * DAY,
+                                    int(coupons[position]),
+                                    flows,
+                                ),
+                                curves[date],
+                                ContinuousRate(spreads[date, position]),
+                            )
+                            for date in (period, period + 1)
+                        ),
+                        deferred=True,
+                    ),
+                )
+                for position in range(positions)
+            )
+        )
+    return WeightedPricedPointsTable(sequences)
+
+
+def _make_curve(rng: np.random.Generator) -> SpotCurve:
+    level = rng.uniform(0.01, 0.04)
+    return SpotCurve(
+        Termed(Term(tenor), ContinuousRate(level + 0.001 * np.log1p(tenor)))
+        for tenor in TENORS
+    )
+
+
+def _make_flows(first: float, coupon: int, count: int) -> Flows:
+    cents: List[int] = [coupon] * (count - 1) + [coupon + 10000]
+    return Flows(
+        Termed(Term(first + 0.5 * index), Money(cents[index]))
+        for index in range(count)
+    )
+
+
+def longitudinal(
+    calculator: ITwoPointsPerformanceCalculator,
+    cross: Type[
+        CrossSectionalPerformanceCalculator[Any]
+    ] = CrossSectionalPerformanceCalculator,
+    over: Type[
+        LongitudinalPerformanceCalculator[Any]
+    ] = LongitudinalPerformanceCalculator,
+) -> LongitudinalPerformanceCalculator[Any]:
+    """Make a longitudinal calculator `over` of `calculator` using `cross`
+    as cross-sectional calculator.
+    """
+    return over(cross(calculator))
+
+
+def make_calculator(
+    cross: Type[
+        CrossSectionalPerformanceCalculator[Any]
+    ] = CrossSectionalPerformanceCalculator,
+    executor: Optional[Executor] = None,
+    over: Type[
+        LongitudinalPerformanceCalculator[Any]
+    ] = LongitudinalPerformanceCalculator,
+) -> PerformanceCalculator:
+    """Make a calculator of total, carry, curve, spread and residual using
+    `over` as longitudinal calculator, `cross` as cross-sectional
+    calculator, and `executor` to calculate them concurrently.
+    """
+    return PerformanceCalculator(
+        TotalPerformanceCalculator(
+            longitudinal(TwoPointsTotalPerformanceCalculator(), cross, over),
+        ),
+        EffectsCalculator(
+            {
+                "carry": longitudinal(
+                    TwoPointsCarryEffectCalculator(), cross, over
+                ),
+                "curve": longitudinal(
+                    TwoPointsCurveEffectCalculator(), cross, over
+                ),
+                "spread": longitudinal(
+                    TwoPointsSpreadEffectCalculator(), cross, over
+                ),
+            },
+            executor=executor,
+        ),
+        ResidualCalculator(),
+        executor=executor,
+    )
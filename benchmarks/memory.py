@@ -0,0 +1,69 @@
+"""Memory footprint of building and evaluating tables of increasing size.
+
+Usage: python -m benchmarks.memory [--sizes 100x5 1000x5 ...]
+"""
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, List, Tuple, TypeVar
+
+from bperf.priced.points.weighted.deltas import WeightedPricedPointsDeltas
+
+from .data import make_calculator, make_table
+
+T = TypeVar("T")
+
+
+def measure(function: Callable[[], T]) -> Tuple[T, int, int]:
+    """Call `function`, and get its result along with the peak and retained
+    traced memory in bytes over the call.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak, retained
+
+
+def run(sizes: List[Tuple[int, int]]) -> None:
+    calculator = make_calculator()
+    print(
+        f"{'positions':>10}{'periods':>9}{'build peak':>14}"
+        f"{'build retained':>16}{'deep size':>14}{'per position':>14}"
+        f"{'deltas size':>14}{'eval peak':>14}"
+    )
+    for positions, periods in sizes:
+        table, peak, retained = measure(lambda: make_table(positions, periods))
+        size = table.deep_sizeof()
+        deltas = WeightedPricedPointsDeltas.from_table(table).nbytes
+        _, evaluation, _ = measure(lambda: calculator.calculate(table))
+        print(
+            f"{positions:>10}{periods:>9}{peak:>14}{retained:>16}"
+            f"{size:>14}{size // (positions * periods):>14}{deltas:>14}"
+            f"{evaluation:>14}"
+        )
+
+
+def _size(value: str) -> Tuple[int, int]:
+    positions, periods = value.split("x")
+    return int(positions), int(periods)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=_size,
+        default=[(10, 5), (100, 5), (500, 5)],
+        help="sizes as <positions>x<periods>",
+    )
+    run(parser.parse_args().sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""Timing benchmarks recorded, with environment metadata, to a JSON baseline.
+
+Usage: python -m benchmarks.timing OUTPUT [--repeat 10] [--warmup 2]
+                                          [--only NAME ...]
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+import bperf
+from bperf.performance.generic import (
+    HoldingsLongitudinalPerformanceCalculator,
+    MatrixCrossSectionalPerformanceCalculator,
+)
+from bperf.performance.total import (
+    TotalPerformanceCalculator,
+    TwoPointsTotalPerformanceCalculator,
+)
+from bperf.priced.points.weighted.holdings import WeightedPricedPointsHoldings
+
+from .data import longitudinal, make_calculator, make_table
+
+CASES: Dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def case(name: str) -> Callable[[Callable[[], Callable[[], object]]], Any]:
+    """Register a benchmark case; a case prepares its inputs, and returns
+    the callable to time.
+    """
+
+    def register(
+        prepare: Callable[[], Callable[[], object]],
+    ) -> Callable[[], Callable[[], object]]:
+        CASES[name] = prepare
+        return prepare
+
+    return register
+
+
+@case("build_table_100x5")
+def _build_table() -> Callable[[], object]:
+    return lambda: make_table(100, 5)
+
+
+@case("calculate_100x5")
+def _calculate() -> Callable[[], object]:
+    table, calculator = make_table(100, 5), make_calculator()
+    return lambda: calculator.calculate(table)
+
+
+@case("calculate_threaded_100x5")
+def _calculate_threaded() -> Callable[[], object]:
+    # the calculations are mostly Python code holding the GIL, hence no
+    # speedup over calculate_100x5 is expected on CPython; compare both on
+    # the same machine, whose core count the baseline records (cpus)
+    executor = ThreadPoolExecutor(max_workers=4)
+    table, calculator = make_table(100, 5), make_calculator(executor=executor)
+    return lambda: calculator.calculate(table)
+
+
+@case("calculate_matrix_100x5")
+def _calculate_matrix() -> Callable[[], object]:
+    table = make_table(100, 5)
+    calculator = make_calculator(MatrixCrossSectionalPerformanceCalculator)
+    return lambda: calculator.calculate(table)
+
+
+@case("calculate_holdings_100x5")
+def _calculate_holdings() -> Callable[[], object]:
+    arrays = WeightedPricedPointsHoldings.from_table(make_table(100, 5)).arrays
+    calculator = make_calculator(over=HoldingsLongitudinalPerformanceCalculator)
+    # new holdings per call, since holdings keep their prices
+    return lambda: calculator.calculate(
+        WeightedPricedPointsHoldings._trusted(arrays).table()
+    )
+
+
+@case("calculate_total_1000x1")
+def _calculate_total() -> Callable[[], object]:
+    table = make_table(1000, 1)
+    calculator = TotalPerformanceCalculator(
+        longitudinal(TwoPointsTotalPerformanceCalculator()),
+    )
+    return lambda: calculator.calculate(table)
+
+
+def time_case(
+    function: Callable[[], object],
+    *,
+    repeat: int,
+    warmup: int,
+) -> List[float]:
+    """Time `function` `repeat` times after `warmup` untimed calls."""
+    for _ in range(warmup):
+        function()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def environment() -> Dict[str, Any]:
+    """Get metadata on the environment running the benchmarks."""
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "numpy": np.__version__,
+        "bperf": bperf.__version__,
+        "commit": _commit(),
+    }
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    names: List[str],
+    *,
+    repeat: int,
+    warmup: int,
+) -> Dict[str, Any]:
+    """Run the benchmarks named `names`, and get the baseline recording
+    their timings along with the environment.
+    """
+    results = {}
+    for name in names:
+        timings = time_case(CASES[name](), repeat=repeat, warmup=warmup)
+        results[name] = {"repeat": repeat, "warmup": warmup, "times": timings}
+        print(f"{name:<32}{min(timings):>12.6f}{np.median(timings):>12.6f}")
+    return {"environment": environment(), "benchmarks": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output", help="path of the JSON baseline to write")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--only", nargs="+", choices=sorted(CASES))
+    arguments = parser.parse_args()
+    baseline = run(
+        arguments.only or list(CASES),
+        repeat=arguments.repeat,
+        warmup=arguments.warmup,
+    )
+    with open(arguments.output, "w") as file:
+        json.dump(baseline, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+from typing import Tuple
+
+
+class IBusinessCalendar:
+    """Interface for calendars of business days."""
+
+    def dates(self, range_: Tuple[str, str]) -> Tuple[str, ...]:
+        """Get the business days within the period of time delimited by
+        `range_`, including both of its ends, in increasing order.
+
+        Parameters
+        ----------
+        range_
+            dates delimiting the period;
+            each date must be a business day;
+            the first date represents the start of the period and
+            the second date represents the end of the period
+
+        Raises
+        ------
+        ValueError
+            if any date in `range_` is an invalid business day, or
+            if the second date in `range_` is not strictly greater than the
+            first date in `range_`
+
+        Returns
+        -------
+        Tuple[str, ...]
+            business days
+        """
+        raise NotImplementedError
@@ -1,6 +1,8 @@
-from typing import Iterable, TypeVar
+from functools import cached_property
+from typing import Any, Dict, Iterable, Tuple, Type, TypeVar
 
 import numpy as np
+import numpy.typing as npt
 
 from .discount.sequence import DiscountSequence
 from .rate.continuous import ContinuousRate
@@ -9,6 +11,8 @@ from .term.sequence import TermSequence
 from .termed import Termed
 from .termed.sequence import TermedSequence
 
+C = TypeVar("C", bound="Curve")
+
 
 class Curve(TermedSequence[ContinuousRate]):
     """Immutable non-empty sequence of ordered termed continuous rates.
@@ -31,6 +35,11 @@ class Curve(TermedSequence[ContinuousRate]):
         super().__init__(values)
         self._raise_if_is_empty()
 
+    def _slice(self: C, item: slice) -> C:
+        sliced = super()._slice(item)
+        sliced._raise_if_is_empty()
+        return sliced
+
     def _raise_if_is_empty(self) -> None:
         if self.is_empty():
             message = (
@@ -44,15 +53,39 @@ class Curve(TermedSequence[ContinuousRate]):
         """Get the rates of the termed in this sequence."""
         return ContinuousRateSequence(self.values)
 
+    @cached_property
+    def _rates_array(self) -> npt.NDArray[np.float64]:
+        # rates as a read-only array, created once since curves are
+        # immutable
+        array = np.array([float(rate) for rate in self.values], np.float64)
+        array.flags.writeable = False
+        return array
+
+    def _pack_values(self) -> bytes:
+        return self._rates_array.tobytes()
+
+    @classmethod
+    def _unpack(cls: Type[C], terms: bytes, values: Any) -> C:
+        curve = super()._unpack(terms, values)
+        curve.__dict__["_rates_array"] = np.frombuffer(values, np.float64)
+        return curve
+
+    @classmethod
+    def _unpack_values(cls, values: Any) -> Iterable[ContinuousRate]:
+        rates = np.frombuffer(values, np.float64).tolist()
+        return (ContinuousRate(rate) for rate in rates)
+
     def _rates_at(self, terms: TermSequence) -> ContinuousRateSequence:
         return ContinuousRateSequence.from_float(
-            np.interp(
-                np.array(terms, dtype=np.float_),
-                np.array(self.terms, dtype=np.float_),
-                np.array(self.rates, dtype=np.float_),
-            ),
+            self._interpolate(np.array(terms, dtype=np.float_)),
         )
 
+    def _interpolate(
+        self,
+        terms: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        return np.interp(terms, self._terms_array, self._rates_array)
+
 
 S = TypeVar("S", bound="SpotCurve")
 
@@ -112,3 +145,32 @@ class SpotCurve(Curve):
         return self.__class__.from_tuples(
             zip(self.terms, self.rates.add(spread))
         )
+
+
+class SpotCurveInterner:
+    """Interner of spot curves; equal curves (i.e., curves with the same
+    terms and rates) are mapped to a single instance, the first one
+    interned.
+    """
+
+    def __init__(self) -> None:
+        self._curves: Dict[Tuple[bytes, bytes], SpotCurve] = {}
+
+    def intern(self, curve: SpotCurve) -> SpotCurve:
+        """Get the instance of the curves equal to `curve`.
+
+        Parameters
+        ----------
+        curve
+            curve to intern
+
+        Returns
+        -------
+        SpotCurve
+            interned curve
+        """
+        key = curve._terms_array.tobytes(), curve._rates_array.tobytes()
+        return self._curves.setdefault(key, curve)
+
+    def __len__(self) -> int:
+        return len(self._curves)
@@ -0,0 +1,11 @@
+from .caching import CachingDataPointsFetcher
+from .csv import CsvDataPointsFetcher
+from .daily import DailyDataPointsFetcher
+from .sqlite import SqliteDataPointsFetcher
+
+__all__ = [
+    "CachingDataPointsFetcher",
+    "CsvDataPointsFetcher",
+    "DailyDataPointsFetcher",
+    "SqliteDataPointsFetcher",
+]
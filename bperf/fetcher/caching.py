@@ -0,0 +1,253 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Collection, Dict, Iterable, List, Tuple
+
+from ..calendar import IBusinessCalendar
+from ..priced.points.weighted.sequence import WeightedPricedPointsSequence
+from ..priced.points.weighted.table import WeightedPricedPointsTable
+from ..report import IDataPointsFetcher
+from ..utilities.runs import missing_runs
+
+_Key = Tuple[str, str, str]
+
+
+class CachingDataPointsFetcher(IDataPointsFetcher):
+    """Fetcher caching the data points of each period (i.e., each pair of
+    consecutive business days) fetched by another fetcher. Any range is
+    served from the cached periods, and only the missing periods are
+    fetched, by contiguous runs. The least recently used periods are
+    evicted once the cache exceeds its budget.
+
+    Notes
+    -----
+    The size of a period is estimated with its deep size (see
+    :py:meth:`Sequence.deep_sizeof`); objects shared between periods
+    (e.g., spot curves) are accounted for in each period.
+
+    Parameters
+    ----------
+    fetcher: IDataPointsFetcher
+        fetcher of the data points to cache
+    calendar: IBusinessCalendar
+        calendar of the business days delimiting the periods
+    budget: int
+        maximum size in bytes of the cached data points
+
+    Raises
+    ------
+    ValueError
+        if `budget` is negative
+    """
+
+    def __init__(
+        self,
+        fetcher: IDataPointsFetcher,
+        calendar: IBusinessCalendar,
+        budget: int,
+    ):
+        self._fetcher = fetcher
+        self._calendar = calendar
+        self._budget = budget
+        self._raise_if_budget_is_negative()
+        self._cache: "OrderedDict[_Key, WeightedPricedPointsSequence]"
+        self._cache = OrderedDict()
+        self._sizes: Dict[_Key, int] = {}
+        self._lock = Lock()
+
+    def _raise_if_budget_is_negative(self) -> None:
+        if self._budget < 0:
+            message = (
+                f"cannot instantiate {self.__class__.__name__}; "
+                f"budget must be non-negative"
+            )
+            raise ValueError(message)
+
+    @property
+    def size(self) -> int:
+        """Get the size in bytes of the cached data points."""
+        with self._lock:
+            return sum(self._sizes.values())
+
+    def fetch(
+        self,
+        identifier: str,
+        range_: Tuple[str, str],
+    ) -> WeightedPricedPointsTable:
+        """Fetch the data points necessary for computing the performance
+        of `identifier` over the period of time delimited by `range_`.
+
+        Parameters
+        ----------
+        identifier
+            identifier of the entity for which to fetch data points
+        range_
+            dates delimiting the period over which to fetch;
+            each date must be a business day;
+            the first date represents the start of the period and
+            the second date represents the end of the period
+
+        Raises
+        ------
+        ValueError
+            if `identifier` does not exist,
+            if any date in `range_` is an invalid business day, or
+            if the second date in `range_` is not strictly greater than the
+            first date in `range_`
+        RuntimeError
+            if an unexpected error occurs while fetching
+
+        Returns
+        -------
+        WeightedPricedPointsTable
+            fetched data points
+        """
+        dates = self._calendar.dates(range_)
+        self._raise_if_not_increasing(dates)
+        keys = [
+            (identifier, start, end) for start, end in zip(dates, dates[1:])
+        ]
+        found = self._get(keys)
+        for run in missing_runs(keys, found):
+            found.update(self._fetch_run(identifier, run))
+        return WeightedPricedPointsTable._trusted(
+            tuple(found[key] for key in keys)
+        )
+
+    def fetch_many(
+        self,
+        identifiers: Collection[str],
+        range_: Tuple[str, str],
+    ) -> Dict[str, WeightedPricedPointsTable]:
+        """Fetch the data points necessary for computing the performance
+        of each of `identifiers` over the period of time delimited by
+        `range_`.
+
+        Notes
+        -----
+        Identifiers for which no period is cached are fetched at once by
+        the other fetcher (see :py:meth:`IDataPointsFetcher.fetch_many`);
+        the others are served as by :py:meth:`fetch`.
+
+        Parameters
+        ----------
+        identifiers
+            identifiers of the entities for which to fetch data points
+        range_
+            dates delimiting the period over which to fetch;
+            each date must be a business day;
+            the first date represents the start of the period and
+            the second date represents the end of the period
+
+        Raises
+        ------
+        ValueError
+            if any of `identifiers` does not exist,
+            if any date in `range_` is an invalid business day, or
+            if the second date in `range_` is not strictly greater than the
+            first date in `range_`
+        RuntimeError
+            if an unexpected error occurs while fetching
+
+        Returns
+        -------
+        Dict[str, WeightedPricedPointsTable]
+            fetched data points of each identifier
+        """
+        dates = self._calendar.dates(range_)
+        self._raise_if_not_increasing(dates)
+        periods = list(zip(dates, dates[1:]))
+        uncached = [
+            identifier
+            for identifier in dict.fromkeys(identifiers)
+            if not self._get((identifier, start, end) for start, end in periods)
+        ]
+        tables = self._fetcher.fetch_many(uncached, range_) if uncached else {}
+        for identifier, table in tables.items():
+            self._store(
+                [(identifier, start, end) for start, end in periods],
+                table,
+            )
+        for identifier in identifiers:
+            if identifier not in tables:
+                tables[identifier] = self.fetch(identifier, range_)
+        return {identifier: tables[identifier] for identifier in identifiers}
+
+    def _raise_if_not_increasing(self, dates: Tuple[str, ...]) -> None:
+        if len(dates) < 2:
+            message = (
+                f"cannot fetch with {self.__class__.__name__}; "
+                f"range must contain at least one period"
+            )
+            raise ValueError(message)
+
+    def _get(
+        self,
+        keys: Iterable[_Key],
+    ) -> Dict[_Key, WeightedPricedPointsSequence]:
+        found = {}
+        with self._lock:
+            for key in keys:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    found[key] = self._cache[key]
+        return found
+
+    def _fetch_run(
+        self,
+        identifier: str,
+        run: List[_Key],
+    ) -> Dict[_Key, WeightedPricedPointsSequence]:
+        table = self._fetcher.fetch(identifier, (run[0][1], run[-1][2]))
+        return self._store(run, table)
+
+    def _store(
+        self,
+        run: List[_Key],
+        table: WeightedPricedPointsTable,
+    ) -> Dict[_Key, WeightedPricedPointsSequence]:
+        self._raise_if_length_mismatch(table, run)
+        fetched = dict(zip(run, table))
+        sizes = {
+            key: sequence.deep_sizeof() for key, sequence in fetched.items()
+        }
+        with self._lock:
+            for key, sequence in fetched.items():
+                self._put(key, sequence, sizes[key])
+            self._evict()
+        return fetched
+
+    def _raise_if_length_mismatch(
+        self,
+        table: WeightedPricedPointsTable,
+        run: List[_Key],
+    ) -> None:
+        if len(table) != len(run):
+            message = (
+                f"cannot fetch with {self.__class__.__name__}; "
+                f"fetched table doesn't have one sequence per period"
+            )
+            raise RuntimeError(message)
+
+    def _put(
+        self,
+        key: _Key,
+        sequence: WeightedPricedPointsSequence,
+        size: int,
+    ) -> None:
+        if size > self._budget:
+            return
+        self._cache[key] = sequence
+        self._cache.move_to_end(key)
+        self._sizes[key] = size
+
+    def _evict(self) -> None:
+        total = sum(self._sizes.values())
+        while total > self._budget:
+            key, _ = self._cache.popitem(last=False)
+            total -= self._sizes.pop(key)
+
+    def clear(self) -> None:
+        """Remove all the cached data points."""
+        with self._lock:
+            self._cache.clear()
+            self._sizes.clear()
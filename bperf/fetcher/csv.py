@@ -0,0 +1,325 @@
+from itertools import islice
+from pathlib import Path
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from ..calendar import IBusinessCalendar
+from ..priced.points.weighted.assembler import (
+    Array,
+    Rows,
+    WeightedPricedPointsAssembler,
+)
+from ..priced.points.weighted.table import WeightedPricedPointsTable
+from ..report import IDataPointsFetcher
+
+
+class CsvDataPointsFetcher(IDataPointsFetcher):
+    """Fetcher of the data points stored in CSV files within a directory.
+
+    Notes
+    -----
+    The directory holds the following files, which mirror the tables of
+    :py:class:`SqliteDataPointsFetcher`; each file starts with a header
+    naming its columns, in any order, and its values are neither quoted
+    nor contain commas:
+
+    - `positions.csv (identifier, date, security, weight)`
+    - `securities.csv (security, date, curve, spread)`
+    - `flows.csv (security, date, term, cents)`
+    - `curves.csv (curve, date, tenor, rate)`
+
+    Files are streamed in chunks of lines, each parsed column-wise, and
+    only the rows of the requested identifiers and dates are kept; hence,
+    files may be larger than memory. Rows are then grouped by date and by
+    security through sorting, and the tables are created through their
+    columnar representation (see :py:class:`WeightedPricedPointsColumns`),
+    without creating objects per row; spot curves are shared between the
+    tables fetched at once (see :py:meth:`fetch_many`).
+
+    Parameters
+    ----------
+    directory: Union[str, Path]
+        path of the directory holding the files
+    calendar: IBusinessCalendar
+        calendar of the business days delimiting the periods
+    chunk: int, optional
+        number of lines parsed at once, defaults to 65536
+
+    Raises
+    ------
+    ValueError
+        if `chunk` is not strictly positive
+    """
+
+    _FILES = {
+        "positions": ("identifier", "date", "security", "weight"),
+        "securities": ("security", "date", "curve", "spread"),
+        "flows": ("security", "date", "term", "cents"),
+        "curves": ("curve", "date", "tenor", "rate"),
+    }
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        calendar: IBusinessCalendar,
+        *,
+        chunk: int = 65536,
+    ):
+        self._directory = Path(directory)
+        self._calendar = calendar
+        self._chunk = chunk
+        self._raise_if_chunk_is_not_positive()
+
+    def _raise_if_chunk_is_not_positive(self) -> None:
+        if self._chunk < 1:
+            message = (
+                f"cannot instantiate {self.__class__.__name__}; "
+                f"chunk must be strictly positive"
+            )
+            raise ValueError(message)
+
+    def fetch(
+        self,
+        identifier: str,
+        range_: Tuple[str, str],
+    ) -> WeightedPricedPointsTable:
+        """Fetch the data points necessary for computing the performance
+        of `identifier` over the period of time delimited by `range_`.
+
+        Parameters
+        ----------
+        identifier
+            identifier of the entity for which to fetch data points
+        range_
+            dates delimiting the period over which to fetch;
+            each date must be a business day;
+            the first date represents the start of the period and
+            the second date represents the end of the period
+
+        Raises
+        ------
+        ValueError
+            if `identifier` does not exist,
+            if any date in `range_` is an invalid business day, or
+            if the second date in `range_` is not strictly greater than the
+            first date in `range_`
+        RuntimeError
+            if the stored data points are missing or invalid (e.g., cents
+            too large for 64-bit integers)
+        OSError
+            if a file cannot be read
+
+        Returns
+        -------
+        WeightedPricedPointsTable
+            fetched data points
+        """
+        return self.fetch_many([identifier], range_)[identifier]
+
+    def fetch_many(
+        self,
+        identifiers: Collection[str],
+        range_: Tuple[str, str],
+    ) -> Dict[str, WeightedPricedPointsTable]:
+        """Fetch the data points necessary for computing the performance
+        of each of `identifiers` over the period of time delimited by
+        `range_`, in a single pass over each file.
+
+        Parameters
+        ----------
+        identifiers
+            identifiers of the entities for which to fetch data points
+        range_
+            dates delimiting the period over which to fetch;
+            each date must be a business day;
+            the first date represents the start of the period and
+            the second date represents the end of the period
+
+        Raises
+        ------
+        ValueError
+            if any of `identifiers` does not exist,
+            if any date in `range_` is an invalid business day, or
+            if the second date in `range_` is not strictly greater than the
+            first date in `range_`
+        RuntimeError
+            if the stored data points are missing or invalid (e.g., cents
+            too large for 64-bit integers)
+        OSError
+            if a file cannot be read
+
+        Returns
+        -------
+        Dict[str, WeightedPricedPointsTable]
+            fetched data points of each identifier
+        """
+        dates = self._calendar.dates(range_)
+        self._raise_if_no_period(dates)
+        unique = list(dict.fromkeys(identifiers))
+        known: Set[str] = set()
+        positions = self._read(
+            "positions",
+            {"identifier": unique, "date": dates[:-1]},
+            known,
+        )
+        self._raise_if_unknown(unique, known)
+        securities = self._read(
+            "securities",
+            {"security": positions["security"], "date": dates},
+        )
+        flows = self._read(
+            "flows",
+            {"security": positions["security"], "date": dates},
+        )
+        curves = self._read(
+            "curves", {"curve": securities["curve"], "date": dates}
+        )
+        assembler = WeightedPricedPointsAssembler(len(unique), dates)
+        try:
+            tables = dict(
+                zip(
+                    unique,
+                    assembler.assemble(
+                        self._rows("positions", positions, unique, dates),
+                        self._rows("securities", securities, unique, dates),
+                        self._rows("flows", flows, unique, dates),
+                        self._rows("curves", curves, unique, dates),
+                    ),
+                )
+            )
+        except (ValueError, TypeError, OverflowError) as err:
+            raise self._invalid(str(err)) from err
+        return {identifier: tables[identifier] for identifier in identifiers}
+
+    def _read(
+        self,
+        name: str,
+        requested: Dict[str, Collection[str]],
+        known: Optional[Set[str]] = None,
+    ) -> Dict[str, Array]:
+        # rows of the file whose values are requested in every column;
+        # values of the first column found regardless of the other columns
+        # are added to `known`
+        filters = {
+            column: np.unique(np.asarray(values, dtype=str))
+            for column, values in requested.items()
+        }
+        kept: Dict[str, List[Array]] = {
+            column: [] for column in self._FILES[name]
+        }
+        for chunk in self._chunks(name):
+            masks = [
+                np.isin(chunk[column], values)
+                for column, values in filters.items()
+            ]
+            if known is not None:
+                first = next(iter(filters))
+                known.update(np.unique(chunk[first][masks[0]]).tolist())
+            mask = np.logical_and.reduce(masks)
+            for column, values in chunk.items():
+                kept[column].append(values[mask])
+        return {
+            column: np.concatenate(values) if values else np.zeros(0, dtype=str)
+            for column, values in kept.items()
+        }
+
+    def _chunks(self, name: str) -> Iterator[Dict[str, Array]]:
+        columns = self._FILES[name]
+        with open(self._directory / f"{name}.csv", newline="") as file:
+            header = next(file, "").rstrip("\r\n").split(",")
+            self._raise_if_missing_columns(name, header)
+            indices = [header.index(column) for column in columns]
+            while True:
+                lines = list(islice(file, self._chunk))
+                if not lines:
+                    return
+                try:
+                    values = np.loadtxt(
+                        lines,
+                        dtype=str,
+                        delimiter=",",
+                        comments=None,
+                        ndmin=2,
+                    )
+                except ValueError as err:
+                    raise self._invalid(f"{name}.csv is malformed") from err
+                yield {
+                    column: values[:, index]
+                    for column, index in zip(columns, indices)
+                }
+
+    def _rows(
+        self,
+        name: str,
+        read: Dict[str, Array],
+        identifiers: List[str],
+        dates: Tuple[str, ...],
+    ) -> Rows:
+        # columns converted to their types, with identifiers and dates
+        # replaced by their positions
+        first, second, third, fourth = self._FILES[name]
+        if first == "identifier":
+            keys: Any = np.array(identifiers)
+            order = np.argsort(keys)
+            identifier = order[np.searchsorted(keys, read[first], sorter=order)]
+        else:
+            identifier = read[first]
+        types = {
+            "weight": np.int64,
+            "spread": np.float64,
+            "term": np.float64,
+            "cents": np.int64,
+            "tenor": np.float64,
+            "rate": np.float64,
+        }
+        return (
+            identifier,
+            np.searchsorted(np.array(dates), read[second]).astype(np.int64),
+            read[third].astype(types.get(third, str)),
+            read[fourth].astype(types[fourth]),
+        )
+
+    def _raise_if_no_period(self, dates: Tuple[str, ...]) -> None:
+        if len(dates) < 2:
+            message = (
+                f"cannot fetch with {self.__class__.__name__}; "
+                f"range must contain at least one period"
+            )
+            raise ValueError(message)
+
+    def _raise_if_unknown(
+        self,
+        identifiers: List[str],
+        known: Collection[str],
+    ) -> None:
+        unknown = [
+            identifier for identifier in identifiers if identifier not in known
+        ]
+        if unknown:
+            message = (
+                f"cannot fetch with {self.__class__.__name__}; "
+                f"identifier {unknown[0]} does not exist"
+            )
+            raise ValueError(message)
+
+    def _raise_if_missing_columns(self, name: str, header: List[str]) -> None:
+        missing = [
+            column for column in self._FILES[name] if column not in header
+        ]
+        if missing:
+            raise self._invalid(f"{name}.csv is missing column {missing[0]}")
+
+    def _invalid(self, reason: str) -> RuntimeError:
+        message = f"cannot fetch with {self.__class__.__name__}; {reason}"
+        return RuntimeError(message)
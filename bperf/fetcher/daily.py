@@ -0,0 +1,54 @@
+from typing import Tuple
+
+from ..priced.points.weighted.table import WeightedPricedPointsTable
+from ..report import IDataPointsFetcher
+from ..storage.daily import DailyPointsStore
+
+
+class DailyDataPointsFetcher(IDataPointsFetcher):
+    """Fetcher of the data points stored in a :py:class:`DailyPointsStore`.
+    Tables are read from the memory-mapped files of the store without
+    copying, and their sequences are created on first access; the range
+    of a fetch may delimit any stored days.
+
+    Parameters
+    ----------
+    store: DailyPointsStore
+        store from which to fetch
+    """
+
+    def __init__(self, store: DailyPointsStore):
+        self._store = store
+
+    def fetch(
+        self,
+        identifier: str,
+        range_: Tuple[str, str],
+    ) -> WeightedPricedPointsTable:
+        """Fetch the data points necessary for computing the performance
+        of `identifier` over the period of time delimited by `range_`.
+
+        Parameters
+        ----------
+        identifier
+            identifier of the entity for which to fetch data points
+        range_
+            dates delimiting the period over which to fetch;
+            each date must be a stored day;
+            the first date represents the start of the period and
+            the second date represents the end of the period
+
+        Raises
+        ------
+        ValueError
+            if `identifier` does not exist,
+            if any date in `range_` is not a stored day, or
+            if the second date in `range_` is not strictly greater than the
+            first date in `range_`
+
+        Returns
+        -------
+        WeightedPricedPointsTable
+            fetched data points
+        """
+        return self._store.read(identifier, range_)
@@ -0,0 +1,377 @@
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from queue import Empty, SimpleQueue
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from ..calendar import IBusinessCalendar
+from ..priced.points.weighted.assembler import (
+    Rows,
+    WeightedPricedPointsAssembler,
+)
+from ..priced.points.weighted.table import WeightedPricedPointsTable
+from ..report import IDataPointsFetcher
+
+
+class SqliteDataPointsFetcher(IDataPointsFetcher):
+    """Fetcher of the data points stored in a local SQLite database.
+
+    Notes
+    -----
+    The database is made of the following tables, in which dates are
+    business days, and terms and tenors are in years from the date:
+
+    - `positions (identifier, date, security, weight)`: weight in basis
+      points of each security held by each entity on each date; the
+      weights of an entity on a date must sum to 10000
+    - `securities (security, date, curve, spread)`: name of the spot
+      curve, and z-spread, with which each security is priced on each date
+    - `flows (security, date, term, cents)`: cash flows of each security
+      remaining on each date; a security without flows on a date has
+      matured
+    - `curves (curve, date, tenor, rate)`: continuously compounded spot
+      rates of each curve on each date
+
+    The data points of a period (i.e., a pair of consecutive business
+    days) are the positions of the entity on the start of the period,
+    each priced on the start (i.e., initial) and on the end (i.e., final)
+    of the period. The tables are fetched in a few bulk queries, created
+    through their columnar representation (see
+    :py:class:`WeightedPricedPointsColumns`), and their sequences are
+    created on first access; spot curves are shared between the tables
+    fetched at once (see :py:meth:`fetch_many`).
+
+    The fetcher keeps a pool of connections, and is safe to share between
+    threads.
+
+    Parameters
+    ----------
+    path: Union[str, Path]
+        path of the database, created with its tables if it doesn't exist
+    calendar: IBusinessCalendar
+        calendar of the business days delimiting the periods
+
+    Raises
+    ------
+    ValueError
+        if `path` is ":memory:", since each connection would have its own
+        database
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS positions ("
+        "identifier TEXT NOT NULL, "
+        "date TEXT NOT NULL, "
+        "security TEXT NOT NULL, "
+        "weight INTEGER NOT NULL, "
+        "PRIMARY KEY (identifier, date, security)"
+        ") WITHOUT ROWID",
+        "CREATE TABLE IF NOT EXISTS securities ("
+        "security TEXT NOT NULL, "
+        "date TEXT NOT NULL, "
+        "curve TEXT NOT NULL, "
+        "spread REAL NOT NULL, "
+        "PRIMARY KEY (security, date)"
+        ") WITHOUT ROWID",
+        "CREATE TABLE IF NOT EXISTS flows ("
+        "security TEXT NOT NULL, "
+        "date TEXT NOT NULL, "
+        "term REAL NOT NULL, "
+        "cents INTEGER NOT NULL, "
+        "PRIMARY KEY (security, date, term)"
+        ") WITHOUT ROWID",
+        "CREATE TABLE IF NOT EXISTS curves ("
+        "curve TEXT NOT NULL, "
+        "date TEXT NOT NULL, "
+        "tenor REAL NOT NULL, "
+        "rate REAL NOT NULL, "
+        "PRIMARY KEY (curve, date, tenor)"
+        ") WITHOUT ROWID",
+    )
+    _REQUESTED = ("identifiers", "dates", "securities")
+
+    def __init__(self, path: Union[str, Path], calendar: IBusinessCalendar):
+        self._path = str(path)
+        self._raise_if_in_memory()
+        self._calendar = calendar
+        self._pool: "SimpleQueue[sqlite3.Connection]" = SimpleQueue()
+        with self._connection() as connection, connection:
+            for statement in self._SCHEMA:
+                connection.execute(statement)
+
+    def _raise_if_in_memory(self) -> None:
+        if self._path == ":memory:":
+            message = (
+                f"cannot instantiate {self.__class__.__name__}; "
+                f"database must be stored in a file"
+            )
+            raise ValueError(message)
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        try:
+            connection = self._pool.get_nowait()
+        except Empty:
+            connection = self._connect()
+        try:
+            yield connection
+        finally:
+            self._pool.put(connection)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self._path, check_same_thread=False)
+        for name in self._REQUESTED:
+            connection.execute(
+                f"CREATE TEMP TABLE requested_{name} ("
+                f"position INTEGER PRIMARY KEY, value TEXT NOT NULL)"
+            )
+        return connection
+
+    def close(self) -> None:
+        """Close the pooled connections to the database; connections are
+        opened again if the fetcher is used afterwards.
+        """
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except Empty:
+                return
+
+    def fetch(
+        self,
+        identifier: str,
+        range_: Tuple[str, str],
+    ) -> WeightedPricedPointsTable:
+        """Fetch the data points necessary for computing the performance
+        of `identifier` over the period of time delimited by `range_`.
+
+        Parameters
+        ----------
+        identifier
+            identifier of the entity for which to fetch data points
+        range_
+            dates delimiting the period over which to fetch;
+            each date must be a business day;
+            the first date represents the start of the period and
+            the second date represents the end of the period
+
+        Raises
+        ------
+        ValueError
+            if `identifier` does not exist,
+            if any date in `range_` is an invalid business day, or
+            if the second date in `range_` is not strictly greater than the
+            first date in `range_`
+        RuntimeError
+            if the stored data points are missing or invalid (e.g., cents
+            too large for 64-bit integers)
+
+        Returns
+        -------
+        WeightedPricedPointsTable
+            fetched data points
+        """
+        return self.fetch_many([identifier], range_)[identifier]
+
+    def fetch_many(
+        self,
+        identifiers: Collection[str],
+        range_: Tuple[str, str],
+    ) -> Dict[str, WeightedPricedPointsTable]:
+        """Fetch the data points necessary for computing the performance
+        of each of `identifiers` over the period of time delimited by
+        `range_`, in a single pass over the database.
+
+        Parameters
+        ----------
+        identifiers
+            identifiers of the entities for which to fetch data points
+        range_
+            dates delimiting the period over which to fetch;
+            each date must be a business day;
+            the first date represents the start of the period and
+            the second date represents the end of the period
+
+        Raises
+        ------
+        ValueError
+            if any of `identifiers` does not exist,
+            if any date in `range_` is an invalid business day, or
+            if the second date in `range_` is not strictly greater than the
+            first date in `range_`
+        RuntimeError
+            if the stored data points are missing or invalid (e.g., cents
+            too large for 64-bit integers)
+
+        Returns
+        -------
+        Dict[str, WeightedPricedPointsTable]
+            fetched data points of each identifier
+        """
+        dates = self._calendar.dates(range_)
+        self._raise_if_no_period(dates)
+        unique = list(dict.fromkeys(identifiers))
+        # the requests are written within a transaction ended once selected,
+        # so that pooled connections don't keep the database locked
+        try:
+            with self._connection() as connection, connection:
+                rows = _Rows.select(connection, unique, dates)
+        except (ValueError, TypeError, OverflowError) as err:
+            raise self._invalid(str(err)) from err
+        self._raise_if_unknown(unique, rows.known)
+        assembler = WeightedPricedPointsAssembler(len(unique), dates)
+        try:
+            tables = dict(
+                zip(
+                    unique,
+                    assembler.assemble(
+                        rows.positions,
+                        rows.securities,
+                        rows.flows,
+                        rows.curves,
+                    ),
+                )
+            )
+        except (ValueError, TypeError, OverflowError) as err:
+            raise self._invalid(str(err)) from err
+        return {identifier: tables[identifier] for identifier in identifiers}
+
+    def _raise_if_no_period(self, dates: Tuple[str, ...]) -> None:
+        if len(dates) < 2:
+            message = (
+                f"cannot fetch with {self.__class__.__name__}; "
+                f"range must contain at least one period"
+            )
+            raise ValueError(message)
+
+    def _raise_if_unknown(
+        self,
+        identifiers: List[str],
+        known: Collection[str],
+    ) -> None:
+        unknown = [
+            identifier for identifier in identifiers if identifier not in known
+        ]
+        if unknown:
+            message = (
+                f"cannot fetch with {self.__class__.__name__}; "
+                f"identifier {unknown[0]} does not exist"
+            )
+            raise ValueError(message)
+
+    def _invalid(self, reason: str) -> RuntimeError:
+        message = f"cannot fetch with {self.__class__.__name__}; {reason}"
+        return RuntimeError(message)
+
+
+class _Rows:
+    # columns of the rows selected for the requested identifiers and dates,
+    # in which identifiers and dates are replaced by their positions
+    @classmethod
+    def select(
+        cls,
+        connection: sqlite3.Connection,
+        identifiers: List[str],
+        dates: Sequence[str],
+    ) -> "_Rows":
+        cls._request(connection, "identifiers", identifiers)
+        cls._request(connection, "dates", dates)
+        known = {
+            identifier
+            for identifier, in connection.execute(
+                "SELECT value FROM temp.requested_identifiers AS i "
+                "WHERE EXISTS (SELECT 1 FROM positions AS p "
+                "WHERE p.identifier = i.value)"
+            )
+        }
+        positions = cls._columns(
+            connection.execute(
+                "SELECT i.position, d.position, p.security, p.weight "
+                "FROM positions AS p "
+                "JOIN temp.requested_identifiers AS i "
+                "ON p.identifier = i.value "
+                "JOIN temp.requested_dates AS d ON p.date = d.value "
+                "WHERE d.position < ?",
+                (len(dates) - 1,),
+            ),
+            (np.int64, np.int64, str, np.int64),
+        )
+        cls._request(connection, "securities", np.unique(positions[2]))
+        securities = cls._columns(
+            connection.execute(
+                "SELECT s.security, d.position, s.curve, s.spread "
+                "FROM securities AS s "
+                "JOIN temp.requested_securities AS r ON s.security = r.value "
+                "JOIN temp.requested_dates AS d ON s.date = d.value"
+            ),
+            (str, np.int64, str, np.float64),
+        )
+        flows = cls._columns(
+            connection.execute(
+                "SELECT f.security, d.position, f.term, f.cents "
+                "FROM flows AS f "
+                "JOIN temp.requested_securities AS r ON f.security = r.value "
+                "JOIN temp.requested_dates AS d ON f.date = d.value"
+            ),
+            (str, np.int64, np.float64, np.int64),
+        )
+        curves = cls._columns(
+            connection.execute(
+                "SELECT c.curve, d.position, c.tenor, c.rate "
+                "FROM curves AS c "
+                "JOIN temp.requested_dates AS d ON c.date = d.value "
+                "WHERE c.curve IN (SELECT s.curve FROM securities AS s "
+                "JOIN temp.requested_securities AS r "
+                "ON s.security = r.value "
+                "JOIN temp.requested_dates AS e ON s.date = e.value)"
+            ),
+            (str, np.int64, np.float64, np.float64),
+        )
+        return cls(known, positions, securities, flows, curves)
+
+    @staticmethod
+    def _request(
+        connection: sqlite3.Connection,
+        name: str,
+        values: Iterable[str],
+    ) -> None:
+        connection.execute(f"DELETE FROM temp.requested_{name}")
+        connection.executemany(
+            f"INSERT INTO temp.requested_{name} VALUES (?, ?)",
+            enumerate(map(str, values)),
+        )
+
+    @staticmethod
+    def _columns(cursor: sqlite3.Cursor, dtypes: Tuple[Any, ...]) -> Rows:
+        columns = tuple(zip(*cursor.fetchall())) or ((),) * len(dtypes)
+        first, second, third, fourth = (
+            np.array(column, dtype=dtype)
+            for column, dtype in zip(columns, dtypes)
+        )
+        return first, second, third, fourth
+
+    def __init__(
+        self,
+        known: Collection[str],
+        positions: Rows,
+        securities: Rows,
+        flows: Rows,
+        curves: Rows,
+    ):
+        self.known = known
+        self.positions = positions
+        self.securities = securities
+        self.flows = flows
+        self.curves = curves
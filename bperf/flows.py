@@ -1,3 +1,9 @@
+from functools import cached_property
+from typing import Any, Iterable, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
 from .curve import SpotCurve
 from .money import Money
 from .money.sequence import MoneySequence
@@ -16,6 +22,27 @@ class Flows(TermedSequence[Money]):
         """Get the monies of the termed in this sequence."""
         return MoneySequence(self.values)
 
+    @cached_property
+    def _amounts_array(self) -> npt.NDArray[np.float64]:
+        # monies as a read-only array, created once since flows are
+        # immutable
+        array = np.array([float(money) for money in self.values], np.float64)
+        array.flags.writeable = False
+        return array
+
+    def _pack_values(self) -> Union[bytes, Tuple[int, ...]]:
+        cents = [money.scaled for money in self.values]
+        try:
+            return np.array(cents, np.int64).tobytes()
+        except OverflowError:
+            return tuple(cents)
+
+    @classmethod
+    def _unpack_values(cls, values: Any) -> Iterable[Money]:
+        if isinstance(values, bytes):
+            values = np.frombuffer(values, np.int64).tolist()
+        return (Money(cents) for cents in values)
+
     def pv(self, spot: SpotCurve) -> PresentValue:
         """Get the present value of the flows in this sequence by summing
         the discounted value of each flow in this sequence.
@@ -1,14 +1,27 @@
-from typing import Dict
+from concurrent.futures import Executor
+from typing import (
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from ...percent import Percent
 from ...priced.points import PricedPoints
 from ...priced.points.weighted.table import WeightedPricedPointsTable
 from ...rate.periodic import PeriodicRate
+from ...rate.periodic.sequence import PeriodicRateSequence
 from ..generic import (
     ITwoPointsPerformanceCalculator,
     LongitudinalPerformanceCalculator,
 )
 
+R = TypeVar("R")
+
 
 class ITwoPointsEffectCalculator(ITwoPointsPerformanceCalculator):
     """Interface for calculators of single effects (e.g., carry, curve or
@@ -42,16 +55,31 @@ class IEffectsCalculator:
     and spread).
     """
 
-    def calculate(self, table: WeightedPricedPointsTable) -> Dict[str, Percent]:
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Get the names of the effects."""
+        raise NotImplementedError
+
+    def calculate(
+        self,
+        table: WeightedPricedPointsTable,
+        *,
+        outputs: Optional[Collection[str]] = None,
+    ) -> Dict[str, Percent]:
         """Calculate the effects over a period of time.
 
         Parameters
         ----------
         table
             data points to compute the effects from
+        outputs: Optional[Collection[str]], optional
+            names of the effects to calculate (see :py:attr:`names`),
+            defaults to all of them
 
         Raises
         ------
+        ValueError
+            if `outputs` contains unknown names
         OverflowError
             if an overflow occurs while determining the effects
         RuntimeError
@@ -64,6 +92,30 @@ class IEffectsCalculator:
         """
         raise NotImplementedError
 
+    def rates(
+        self,
+        table: WeightedPricedPointsTable,
+    ) -> Dict[str, PeriodicRateSequence]:
+        """Calculate the effects of each period of time (i.e., of each
+        sequence in `table`).
+
+        Parameters
+        ----------
+        table
+            data points to compute the effects from
+
+        Raises
+        ------
+        OverflowError
+            if an overflow occurs while determining the effects
+
+        Returns
+        -------
+        Dict[str, PeriodicRateSequence]
+            effects of each period
+        """
+        raise NotImplementedError
+
 
 class EffectsCalculator(IEffectsCalculator):
     """Calculator of multiple effects (e.g., carry, curve and spread).
@@ -75,6 +127,13 @@ class EffectsCalculator(IEffectsCalculator):
         LongitudinalPerformanceCalculator[ITwoPointsEffectCalculator]
     ]
         calculators of single effect, and their name (i.e., str)
+    executor: Optional[Executor], optional
+        executor on which to calculate the effects concurrently (e.g., a
+        thread pool), defaults to None (i.e., sequentially in the calling
+        thread); effects are returned in the order of `calculators`
+        regardless, and the error of the first failing calculator in that
+        order is raised; calculations mostly hold the GIL, hence a thread
+        pool overlaps little of them on CPython
     """
 
     def __init__(
@@ -83,19 +142,37 @@ class EffectsCalculator(IEffectsCalculator):
             str,
             LongitudinalPerformanceCalculator[ITwoPointsEffectCalculator],
         ],
+        *,
+        executor: Optional[Executor] = None,
     ):
         self._items = tuple(calculators.items())
+        self._executor = executor
 
-    def calculate(self, table: WeightedPricedPointsTable) -> Dict[str, Percent]:
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Get the names of the effects."""
+        return tuple(name for name, _ in self._items)
+
+    def calculate(
+        self,
+        table: WeightedPricedPointsTable,
+        *,
+        outputs: Optional[Collection[str]] = None,
+    ) -> Dict[str, Percent]:
         """Calculate the effects over a period of time.
 
         Parameters
         ----------
         table
             data points to compute the effects from
+        outputs: Optional[Collection[str]], optional
+            names of the effects to calculate (see :py:attr:`names`),
+            defaults to all of them
 
         Raises
         ------
+        ValueError
+            if `outputs` contains unknown names
         OverflowError
             if an overflow occurs while determining the effects
         RuntimeError
@@ -106,9 +183,72 @@ class EffectsCalculator(IEffectsCalculator):
         Dict[str, Percent]
             effects
         """
+        names = self._select(outputs)
+        items = [item for item in self._items if item[0] in names]
+        effects = self._map(
+            lambda calculator: calculator.calculate(table),
+            [calculator for _, calculator in items],
+        )
         return {
-            name: Percent.from_float(
-                calculator.calculate(table),
-            )
-            for name, calculator in self._items
+            name: Percent.from_float(effect)
+            for (name, _), effect in zip(items, effects)
         }
+
+    def _select(self, outputs: Optional[Collection[str]]) -> Collection[str]:
+        if outputs is None:
+            return self.names
+        self._raise_if_contains_unknown_names(outputs)
+        return outputs
+
+    def _raise_if_contains_unknown_names(
+        self,
+        outputs: Collection[str],
+    ) -> None:
+        if not set(outputs).issubset(self.names):
+            message = (
+                f"cannot calculate with {self.__class__.__name__}; "
+                f"outputs must be among the names of the effects"
+            )
+            raise ValueError(message)
+
+    def rates(
+        self,
+        table: WeightedPricedPointsTable,
+    ) -> Dict[str, PeriodicRateSequence]:
+        """Calculate the effects of each period of time (i.e., of each
+        sequence in `table`).
+
+        Parameters
+        ----------
+        table
+            data points to compute the effects from
+
+        Raises
+        ------
+        OverflowError
+            if an overflow occurs while determining the effects
+
+        Returns
+        -------
+        Dict[str, PeriodicRateSequence]
+            effects of each period
+        """
+        rates = self._map(
+            lambda calculator: calculator.rates(table),
+            [calculator for _, calculator in self._items],
+        )
+        return dict(zip(self.names, rates))
+
+    def _map(
+        self,
+        function: Callable[
+            [LongitudinalPerformanceCalculator[ITwoPointsEffectCalculator]],
+            R,
+        ],
+        calculators: Iterable[
+            LongitudinalPerformanceCalculator[ITwoPointsEffectCalculator]
+        ],
+    ) -> List[R]:
+        if self._executor is None:
+            return [function(calculator) for calculator in calculators]
+        return list(self._executor.map(function, calculators))
@@ -1,4 +1,8 @@
+from typing import Optional, Tuple
+
+from ...money import Money
 from ...priced.points import PricedPoints
+from ...priced.priced import PricedFlows
 from ...rate.periodic import PeriodicRate
 from .effect import ITwoPointsEffectCalculator
 
@@ -25,5 +29,42 @@ class TwoPointsSpreadEffectCalculator(ITwoPointsEffectCalculator):
         PeriodicRate
             spread effect
         """
-        final_ = points.initial.update_spread(points.final.spread)
-        return points.initial.price.growth(final_.price)
+        final, payments = self.reprice(points)
+        return points.initial.price.growth(final.price, payments=payments)
+
+    def reprice(self, points: PricedPoints) -> Tuple[PricedFlows, Money]:
+        """Reprice the initial cash flows of `points` at the end of the
+        period of time (i.e., the initial cash flows priced
+        with the final spread).
+
+        Notes
+        -----
+        If the spread is unchanged, the initial cash flows are returned
+        as is, so they need not be repriced.
+
+        Parameters
+        ----------
+        points
+            data points to reprice
+
+        Returns
+        -------
+        Tuple[PricedFlows, Money]
+            repriced cash flows, and payments over the period of time
+        """
+        initial, final = points.initial, points.final
+        if initial.spread == final.spread:
+            return initial, Money(0)  # already priced
+        return initial.update_spread(final.spread), Money(0)
+
+    def reprices_with(self) -> Optional[Tuple[bool, bool, bool]]:
+        """Get which parts of the final cash flows the initial cash flows
+        are repriced with (i.e., the final spread only).
+
+        Returns
+        -------
+        Optional[Tuple[bool, bool, bool]]
+            whether the initial cash flows are repriced with the final
+            flows, with the final spot curve, and with the final spread
+        """
+        return False, False, True
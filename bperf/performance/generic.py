@@ -1,8 +1,14 @@
-from typing import Generic, TypeVar
+from typing import Generic, List, Optional, Tuple, TypeVar
 
+import numpy as np
+
+from ..money import Money
 from ..priced.points import PricedPoints
+from ..priced.points.weighted.holdings import WeightedPricedPointsHoldings
 from ..priced.points.weighted.sequence import WeightedPricedPointsSequence
 from ..priced.points.weighted.table import WeightedPricedPointsTable
+from ..priced.priced import PricedFlows
+from ..priced.sequence import PricedFlowsSequence
 from ..rate.periodic import PeriodicRate
 from ..rate.periodic.sequence import PeriodicRateSequence
 
@@ -35,6 +41,49 @@ class ITwoPointsPerformanceCalculator:
         """
         raise NotImplementedError
 
+    def reprice(self, points: PricedPoints) -> Tuple[PricedFlows, Money]:
+        """Reprice the initial cash flows of `points` at the end of the
+        period of time; the performance is the growth from the price of
+        the initial cash flows to the price of the repriced cash flows
+        plus the payments.
+
+        Parameters
+        ----------
+        points
+            data points to reprice
+
+        Returns
+        -------
+        Tuple[PricedFlows, Money]
+            repriced cash flows, and payments over the period of time
+        """
+        raise NotImplementedError
+
+    def reprices_with(self) -> Optional[Tuple[bool, bool, bool]]:
+        """Get which parts of the final cash flows the initial cash flows
+        are repriced with (see :py:meth:`reprice`), if the performance is
+        the growth from the price of the initial cash flows to the price
+        of the repriced cash flows, plus the payments only if repriced
+        with the final flows; the performance of many data points may then
+        be determined at once with array operations (see
+        :py:class:`HoldingsLongitudinalPerformanceCalculator`).
+
+        Notes
+        -----
+        This method describes :py:meth:`calculate`; hence, a calculator
+        overriding `calculate` must override this method too, otherwise
+        it's deemed not to reprice (see
+        :py:meth:`CrossSectionalPerformanceCalculator.reprices_with`).
+
+        Returns
+        -------
+        Optional[Tuple[bool, bool, bool]]
+            whether the initial cash flows are repriced with the final
+            flows, with the final spot curve, and with the final spread,
+            or None if the performance is not determined as such
+        """
+        return None
+
 
 class CrossSectionalPerformanceCalculator(Generic[T]):
     """Calculator of performance using cross-sectional data to
@@ -50,6 +99,31 @@ class CrossSectionalPerformanceCalculator(Generic[T]):
     def __init__(self, calculator: T):
         self._calculator = calculator
 
+    def reprices_with(self) -> Optional[Tuple[bool, bool, bool]]:
+        """Get which parts of the final cash flows the sub-calculator
+        reprices the initial cash flows with (see
+        :py:meth:`ITwoPointsPerformanceCalculator.reprices_with`); the
+        performance is then the dot product of the rates of growth with
+        the weights.
+
+        Notes
+        -----
+        The parts are only reported if both this calculator and the
+        sub-calculator define `calculate` and `reprices_with` in the same
+        class, so that `reprices_with` describes `calculate` (e.g., a
+        subclass overriding `calculate` only is deemed not to reprice).
+
+        Returns
+        -------
+        Optional[Tuple[bool, bool, bool]]
+            whether the initial cash flows are repriced with the final
+            flows, with the final spot curve, and with the final spread,
+            or None if the performance is not determined as such
+        """
+        if not (_describes(self) and _describes(self._calculator)):
+            return None
+        return self._calculator.reprices_with()
+
     def calculate(self, sequence: WeightedPricedPointsSequence) -> PeriodicRate:
         """Calculate the performance over a period of time using
         cross-sectional data.
@@ -69,6 +143,7 @@ class CrossSectionalPerformanceCalculator(Generic[T]):
         PeriodicRate
             performance
         """
+        sequence.validate()
         rates = PeriodicRateSequence(
             self._calculator.calculate(points) for points in sequence.points
         )
@@ -108,7 +183,223 @@ class LongitudinalPerformanceCalculator(Generic[T]):
         PeriodicRate
             performance
         """
-        rates = PeriodicRateSequence(
+        return self.rates(table).compound()
+
+    def rates(self, table: WeightedPricedPointsTable) -> PeriodicRateSequence:
+        """Calculate the performance of each period of time (i.e., of each
+        sequence) in longitudinal data.
+
+        Parameters
+        ----------
+        table
+            data points to compute the performance from
+
+        Raises
+        ------
+        OverflowError
+            if an overflow occurs while determining the performance
+
+        Returns
+        -------
+        PeriodicRateSequence
+            performance of each period
+        """
+        return PeriodicRateSequence(
             self._calculator.calculate(sequence) for sequence in table
         )
-        return rates.compound()
+
+
+class MatrixCrossSectionalPerformanceCalculator(
+    CrossSectionalPerformanceCalculator[T]
+):
+    """Calculator of performance using cross-sectional data to
+    perform the computation, in which every data point is priced and
+    every rate of growth is determined at once with array operations.
+
+    Notes
+    -----
+    The cash flows of every data point are packed together, and priced
+    in a single vectorized evaluation for each distinct spot curve (see
+    :py:meth:`PricedFlowsSequence.prices`). The sub-calculator must
+    report which parts it reprices with (see :py:meth:`reprices_with`),
+    in which case it must implement `reprice` consistently with
+    `calculate`; otherwise (e.g., if it overrides `calculate` only), the
+    data points are calculated one by one like with
+    :py:class:`CrossSectionalPerformanceCalculator`. Data
+    points are also calculated one by one whenever an overflow occurs so
+    that the same errors are raised.
+
+    Parameters
+    ----------
+    calculator: T
+        sub-calculator of performance using two data points
+        to perform the calculation
+    """
+
+    def reprices_with(self) -> Optional[Tuple[bool, bool, bool]]:
+        """Get which parts of the final cash flows the sub-calculator
+        reprices the initial cash flows with (see
+        :py:meth:`CrossSectionalPerformanceCalculator.reprices_with`),
+        since the performance is determined likewise.
+
+        Returns
+        -------
+        Optional[Tuple[bool, bool, bool]]
+            whether the initial cash flows are repriced with the final
+            flows, with the final spot curve, and with the final spread,
+            or None if the performance is not determined as such
+        """
+        return super().reprices_with()
+
+    def calculate(self, sequence: WeightedPricedPointsSequence) -> PeriodicRate:
+        """Calculate the performance over a period of time using
+        cross-sectional data.
+
+        Parameters
+        ----------
+        sequence
+            data points to compute the performance from
+
+        Raises
+        ------
+        OverflowError
+            if an overflow occurs while determining the performance
+
+        Returns
+        -------
+        PeriodicRate
+            performance
+        """
+        if self.reprices_with() is None:
+            return super().calculate(sequence)
+        sequence.validate()
+        repriced = [
+            self._calculator.reprice(points) for points in sequence.points
+        ]
+        try:
+            return self._calculate(sequence, repriced)
+        except OverflowError:
+            return super().calculate(sequence)
+
+    @staticmethod
+    def _calculate(
+        sequence: WeightedPricedPointsSequence,
+        repriced: List[Tuple[PricedFlows, Money]],
+    ) -> PeriodicRate:
+        count = len(repriced)
+        prices = PricedFlowsSequence._trusted(
+            (
+                *(points.initial for points in sequence.points),
+                *(final for final, _ in repriced),
+            )
+        ).prices()
+        values = np.array(prices, dtype=np.float64)
+        initial, final = values[:count], values[count:]
+        payments = np.array(
+            [float(payments) for _, payments in repriced],
+            dtype=np.float64,
+        )
+        weights = np.array(sequence.percents, dtype=np.float64)
+        with np.errstate(all="ignore"):
+            rate = float(np.dot((final + payments) / initial - 1.0, weights))
+        try:
+            return PeriodicRate(rate)
+        except ValueError:
+            message = (
+                "cannot determine performance for "
+                "MatrixCrossSectionalPerformanceCalculator; "
+                "an overflow occurred"
+            )
+            raise OverflowError(message)
+
+
+class HoldingsLongitudinalPerformanceCalculator(
+    LongitudinalPerformanceCalculator[T]
+):
+    """Calculator of performance using longitudinal data to perform the
+    calculation, in which the data points are laid out by holding, and
+    the performance of every period is determined at once with array
+    operations.
+
+    Notes
+    -----
+    The table is represented by holding (see
+    :py:class:`WeightedPricedPointsHoldings`), and the initial leg of
+    every position is repriced at once with the parts of its final leg
+    the cross-sectional calculator reports (see
+    :py:meth:`CrossSectionalPerformanceCalculator.reprices_with`); the
+    rates of growth are then combined with the weights of each period.
+    If the cross-sectional calculator reports no parts, the periods are
+    calculated one by one like with
+    :py:class:`LongitudinalPerformanceCalculator`. Periods are also
+    calculated one by one whenever an initial price is zero or an
+    overflow occurs so that the same errors are raised.
+
+    Parameters
+    ----------
+    calculator: CrossSectionalPerformanceCalculator[T]
+        sub-calculator of performance using cross-sectional data
+        to perform the calculation
+    """
+
+    def rates(self, table: WeightedPricedPointsTable) -> PeriodicRateSequence:
+        """Calculate the performance of each period of time (i.e., of each
+        sequence) in longitudinal data.
+
+        Parameters
+        ----------
+        table
+            data points to compute the performance from
+
+        Raises
+        ------
+        OverflowError
+            if an overflow occurs while determining the performance
+
+        Returns
+        -------
+        PeriodicRateSequence
+            performance of each period
+        """
+        parts = self._calculator.reprices_with()
+        if parts is None:
+            return super().rates(table)
+        try:
+            holdings = WeightedPricedPointsHoldings.from_table(table)
+        except OverflowError:
+            return super().rates(table)
+        rates = self._rates(holdings, *parts)
+        if rates is None:
+            return super().rates(table)
+        return PeriodicRateSequence(PeriodicRate(rate) for rate in rates)
+
+    @staticmethod
+    def _rates(
+        holdings: WeightedPricedPointsHoldings,
+        flows: bool,
+        spot: bool,
+        spread: bool,
+    ) -> Optional[List[float]]:
+        initial = holdings.prices()
+        final = holdings.prices(flows=flows, spot=spot, spread=spread)
+        arrays = holdings.arrays
+        with np.errstate(all="ignore"):
+            payments = holdings.payments() / 100.0 if flows else 0.0
+            growth = (final + payments) / initial - 1.0
+            rates = np.bincount(
+                arrays["periods"],
+                weights=growth * (arrays["weights"] / 10000.0),
+                minlength=len(holdings),
+            )
+        if np.any(initial == 0.0) or not np.all(np.isfinite(rates)):
+            return None
+        return [float(rate) for rate in rates]
+
+
+def _describes(calculator: object) -> bool:
+    # whether calculate and reprices_with are defined in the same class
+    owners = [
+        next(cls for cls in type(calculator).__mro__ if name in vars(cls))
+        for name in ("calculate", "reprices_with")
+    ]
+    return owners[0] is owners[1]
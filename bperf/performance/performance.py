@@ -1,19 +1,77 @@
-from typing import Dict
+from concurrent.futures import Executor
+from typing import Callable, Collection, Dict, Optional, Tuple, TypeVar
 
 from ..percent import Percent
 from ..priced.points.weighted.table import WeightedPricedPointsTable
+from ..rate.periodic.sequence import PeriodicRateSequence
 from .effect import IEffectsCalculator
 from .residual import IResidualCalculator
 from .total import ITotalPerformanceCalculator
 
+A = TypeVar("A")
+B = TypeVar("B")
+
 
 class IPerformanceCalculator:
     """Interface for calculators of performance."""
 
-    def calculate(self, table: WeightedPricedPointsTable) -> Dict[str, Percent]:
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Get the names of the performance (e.g., total, effects and
+        residual).
+        """
+        raise NotImplementedError
+
+    @property
+    def rate_names(self) -> Tuple[str, ...]:
+        """Get the names of the performance calculated by period (see
+        :py:meth:`rates`).
+        """
+        raise NotImplementedError
+
+    def calculate(
+        self,
+        table: WeightedPricedPointsTable,
+        *,
+        outputs: Optional[Collection[str]] = None,
+    ) -> Dict[str, Percent]:
         """Calculate the performance (i.e., total performance, and effects)
         over a period of time.
 
+        Parameters
+        ----------
+        table
+            data points to compute the performance from
+        outputs: Optional[Collection[str]], optional
+            names of the performance to calculate (see :py:attr:`names`),
+            defaults to all of them; only what's necessary to determine
+            them is calculated (e.g., the residual requires the total
+            performance and every effect)
+
+        Raises
+        ------
+        ValueError
+            if `outputs` contains unknown names
+        OverflowError
+            if an overflow occurs while determining the performance
+        RuntimeError
+            if an unexpected error occurs while rounding the performance
+
+        Returns
+        -------
+        Dict[str, Percent]
+            performance
+        """
+        raise NotImplementedError
+
+    def rates(
+        self,
+        table: WeightedPricedPointsTable,
+    ) -> Dict[str, PeriodicRateSequence]:
+        """Calculate the performance (i.e., total performance, and effects)
+        of each period of time (i.e., of each sequence in `table`). The
+        residual is not calculated by period.
+
         Parameters
         ----------
         table
@@ -23,6 +81,33 @@ class IPerformanceCalculator:
         ------
         OverflowError
             if an overflow occurs while determining the performance
+
+        Returns
+        -------
+        Dict[str, PeriodicRateSequence]
+            performance of each period
+        """
+        raise NotImplementedError
+
+    def compound(
+        self,
+        rates: Dict[str, PeriodicRateSequence],
+    ) -> Dict[str, Percent]:
+        """Calculate the performance (i.e., total performance, effects and
+        residual) over a period of time from the performance of each of its
+        sub-periods (see :py:meth:`rates`).
+
+        Parameters
+        ----------
+        rates
+            performance of each sub-period
+
+        Raises
+        ------
+        KeyError
+            if `rates` is missing the total performance
+        OverflowError
+            if an overflow occurs while determining the performance
         RuntimeError
             if an unexpected error occurs while rounding the performance
 
@@ -45,6 +130,13 @@ class PerformanceCalculator(IPerformanceCalculator):
         sub-calculator of effects
     residual: IResidualCalculator
         sub-calculator of residual
+    executor: Optional[Executor], optional
+        executor on which to calculate the total performance concurrently
+        with the effects (e.g., a thread pool), defaults to None (i.e.,
+        sequentially in the calling thread); the effects are calculated in
+        the calling thread, hence `effects` may share the same executor
+        without risk of deadlock; calculations mostly hold the GIL, hence a
+        thread pool overlaps little of them on CPython
     """
 
     _TOTAL_NAME = "total"
@@ -55,12 +147,38 @@ class PerformanceCalculator(IPerformanceCalculator):
         total: ITotalPerformanceCalculator,
         effects: IEffectsCalculator,
         residual: IResidualCalculator,
+        *,
+        executor: Optional[Executor] = None,
     ):
         self._total = total
         self._effects = effects
         self._residual = residual
+        self._executor = executor
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Get the names of the performance (i.e., total, effects and
+        residual).
+        """
+        return (
+            self._TOTAL_NAME,
+            *self._effects.names,
+            self._RESIDUAL_NAME,
+        )
 
-    def calculate(self, table: WeightedPricedPointsTable) -> Dict[str, Percent]:
+    @property
+    def rate_names(self) -> Tuple[str, ...]:
+        """Get the names of the performance calculated by period (i.e.,
+        total and effects).
+        """
+        return (self._TOTAL_NAME, *self._effects.names)
+
+    def calculate(
+        self,
+        table: WeightedPricedPointsTable,
+        *,
+        outputs: Optional[Collection[str]] = None,
+    ) -> Dict[str, Percent]:
         """Calculate the performance (i.e., total performance, and effects)
         over a period of time.
 
@@ -68,9 +186,16 @@ class PerformanceCalculator(IPerformanceCalculator):
         ----------
         table
             data points to compute the performance from
+        outputs: Optional[Collection[str]], optional
+            names of the performance to calculate (see :py:attr:`names`),
+            defaults to all of them; only what's necessary to determine
+            them is calculated (e.g., the residual requires the total
+            performance and every effect)
 
         Raises
         ------
+        ValueError
+            if `outputs` contains unknown names
         OverflowError
             if an overflow occurs while determining the performance
         RuntimeError
@@ -81,11 +206,141 @@ class PerformanceCalculator(IPerformanceCalculator):
         Dict[str, Percent]
             performance
         """
-        total = self._total.calculate(table)
-        effects = self._effects.calculate(table)
+        if outputs is None:
+            return self._calculate(table)
+        self._raise_if_contains_unknown_names(outputs)
+        if self._RESIDUAL_NAME in outputs:
+            performance = self._calculate(table)
+        else:
+            performance = self._calculate_without_residual(table, outputs)
+        return {
+            name: percent
+            for name, percent in performance.items()
+            if name in outputs
+        }
+
+    def _calculate(
+        self, table: WeightedPricedPointsTable
+    ) -> Dict[str, Percent]:
+        total, effects = self._concurrently(
+            lambda: self._total.calculate(table),
+            lambda: self._effects.calculate(table),
+        )
         residual = self._residual.calculate(total, effects.values())
         return {
             self._TOTAL_NAME: total,
             **effects,
             self._RESIDUAL_NAME: residual,
         }
+
+    def _calculate_without_residual(
+        self,
+        table: WeightedPricedPointsTable,
+        outputs: Collection[str],
+    ) -> Dict[str, Percent]:
+        names = [name for name in self._effects.names if name in outputs]
+        total, effects = self._concurrently(
+            lambda: (
+                {self._TOTAL_NAME: self._total.calculate(table)}
+                if self._TOTAL_NAME in outputs
+                else {}
+            ),
+            lambda: (
+                self._effects.calculate(table, outputs=names) if names else {}
+            ),
+        )
+        return {**total, **effects}
+
+    def _concurrently(
+        self,
+        first: Callable[[], A],
+        second: Callable[[], B],
+    ) -> Tuple[A, B]:
+        if self._executor is None:
+            return first(), second()
+        future = self._executor.submit(first)
+        try:
+            result = second()
+        except BaseException:
+            future.result()  # the error of first takes precedence
+            raise
+        return future.result(), result
+
+    def _raise_if_contains_unknown_names(
+        self,
+        outputs: Collection[str],
+    ) -> None:
+        if not set(outputs).issubset(self.names):
+            message = (
+                f"cannot calculate with {self.__class__.__name__}; "
+                f"outputs must be among the names of the performance"
+            )
+            raise ValueError(message)
+
+    def rates(
+        self,
+        table: WeightedPricedPointsTable,
+    ) -> Dict[str, PeriodicRateSequence]:
+        """Calculate the performance (i.e., total performance, and effects)
+        of each period of time (i.e., of each sequence in `table`). The
+        residual is not calculated by period.
+
+        Parameters
+        ----------
+        table
+            data points to compute the performance from
+
+        Raises
+        ------
+        OverflowError
+            if an overflow occurs while determining the performance
+
+        Returns
+        -------
+        Dict[str, PeriodicRateSequence]
+            performance of each period
+        """
+        total, effects = self._concurrently(
+            lambda: self._total.rates(table),
+            lambda: self._effects.rates(table),
+        )
+        return {self._TOTAL_NAME: total, **effects}
+
+    def compound(
+        self,
+        rates: Dict[str, PeriodicRateSequence],
+    ) -> Dict[str, Percent]:
+        """Calculate the performance (i.e., total performance, effects and
+        residual) over a period of time from the performance of each of its
+        sub-periods (see :py:meth:`rates`).
+
+        Parameters
+        ----------
+        rates
+            performance of each sub-period
+
+        Raises
+        ------
+        KeyError
+            if `rates` is missing the total performance
+        OverflowError
+            if an overflow occurs while determining the performance
+        RuntimeError
+            if an unexpected error occurs while rounding the performance
+
+        Returns
+        -------
+        Dict[str, Percent]
+            performance
+        """
+        compounded = {
+            name: Percent.from_float(rates_.compound())
+            for name, rates_ in rates.items()
+        }
+        total = compounded.pop(self._TOTAL_NAME)
+        residual = self._residual.calculate(total, compounded.values())
+        return {
+            self._TOTAL_NAME: total,
+            **compounded,
+            self._RESIDUAL_NAME: residual,
+        }
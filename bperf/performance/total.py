@@ -1,7 +1,12 @@
+from typing import Optional, Tuple
+
+from ..money import Money
 from ..percent import Percent
 from ..priced.points import PricedPoints
 from ..priced.points.weighted.table import WeightedPricedPointsTable
+from ..priced.priced import PricedFlows
 from ..rate.periodic import PeriodicRate
+from ..rate.periodic.sequence import PeriodicRateSequence
 from .generic import (
     ITwoPointsPerformanceCalculator,
     LongitudinalPerformanceCalculator,
@@ -59,10 +64,44 @@ class TwoPointsTotalPerformanceCalculator(ITwoPointsTotalPerformanceCalculator):
         PeriodicRate
             total performance
         """
-        return points.initial.price.growth(
-            points.final.price,
-            payments=points.payments,
-        )
+        final, payments = self.reprice(points)
+        return points.initial.price.growth(final.price, payments=payments)
+
+    def reprice(self, points: PricedPoints) -> Tuple[PricedFlows, Money]:
+        """Reprice the initial cash flows of `points` at the end of the
+        period of time (i.e., the final cash flows).
+
+        Notes
+        -----
+        If the final cash flows are equal to the initial ones, the initial
+        cash flows are returned, so they need not be priced.
+
+        Parameters
+        ----------
+        points
+            data points to reprice
+
+        Returns
+        -------
+        Tuple[PricedFlows, Money]
+            repriced cash flows, and payments over the period of time
+        """
+        initial, final = points.initial, points.final
+        if initial == final:
+            return initial, Money(0)  # already priced, and nothing was paid
+        return final, points.payments
+
+    def reprices_with(self) -> Optional[Tuple[bool, bool, bool]]:
+        """Get which parts of the final cash flows the initial cash flows
+        are repriced with (i.e., the final flows, spot curve and spread).
+
+        Returns
+        -------
+        Optional[Tuple[bool, bool, bool]]
+            whether the initial cash flows are repriced with the final
+            flows, with the final spot curve, and with the final spread
+        """
+        return True, True, True
 
 
 class ITotalPerformanceCalculator:
@@ -90,6 +129,27 @@ class ITotalPerformanceCalculator:
         """
         raise NotImplementedError
 
+    def rates(self, table: WeightedPricedPointsTable) -> PeriodicRateSequence:
+        """Calculate the total performance of each period of time (i.e.,
+        of each sequence in `table`).
+
+        Parameters
+        ----------
+        table
+            data points to compute the total performance from
+
+        Raises
+        ------
+        OverflowError
+            if an overflow occurs while determining the total performance
+
+        Returns
+        -------
+        PeriodicRateSequence
+            total performance of each period
+        """
+        raise NotImplementedError
+
 
 class TotalPerformanceCalculator(ITotalPerformanceCalculator):
     """Calculator of total performance.
@@ -134,3 +194,24 @@ class TotalPerformanceCalculator(ITotalPerformanceCalculator):
         return Percent.from_float(
             self._calculator.calculate(table),
         )
+
+    def rates(self, table: WeightedPricedPointsTable) -> PeriodicRateSequence:
+        """Calculate the total performance of each period of time (i.e.,
+        of each sequence in `table`).
+
+        Parameters
+        ----------
+        table
+            data points to compute the total performance from
+
+        Raises
+        ------
+        OverflowError
+            if an overflow occurs while determining the total performance
+
+        Returns
+        -------
+        PeriodicRateSequence
+            total performance of each period
+        """
+        return self._calculator.rates(table)
@@ -1,9 +1,12 @@
+from typing import Hashable
+
 from ...money import Money
 from ...pv import PresentValue
+from ...utilities.hash import CachedHash
 from ..priced import PricedFlows
 
 
-class PricedPoints:
+class PricedPoints(CachedHash):
     """Cash flows priced at the beginning and end of a period of time (i.e.,
     cash flows priced at two points in time).
 
@@ -13,6 +16,12 @@ class PricedPoints:
         priced flows at the beginning of the period
     final: PricedFlows
         priced flows at the end of the period
+    deferred: bool, optional
+        whether to defer the validation of `initial`'s price until
+        :py:meth:`validate` is called or `initial` is first accessed,
+        defaults to False; deferring avoids pricing `initial` upon
+        instantiation, and allows validating many priced points at once
+        (see :py:meth:`PricedPointsSequence.validate`)
 
     Raises
     ------
@@ -22,10 +31,33 @@ class PricedPoints:
         if an overflow occurs while getting the price of `initial`
     """
 
-    def __init__(self, initial: PricedFlows, final: PricedFlows):
+    def __init__(
+        self,
+        initial: PricedFlows,
+        final: PricedFlows,
+        *,
+        deferred: bool = False,
+    ):
         self._initial = initial
         self._final = final
-        self._raise_if_initial_price_is_zero()
+        self._validated = False
+        if not deferred:
+            self.validate()
+
+    def validate(self) -> None:
+        """Validate these priced points if not already validated.
+
+        Raises
+        ------
+        ValueError
+            if the price of the initial priced flows is zero
+        OverflowError
+            if an overflow occurs while getting the price of the initial
+            priced flows
+        """
+        if not self._validated:
+            self._raise_if_initial_price_is_zero()
+            self._validated = True
 
     def _raise_if_initial_price_is_zero(self) -> None:
         if self._initial.price == PresentValue(0.0):
@@ -35,9 +67,25 @@ class PricedPoints:
             )
             raise ValueError(message)
 
+    @property
+    def is_validated(self) -> bool:
+        """Whether these priced points were validated."""
+        return self._validated
+
     @property
     def initial(self) -> PricedFlows:
-        """Get the priced flows at the beginning of the period."""
+        """Get the priced flows at the beginning of the period.
+
+        Raises
+        ------
+        ValueError
+            if the validation was deferred, and the price of the initial
+            priced flows is zero
+        OverflowError
+            if the validation was deferred, and an overflow occurs while
+            getting the price of the initial priced flows
+        """
+        self.validate()
         return self._initial
 
     @property
@@ -56,10 +104,5 @@ class PricedPoints:
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}{self}>"
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, self.__class__):
-            return NotImplemented
-        return self._initial == other._initial and self._final == other._final
-
-    def __hash__(self) -> int:
-        return hash((self._initial, self._final))
+    def _key(self) -> Hashable:
+        return (self._initial, self._final)
@@ -4,3 +4,20 @@ from .points import PricedPoints
 
 class PricedPointsSequence(Sequence[PricedPoints]):
     """Immutable sequence of priced points."""
+
+    def validate(self) -> None:
+        """Validate the priced points in this sequence which are not
+        already validated.
+
+        Raises
+        ------
+        ValueError
+            if the price of the initial priced flows of any priced points
+            is zero
+        OverflowError
+            if an overflow occurs while getting the price of the initial
+            priced flows of any priced points
+        """
+        for points in self:
+            if not points.is_validated:
+                points.validate()
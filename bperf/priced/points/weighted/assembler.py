@@ -0,0 +1,239 @@
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from .columns import WeightedPricedPointsColumns
+from .table import WeightedPricedPointsTable
+
+Array = npt.NDArray[Any]
+Rows = Tuple[Array, Array, Array, Array]  # see WeightedPricedPointsAssembler
+
+
+class WeightedPricedPointsAssembler:
+    """Assembler of the tables of several entities (e.g., portfolios) from
+    the rows of their positions, securities, flows and curves, as read by
+    a fetcher or a storage.
+
+    Notes
+    -----
+    Rows are given as columns (i.e., a tuple of four arrays), in which
+    entities and dates are indices in the entities and `dates`:
+
+    * positions: (entity, date, security, weight in basis points), held
+      at the start of each period;
+    * securities: (security, date, curve, spread);
+    * flows: (security, date, term, cents);
+    * curves: (curve, date, tenor, rate).
+
+    Rows are grouped and scattered into a
+    :py:class:`WeightedPricedPointsColumns` with array operations only, and
+    the columns are validated.
+
+    Parameters
+    ----------
+    identifiers: int
+        number of entities
+    dates: Sequence[str]
+        dates delimiting the periods of each entity
+    """
+
+    def __init__(self, identifiers: int, dates: Sequence[str]):
+        self._identifiers = identifiers
+        self._dates = dates
+
+    def assemble(
+        self,
+        positions: Rows,
+        securities: Rows,
+        flows: Rows,
+        curves: Rows,
+    ) -> List[WeightedPricedPointsTable]:
+        """Assemble the table of each entity.
+
+        Parameters
+        ----------
+        positions
+            rows of the positions
+        securities
+            rows of the securities
+        flows
+            rows of the flows
+        curves
+            rows of the curves
+
+        Raises
+        ------
+        ValueError
+            if the rows are invalid (e.g., a held security or its curve is
+            missing on a date, or cents don't fit in 64-bit integers), with
+            the bare reason as message
+
+        Returns
+        -------
+        List[WeightedPricedPointsTable]
+            table of each entity
+        """
+        table = self.columns(positions, securities, flows, curves).table()
+        bounds = range(0, len(table) + 1, len(self._dates) - 1)
+        return [table[start:stop] for start, stop in zip(bounds, bounds[1:])]
+
+    def columns(
+        self,
+        positions: Rows,
+        securities: Rows,
+        flows: Rows,
+        curves: Rows,
+    ) -> WeightedPricedPointsColumns:
+        """Assemble the columns of the tables of all entities, one after
+        the other.
+
+        Parameters
+        ----------
+        positions
+            rows of the positions
+        securities
+            rows of the securities
+        flows
+            rows of the flows
+        curves
+            rows of the curves
+
+        Raises
+        ------
+        ValueError
+            if the rows are invalid (e.g., a held security or its curve is
+            missing on a date, or cents don't fit in 64-bit integers), with
+            the bare reason as message
+
+        Returns
+        -------
+        WeightedPricedPointsColumns
+            columns
+        """
+        dates, periods = len(self._dates), len(self._dates) - 1
+        names, codes = np.unique(
+            np.concatenate((positions[2], securities[0], flows[0])),
+            return_inverse=True,
+        )
+        held, priced, flowing = np.split(
+            codes,
+            np.cumsum((len(positions[2]), len(securities[0]))),
+        )
+        order = np.lexsort((held, positions[1], positions[0]))
+        identifier, date, held = (
+            positions[0][order],
+            positions[1][order],
+            held[order],
+        )
+        counts = np.bincount(
+            identifier * periods + date,
+            minlength=self._identifiers * periods,
+        )
+        keys = np.stack(
+            (held * dates + date, held * dates + date + 1), 1
+        ).ravel()
+        index = self._find(
+            priced * dates + securities[1], keys, names, "security"
+        )
+        spots, arrays = self._curves(
+            securities[2][index],
+            keys % dates,
+            curves,
+        )
+        arrays.update(
+            periods=np.concatenate(([0], np.cumsum(counts))),
+            weights=_integers(positions[3][order], "weights"),
+            spots=spots,
+            spreads=securities[3][index].astype(np.float64),
+            **self._flows(flowing * dates + flows[1], keys, flows),
+        )
+        return WeightedPricedPointsColumns(**arrays, validate=True)
+
+    def _find(
+        self,
+        keys: Array,
+        searched: Array,
+        names: Array,
+        kind: str,
+    ) -> Array:
+        # index of the row of each searched key
+        order = np.argsort(keys, kind="stable")
+        found, hit = _search(keys[order], searched)
+        if not np.all(hit):
+            missing = int(searched[np.argmin(hit)])
+            name, date = divmod(missing, len(self._dates))
+            raise ValueError(
+                f"{kind} {names[name]} is missing on {self._dates[date]}"
+            )
+        return order[found]
+
+    def _curves(
+        self,
+        names: Array,
+        dates: Array,
+        curves: Rows,
+    ) -> Tuple[Array, Dict[str, Array]]:
+        # pool of the curves of each date, and index in the pool of each leg
+        pooled, codes = np.unique(
+            np.concatenate((names, curves[0])),
+            return_inverse=True,
+        )
+        legs, rows = np.split(codes, (len(names),))
+        keys = rows * len(self._dates) + curves[1]
+        order = np.lexsort((curves[2], keys))
+        pool, counts = np.unique(keys[order], return_counts=True)
+        found, hit = _search(pool, legs * len(self._dates) + dates)
+        if not np.all(hit):
+            missing = int(np.argmin(hit))
+            raise ValueError(
+                f"curve {names[missing]} is missing on "
+                f"{self._dates[int(dates[missing])]}"
+            )
+        return found.astype(np.int64), {
+            "curves": np.concatenate(([0], np.cumsum(counts))),
+            "tenors": curves[2][order].astype(np.float64),
+            "rates": curves[3][order].astype(np.float64),
+        }
+
+    @staticmethod
+    def _flows(keys: Array, legs: Array, flows: Rows) -> Dict[str, Array]:
+        # flows of each leg; a leg without flows has matured
+        order = np.lexsort((flows[2], keys))
+        unique, starts, counts = np.unique(
+            keys[order],
+            return_index=True,
+            return_counts=True,
+        )
+        found, hit = _search(unique, legs)
+        found = np.where(hit, found, len(unique))  # matured legs are empty
+        starts, counts = np.append(starts, 0), np.append(counts, 0)
+        lengths = counts[found]
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        index = order[
+            np.arange(offsets[-1])
+            - np.repeat(offsets[:-1] - starts[found], lengths)
+        ]
+        return {
+            "flows": offsets.astype(np.int64),
+            "terms": flows[2][index].astype(np.float64),
+            "cents": _integers(flows[3][index], "cents"),
+        }
+
+
+def _search(keys: Array, searched: Array) -> Tuple[Array, Array]:
+    # index of each searched key within sorted keys, and whether it's found
+    if len(keys) == 0:
+        return np.zeros(len(searched), dtype=np.int64), np.zeros(
+            len(searched), dtype=bool
+        )
+    index = np.minimum(np.searchsorted(keys, searched), len(keys) - 1)
+    return index, keys[index] == searched
+
+
+def _integers(values: Array, name: str) -> Array:
+    # values converted to 64-bit integers
+    try:
+        return values.astype(np.int64)
+    except (TypeError, OverflowError) as err:
+        raise ValueError(f"{name} must fit in 64-bit integers") from err
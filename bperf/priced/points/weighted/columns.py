@@ -0,0 +1,303 @@
+from typing import Any, Dict, List
+
+import numpy as np
+import numpy.typing as npt
+
+from ....percent import Percent
+from ....utilities.sequence import LazyValues
+from ..points import PricedPoints
+from .legs import LEGS_NAMES, _LegsEncoder, _PooledLegs
+from .sequence import WeightedPricedPointsSequence
+from .table import WeightedPricedPointsTable
+from .weighted import WeightedPricedPoints
+
+Array = npt.NDArray[Any]
+
+
+class WeightedPricedPointsColumns(_PooledLegs):
+    """Columnar representation of a :py:class:`WeightedPricedPointsTable`.
+
+    Positions (i.e., weighted priced points) are stored period by period,
+    and each position has two legs (i.e., priced flows), the initial one
+    followed by the final one. Spot curves are stored once in a pool,
+    and referenced by index from the legs.
+
+    Parameters
+    ----------
+    periods: Array
+        offsets of the positions of each period (i.e., the positions of
+        period `i` are `periods[i]:periods[i + 1]`)
+    weights: Array
+        weight of each position in basis points
+    flows: Array
+        offsets of the flows of each leg (i.e., the flows of leg `j`
+        are `flows[j]:flows[j + 1]`; the legs of position `k` are `2 * k`
+        and `2 * k + 1`)
+    spots: Array
+        index in the pool of curves of the spot curve of each leg
+    spreads: Array
+        z-spread of each leg
+    terms: Array
+        term of each flow
+    cents: Array
+        monetary value in cents of each flow
+    curves: Array
+        offsets of the tenors of each curve in the pool (i.e., the tenors
+        of curve `l` are `curves[l]:curves[l + 1]`)
+    tenors: Array
+        tenor of each rate of each curve in the pool
+    rates: Array
+        rate of each tenor of each curve in the pool
+    validate: bool, optional
+        whether to validate the columns, defaults to True; columns must
+        only be left unvalidated if they're known to be valid (e.g., if
+        they were created from a table)
+
+    Raises
+    ------
+    ValueError
+        if `validate` and the columns don't represent a valid table (e.g.,
+        inconsistent offsets, unordered terms, empty curves, or weights
+        not summing to one)
+    """
+
+    NAMES = ("periods", "weights") + LEGS_NAMES
+
+    @classmethod
+    def from_table(
+        cls,
+        table: WeightedPricedPointsTable,
+    ) -> "WeightedPricedPointsColumns":
+        """Create the columnar representation of `table`. Equal spot curves
+        are stored only once.
+
+        Parameters
+        ----------
+        table
+            table to represent
+
+        Raises
+        ------
+        OverflowError
+            if a weight or a flow doesn't fit in a 64-bit integer
+
+        Returns
+        -------
+        WeightedPricedPointsColumns
+            columns
+        """
+        builder = _ColumnsBuilder()
+        for sequence in table:
+            builder.add_sequence(sequence)
+        return cls(**builder.build(), validate=False)
+
+    @classmethod
+    def _trusted(
+        cls, arrays: Dict[str, Array]
+    ) -> "WeightedPricedPointsColumns":
+        # create columns from arrays known to represent a valid table
+        return cls(**arrays, validate=False)
+
+    def __init__(
+        self,
+        *,
+        periods: Array,
+        weights: Array,
+        flows: Array,
+        spots: Array,
+        spreads: Array,
+        terms: Array,
+        cents: Array,
+        curves: Array,
+        tenors: Array,
+        rates: Array,
+        validate: bool = True,
+    ):
+        super().__init__(
+            periods=periods,
+            weights=weights,
+            flows=flows,
+            spots=spots,
+            spreads=spreads,
+            terms=terms,
+            cents=cents,
+            curves=curves,
+            tenors=tenors,
+            rates=rates,
+        )
+        if validate:
+            _ColumnsValidator(self.__class__.__name__, self._arrays).validate()
+
+    def __len__(self) -> int:
+        return len(self._arrays["periods"]) - 1
+
+    def table(self) -> WeightedPricedPointsTable:
+        """Get the table represented by these columns. The sequence of
+        each period is created on first access.
+
+        Returns
+        -------
+        WeightedPricedPointsTable
+            table
+        """
+        return WeightedPricedPointsTable._trusted(
+            LazyValues(len(self), self.sequence),
+        )
+
+    def sequence(self, period: int) -> WeightedPricedPointsSequence:
+        """Get the sequence of weighted priced points of `period`.
+
+        Parameters
+        ----------
+        period
+            index of the period
+
+        Raises
+        ------
+        IndexError
+            if `period` is out of bounds
+
+        Returns
+        -------
+        WeightedPricedPointsSequence
+            sequence
+        """
+        period = range(len(self))[period]
+        periods = self._arrays["periods"]
+        start, stop = int(periods[period]), int(periods[period + 1])
+        weights = self._arrays["weights"][start:stop].tolist()
+        return WeightedPricedPointsSequence._trusted(
+            tuple(
+                WeightedPricedPoints(
+                    Percent(weight),
+                    PricedPoints(
+                        self._leg(2 * position),
+                        self._leg(2 * position + 1),
+                        deferred=True,
+                    ),
+                )
+                for position, weight in zip(range(start, stop), weights)
+            )
+        )
+
+
+class _ColumnsBuilder:
+    def __init__(self) -> None:
+        self._periods: List[int] = [0]
+        self._weights: List[int] = []
+        self._legs = _LegsEncoder()
+
+    # noinspection PyProtectedMember
+    def add_sequence(self, sequence: WeightedPricedPointsSequence) -> None:
+        for value in sequence:
+            # the initial leg is read as is, since points are recreated with
+            # a deferred validation; hence, legs are not priced
+            self._weights.append(value.percent.scaled)
+            self._legs.add(value.points._initial)
+            self._legs.add(value.points.final)
+        self._periods.append(len(self._weights))
+
+    def build(self) -> Dict[str, Array]:
+        return {
+            "periods": np.array(self._periods, dtype=np.int64),
+            "weights": np.array(self._weights, dtype=np.int64),
+            **self._legs.build(),
+        }
+
+
+class _ColumnsValidator:
+    _TARGET = 10000
+    _INTEGERS = ("periods", "weights", "flows", "spots", "cents", "curves")
+    _FLOATS = ("spreads", "terms", "tenors", "rates")
+
+    def __init__(self, name: str, arrays: Dict[str, Array]):
+        self._name = name
+        self._arrays = arrays
+
+    def validate(self) -> None:
+        arrays = self._arrays
+        self._raise_if(
+            any(np.ndim(array) != 1 for array in arrays.values()),
+            "columns must be one-dimensional",
+        )
+        for names, kind, dtype in (
+            (self._INTEGERS, "integers", np.integer),
+            (self._FLOATS, "floating-point numbers", np.floating),
+        ):
+            for name in names:
+                self._raise_if(
+                    not np.issubdtype(arrays[name].dtype, dtype),
+                    f"{name} must be {kind}",
+                )
+        positions = len(arrays["weights"])
+        legs, curves = 2 * positions, len(arrays["curves"]) - 1
+        self._raise_if_invalid_offsets("periods", positions)
+        self._raise_if_invalid_offsets("flows", len(arrays["terms"]))
+        self._raise_if_invalid_offsets("curves", len(arrays["tenors"]))
+        self._raise_if(
+            len(arrays["flows"]) != legs + 1
+            or len(arrays["spots"]) != legs
+            or len(arrays["spreads"]) != legs
+            or len(arrays["cents"]) != len(arrays["terms"])
+            or len(arrays["rates"]) != len(arrays["tenors"]),
+            "columns must have consistent lengths",
+        )
+        self._raise_if(
+            bool(
+                np.any(arrays["spots"] < 0) or np.any(arrays["spots"] >= curves)
+            ),
+            "spots must reference existing curves",
+        )
+        self._raise_if(
+            bool(np.any(np.diff(arrays["curves"]) == 0)),
+            "curves must be non-empty",
+        )
+        for name in ("spreads", "terms", "tenors", "rates"):
+            self._raise_if(
+                not np.all(np.isfinite(arrays[name])),
+                f"{name} must be finite",
+            )
+        for name in ("terms", "tenors"):
+            self._raise_if(
+                bool(np.any(arrays[name] <= 0.0)),
+                f"{name} must be strictly positive",
+            )
+        self._raise_if_not_increasing("terms", "flows")
+        self._raise_if_not_increasing("tenors", "curves")
+        self._raise_if_weights_not_summing_to_one()
+
+    def _raise_if_invalid_offsets(self, name: str, length: int) -> None:
+        offsets = self._arrays[name]
+        self._raise_if(
+            len(offsets) == 0
+            or offsets[0] != 0
+            or offsets[-1] != length
+            or bool(np.any(np.diff(offsets) < 0)),
+            f"{name} must be offsets delimiting the values",
+        )
+
+    def _raise_if_not_increasing(self, name: str, offsets: str) -> None:
+        values, starts = self._arrays[name], self._arrays[offsets]
+        increasing = np.diff(values) > 0.0
+        inner = starts[(starts > 0) & (starts < len(values))]
+        increasing[inner - 1] = True
+        self._raise_if(
+            not np.all(increasing),
+            f"{name} must be strictly increasing within each {offsets[:-1]}",
+        )
+
+    def _raise_if_weights_not_summing_to_one(self) -> None:
+        periods = self._arrays["periods"]
+        starts = periods[:-1][np.diff(periods) > 0]
+        if len(starts) == 0:
+            return
+        sums = np.add.reduceat(self._arrays["weights"], starts)
+        self._raise_if(
+            bool(np.any(sums != self._TARGET)),
+            "sum of weights of each period must sum to one",
+        )
+
+    def _raise_if(self, condition: bool, reason: str) -> None:
+        if condition:
+            message = f"cannot instantiate {self._name}; {reason}"
+            raise ValueError(message)
@@ -0,0 +1,266 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from ....percent import Percent
+from ....utilities.sequence import LazyValues
+from ...priced import PricedFlows
+from ..points import PricedPoints
+from .legs import LEGS_NAMES, _LegsEncoder, _PooledLegs
+from .sequence import WeightedPricedPointsSequence
+from .table import WeightedPricedPointsTable
+from .weighted import WeightedPricedPoints
+
+Array = npt.NDArray[Any]
+
+
+class WeightedPricedPointsDeltas(_PooledLegs):
+    """Representation of a :py:class:`WeightedPricedPointsTable` as the
+    changes of its positions from one period to the next.
+
+    Notes
+    -----
+    Legs (i.e., priced flows) are stored once in a pool, with their spot
+    curves stored once in a pool of curves, and referenced by index; in
+    particular, the final leg of a position is usually the initial leg of
+    that position in the next period. Each period stores only the final
+    leg of each position, which positions of the previous period are
+    continued (i.e., whose final leg is the initial leg of a position),
+    the initial leg of the added positions, and the weights which changed;
+    positions not continued are removed. A period whose positions all
+    continue those of the previous period, in the same order, doesn't
+    store which positions are continued.
+
+    The sequence of each period is reconstructed on demand; weights are
+    reconstructed from the last period for which every weight is stored,
+    hence iterating the table in order is cheapest. Legs are created once,
+    and shared between the periods which reference them.
+
+    Parameters
+    ----------
+    arrays: Array
+        arrays of another representation, by name (see :py:attr:`arrays`);
+        they're not validated, hence a representation must only be created
+        from a table (see :py:meth:`from_table`) or from the arrays of
+        another representation
+    """
+
+    NAMES = (
+        "periods",
+        "finals",
+        "continued",
+        "sources",
+        "added",
+        "initials",
+        "changed",
+        "positions",
+        "weights",
+    ) + LEGS_NAMES
+
+    @classmethod
+    def from_table(
+        cls,
+        table: WeightedPricedPointsTable,
+    ) -> "WeightedPricedPointsDeltas":
+        """Create the representation of `table` as changes between its
+        periods. Equal legs and equal spot curves are stored only once.
+
+        Parameters
+        ----------
+        table
+            table to represent
+
+        Raises
+        ------
+        OverflowError
+            if a weight or a flow doesn't fit in a 64-bit integer
+
+        Returns
+        -------
+        WeightedPricedPointsDeltas
+            changes
+        """
+        builder = _DeltasBuilder()
+        for sequence in table:
+            builder.add_sequence(sequence)
+        return cls(**builder.build())
+
+    def __init__(self, **arrays: Array):
+        super().__init__(**arrays)
+        self._legs = LazyValues(len(self._arrays["spots"]), self._leg)
+        self._last: Optional[Tuple[int, Array]] = None
+
+    def __len__(self) -> int:
+        return len(self._arrays["periods"]) - 1
+
+    def table(self) -> WeightedPricedPointsTable:
+        """Get the table represented by these changes. The sequence of
+        each period is reconstructed on first access.
+
+        Returns
+        -------
+        WeightedPricedPointsTable
+            table
+        """
+        return WeightedPricedPointsTable._trusted(
+            LazyValues(len(self), self.sequence),
+        )
+
+    def sequence(self, period: int) -> WeightedPricedPointsSequence:
+        """Reconstruct the sequence of weighted priced points of `period`.
+
+        Parameters
+        ----------
+        period
+            index of the period
+
+        Raises
+        ------
+        IndexError
+            if `period` is out of bounds
+
+        Returns
+        -------
+        WeightedPricedPointsSequence
+            sequence
+        """
+        period = range(len(self))[period]
+        finals = self._slice("periods", "finals", period).tolist()
+        initials = self._initials(period).tolist()
+        weights = self._weights(period).tolist()
+        return WeightedPricedPointsSequence._trusted(
+            tuple(
+                WeightedPricedPoints(
+                    Percent(weight),
+                    PricedPoints(
+                        self._legs[initial],
+                        self._legs[final],
+                        deferred=True,
+                    ),
+                )
+                for weight, initial, final in zip(weights, initials, finals)
+            )
+        )
+
+    def _slice(self, offsets: str, name: str, period: int) -> Array:
+        bounds = self._arrays[offsets]
+        start, stop = int(bounds[period]), int(bounds[period + 1])
+        return self._arrays[name][start:stop]
+
+    def _sources(self, period: int) -> Array:
+        # position of the previous period continued by each position, or
+        # -1 if it's added
+        sources = self._slice("continued", "sources", period)
+        count = len(self._slice("periods", "finals", period))
+        if len(sources) == 0 and count > 0:
+            return np.arange(count)  # every position is continued
+        return sources
+
+    def _initials(self, period: int) -> Array:
+        sources = self._sources(period)
+        initials = np.empty(len(sources), dtype=np.int64)
+        added = sources < 0
+        initials[added] = self._slice("added", "initials", period)
+        if period > 0:
+            previous = self._slice("periods", "finals", period - 1)
+            initials[~added] = previous[sources[~added]]
+        return initials
+
+    def _weights(self, period: int) -> Array:
+        last = self._last
+        if last is not None and last[0] <= period:
+            start, weights = last
+        else:
+            start, weights = self._keyframe(period), np.zeros(0, dtype=np.int64)
+            weights = self._changed(start, weights)
+        for following in range(start + 1, period + 1):
+            weights = self._changed(following, weights)
+        self._last = (period, weights)
+        return weights
+
+    def _keyframe(self, period: int) -> int:
+        # last period, up to `period`, for which every weight is stored
+        while period > 0:
+            count = len(self._slice("periods", "finals", period))
+            if len(self._slice("changed", "positions", period)) == count:
+                return period
+            period -= 1
+        return 0
+
+    def _changed(self, period: int, previous: Array) -> Array:
+        sources = self._sources(period)
+        weights = np.where(
+            sources >= 0,
+            previous[np.maximum(sources, 0)] if len(previous) else 0,
+            0,
+        )
+        weights[self._slice("changed", "positions", period)] = self._slice(
+            "changed", "weights", period
+        )
+        return weights
+
+
+class _DeltasBuilder:
+    def __init__(self) -> None:
+        self._lists: Dict[str, List[int]] = {
+            name: [0] if name in self._OFFSETS else []
+            for name in WeightedPricedPointsDeltas.NAMES
+            if name not in LEGS_NAMES
+        }
+        self._encoder = _LegsEncoder()
+        self._legs: Dict[PricedFlows, int] = {}
+        self._known: Dict[int, Tuple[PricedFlows, int]] = {}
+        self._previous: List[Tuple[int, int]] = []
+
+    _OFFSETS = ("periods", "continued", "added", "changed")
+
+    # noinspection PyProtectedMember
+    def add_sequence(self, sequence: WeightedPricedPointsSequence) -> None:
+        lists = self._lists
+        continued: Dict[int, List[int]] = {}
+        for position, (final, _) in enumerate(self._previous):
+            continued.setdefault(final, []).append(position)
+        current, sources = [], []
+        for position, value in enumerate(sequence):
+            # the initial leg is read as is, since points are recreated with
+            # a deferred validation; hence, legs are not priced
+            initial = self._leg(value.points._initial)
+            final = self._leg(value.points.final)
+            weight = value.percent.scaled
+            candidates = continued.get(initial)
+            source = candidates.pop(0) if candidates else -1
+            if source < 0:
+                lists["initials"].append(initial)
+            if source < 0 or self._previous[source][1] != weight:
+                lists["positions"].append(position)
+                lists["weights"].append(weight)
+            sources.append(source)
+            current.append((final, weight))
+            lists["finals"].append(final)
+        if sources != list(range(len(self._previous))):
+            lists["sources"].extend(sources)
+        self._previous = current
+        lists["periods"].append(len(lists["finals"]))
+        lists["continued"].append(len(lists["sources"]))
+        lists["added"].append(len(lists["initials"]))
+        lists["changed"].append(len(lists["positions"]))
+
+    def _leg(self, leg: PricedFlows) -> int:
+        known = self._known.get(id(leg))
+        if known is not None:
+            return known[1]
+        index = self._legs.get(leg)
+        if index is None:
+            index = self._legs[leg] = self._encoder.add(leg)
+        self._known[id(leg)] = (leg, index)  # keep leg alive for its id
+        return index
+
+    def build(self) -> Dict[str, Array]:
+        return {
+            **{
+                name: np.array(values, dtype=np.int64)
+                for name, values in self._lists.items()
+            },
+            **self._encoder.build(),
+        }
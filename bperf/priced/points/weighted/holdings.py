@@ -0,0 +1,404 @@
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from ....percent import Percent
+from ....utilities.sequence import LazyValues
+from ...priced import PricedFlows
+from ..points import PricedPoints
+from .legs import LEGS_NAMES, _LegsEncoder, _offsets, _PooledLegs
+from .sequence import WeightedPricedPointsSequence
+from .table import WeightedPricedPointsTable
+from .weighted import WeightedPricedPoints
+
+Array = npt.NDArray[Any]
+
+
+class WeightedPricedPointsHoldings(_PooledLegs):
+    """Representation of a :py:class:`WeightedPricedPointsTable` by
+    holding (i.e., security-major), rather than by period.
+
+    Notes
+    -----
+    A holding is a chain of positions over consecutive periods, in which
+    the initial leg (i.e., priced flows) of each position is the final
+    leg of the previous one; its `k` positions (i.e., rows) are stored
+    contiguously, ordered by period, along with its `k + 1` legs, hence
+    the leg shared by consecutive periods is stored once. Spot curves are
+    stored once in a pool, and referenced by index from the legs.
+
+    Rows are priced at once with array operations (see :py:meth:`prices`)
+    rather than period by period. The spot rates of each leg at the terms
+    of its own flows, and the price of each leg, are determined once and
+    kept; in particular, the price of a leg serves as the final price of
+    a row and as the initial price of the next row of its holding.
+
+    The representation created from a table is kept as long as the table
+    is alive, so it's created once however many calculators use it; the
+    table of a representation is likewise kept as long as it's alive, and
+    represented by that representation.
+
+    Parameters
+    ----------
+    arrays: Array
+        arrays of another representation, by name (see :py:attr:`arrays`);
+        they're not validated, hence a representation must only be created
+        from a table (see :py:meth:`from_table`) or from the arrays of
+        another representation
+    """
+
+    NAMES = (
+        "lengths",
+        "holdings",
+        "periods",
+        "positions",
+        "weights",
+    ) + LEGS_NAMES
+
+    @classmethod
+    def from_table(
+        cls,
+        table: WeightedPricedPointsTable,
+    ) -> "WeightedPricedPointsHoldings":
+        """Create the representation of `table` by holding. Equal spot
+        curves are stored only once.
+
+        Parameters
+        ----------
+        table
+            table to represent
+
+        Raises
+        ------
+        OverflowError
+            if a weight or a flow doesn't fit in a 64-bit integer
+
+        Returns
+        -------
+        WeightedPricedPointsHoldings
+            holdings
+        """
+        kept = _KEPT.get(table)
+        if kept is not None:
+            return kept
+        builder = _HoldingsBuilder()
+        for sequence in table:
+            builder.add_sequence(sequence)
+        holdings = cls(**builder.build())
+        _KEPT.keep(table, holdings)
+        return holdings
+
+    def __init__(self, **arrays: Array):
+        super().__init__(**arrays)
+        self._legs = LazyValues(len(self._arrays["spots"]), self._leg)
+        self._table: Optional["weakref.ref[WeightedPricedPointsTable]"] = None
+        self._kept: Dict[str, Array] = {}
+
+    def __len__(self) -> int:
+        return len(self._arrays["lengths"])
+
+    @property
+    def initials(self) -> Array:
+        """Get the index of the initial leg of each row; the final leg of a
+        row is the following leg.
+        """
+        if "initials" not in self._kept:
+            counts = np.diff(self._arrays["holdings"])
+            self._kept["initials"] = np.arange(
+                len(self._arrays["periods"])
+            ) + np.repeat(np.arange(len(counts)), counts)
+        return self._kept["initials"]
+
+    def table(self) -> WeightedPricedPointsTable:
+        """Get the table represented by these holdings. The sequence of
+        each period is reconstructed on first access.
+
+        Returns
+        -------
+        WeightedPricedPointsTable
+            table
+        """
+        # the table refers to these holdings, hence it's kept weakly
+        table = None if self._table is None else self._table()
+        if table is None:
+            table = WeightedPricedPointsTable._trusted(
+                LazyValues(len(self), self.sequence),
+            )
+            _KEPT.keep(table, self)
+            self._table = weakref.ref(table)
+        return table
+
+    def sequence(self, period: int) -> WeightedPricedPointsSequence:
+        """Reconstruct the sequence of weighted priced points of `period`.
+
+        Parameters
+        ----------
+        period
+            index of the period
+
+        Raises
+        ------
+        IndexError
+            if `period` is out of bounds
+
+        Returns
+        -------
+        WeightedPricedPointsSequence
+            sequence
+        """
+        period = range(len(self))[period]
+        offsets = self._order_offsets()
+        start, stop = int(offsets[period]), int(offsets[period + 1])
+        rows = self._order()[start:stop]
+        initials = self.initials[rows].tolist()
+        weights = self._arrays["weights"][rows].tolist()
+        return WeightedPricedPointsSequence._trusted(
+            tuple(
+                WeightedPricedPoints(
+                    Percent(weight),
+                    PricedPoints(
+                        self._legs[initial],
+                        self._legs[initial + 1],
+                        deferred=True,
+                    ),
+                )
+                for weight, initial in zip(weights, initials)
+            )
+        )
+
+    def _order(self) -> Array:
+        # rows ordered by period, then by position
+        if "order" not in self._kept:
+            self._kept["order"] = np.lexsort(
+                (self._arrays["positions"], self._arrays["periods"])
+            )
+        return self._kept["order"]
+
+    def _order_offsets(self) -> Array:
+        # offsets of the rows of each period in the rows ordered by period
+        offsets = np.zeros(len(self) + 1, dtype=np.int64)
+        np.cumsum(self._arrays["lengths"], out=offsets[1:])
+        return offsets
+
+    def prices(
+        self,
+        *,
+        flows: bool = False,
+        spot: bool = False,
+        spread: bool = False,
+    ) -> Array:
+        """Get the price of the initial leg of each row, in which the flows,
+        the spot curve, and the spread are optionally those of its final
+        leg (e.g., with all of them, the price of the final leg).
+
+        Notes
+        -----
+        Prices aren't checked; an overflow results in a non-finite price.
+
+        Parameters
+        ----------
+        flows: bool, optional
+            whether to price the flows of the final leg, defaults to False
+        spot: bool, optional
+            whether to price with the spot curve of the final leg,
+            defaults to False
+        spread: bool, optional
+            whether to price with the spread of the final leg, defaults to
+            False
+
+        Returns
+        -------
+        Array
+            price of each row
+        """
+        initials = self.initials
+        flows_, spot_, spread_ = (
+            initials + 1 if final else initials
+            for final in (flows, spot, spread)
+        )
+        if flows == spot == spread:
+            return self._leg_prices()[flows_]
+        indices, rows = self._gather(flows_)
+        terms = self._arrays["terms"][indices]
+        if flows == spot:
+            rates = self._leg_rates()[indices]
+        else:
+            rates = self._interpolate(terms, self._arrays["spots"][spot_][rows])
+        return self._price(
+            terms,
+            self._arrays["cents"][indices],
+            rates + self._arrays["spreads"][spread_][rows],
+            rows,
+            len(initials),
+        )
+
+    def payments(self) -> Array:
+        """Get the payments of each row (i.e., the sum of the flows of its
+        initial leg minus the sum of the flows of its final leg).
+
+        Returns
+        -------
+        Array
+            payments of each row in cents
+        """
+        sums = self._leg_sums()
+        payments: Array = sums[self.initials] - sums[self.initials + 1]
+        return payments
+
+    def _leg_sums(self) -> Array:
+        offsets = self._arrays["flows"]
+        cumulative = np.concatenate(([0], np.cumsum(self._arrays["cents"])))
+        sums: Array = cumulative[offsets[1:]] - cumulative[offsets[:-1]]
+        return sums
+
+    def _leg_rates(self) -> Array:
+        # spot rate of each flow along the spot curve of its own leg
+        if "rates" not in self._kept:
+            counts = np.diff(self._arrays["flows"])
+            self._kept["rates"] = self._interpolate(
+                self._arrays["terms"],
+                np.repeat(self._arrays["spots"], counts),
+            )
+        return self._kept["rates"]
+
+    def _leg_prices(self) -> Array:
+        if "prices" not in self._kept:
+            counts = np.diff(self._arrays["flows"])
+            self._kept["prices"] = self._price(
+                self._arrays["terms"],
+                self._arrays["cents"],
+                self._leg_rates() + np.repeat(self._arrays["spreads"], counts),
+                np.repeat(np.arange(len(counts)), counts),
+                len(counts),
+            )
+        return self._kept["prices"]
+
+    def _gather(self, legs: Array) -> Tuple[Array, Array]:
+        # index of each flow of `legs`, and the position in `legs` of its leg
+        offsets = self._arrays["flows"]
+        starts = offsets[legs]
+        counts = offsets[legs + 1] - starts
+        rows = np.repeat(np.arange(len(legs)), counts)
+        firsts = np.cumsum(counts) - counts
+        return np.arange(len(rows)) + (starts - firsts)[rows], rows
+
+    def _interpolate(self, terms: Array, curves: Array) -> Array:
+        # spot rate at each term along its curve, in a single vectorized
+        # evaluation for each distinct curve
+        offsets = self._arrays["curves"]
+        rates = np.empty(len(terms), dtype=np.float64)
+        order = np.argsort(curves, kind="stable")
+        bounds = np.flatnonzero(np.diff(curves[order])) + 1
+        for indices in np.split(order, bounds):
+            if len(indices) == 0:
+                continue
+            curve = int(curves[indices[0]])
+            start, stop = int(offsets[curve]), int(offsets[curve + 1])
+            rates[indices] = np.interp(
+                terms[indices],
+                self._arrays["tenors"][start:stop],
+                self._arrays["rates"][start:stop],
+            )
+        return rates
+
+    @staticmethod
+    def _price(
+        terms: Array,
+        cents: Array,
+        rates: Array,
+        rows: Array,
+        count: int,
+    ) -> Array:
+        # same evaluation as PricedFlowsSequence.prices, from flows in cents
+        with np.errstate(over="ignore", invalid="ignore"):
+            values = cents / 100.0 * np.exp(-rates * terms)
+            return np.bincount(rows, weights=values, minlength=count)
+
+
+class _HoldingsByTable:
+    # holdings kept as long as the table they represent is alive; tables
+    # are keyed by identity, since hashing a table creates its sequences
+    def __init__(self) -> None:
+        self._kept: Dict[
+            int,
+            Tuple[
+                "weakref.ref[WeightedPricedPointsTable]",
+                WeightedPricedPointsHoldings,
+            ],
+        ] = {}
+
+    def get(
+        self,
+        table: WeightedPricedPointsTable,
+    ) -> Optional[WeightedPricedPointsHoldings]:
+        kept = self._kept.get(id(table))
+        if kept is None or kept[0]() is not table:
+            return None
+        return kept[1]
+
+    def keep(
+        self,
+        table: WeightedPricedPointsTable,
+        holdings: WeightedPricedPointsHoldings,
+    ) -> None:
+        key = id(table)
+
+        def forget(reference: "weakref.ref[WeightedPricedPointsTable]") -> None:
+            kept = self._kept.get(key)
+            if kept is not None and kept[0] is reference:
+                del self._kept[key]
+
+        self._kept[key] = (weakref.ref(table, forget), holdings)
+
+    def __len__(self) -> int:
+        return len(self._kept)
+
+
+_KEPT = _HoldingsByTable()
+
+
+class _HoldingsBuilder:
+    def __init__(self) -> None:
+        self._lengths: List[int] = []
+        self._rows: List[List[Tuple[int, int, int]]] = []
+        self._legs: List[List[PricedFlows]] = []
+        self._open: Dict[PricedFlows, List[int]] = {}
+
+    # noinspection PyProtectedMember
+    def add_sequence(self, sequence: WeightedPricedPointsSequence) -> None:
+        period = len(self._lengths)
+        opened: Dict[PricedFlows, List[int]] = {}
+        for position, value in enumerate(sequence):
+            # the initial leg is read as is, since points are recreated with
+            # a deferred validation; hence, legs are not priced
+            initial, final = value.points._initial, value.points.final
+            candidates = self._open.get(initial)
+            if candidates:
+                holding = candidates.pop(0)
+            else:
+                holding = len(self._legs)
+                self._legs.append([initial])
+                self._rows.append([])
+            self._legs[holding].append(final)
+            self._rows[holding].append((period, position, value.percent.scaled))
+            opened.setdefault(final, []).append(holding)
+        self._open = opened
+        self._lengths.append(len(sequence))
+
+    def build(self) -> Dict[str, Array]:
+        rows = [row for holding in self._rows for row in holding]
+        periods, positions, weights = zip(*rows) if rows else ((), (), ())
+        encoder = _LegsEncoder()
+        for holding in self._legs:
+            for leg in holding:
+                encoder.add(leg)
+        return {
+            "lengths": np.array(self._lengths, dtype=np.int64),
+            "holdings": _offsets([len(rows) for rows in self._rows]),
+            "periods": np.array(periods, dtype=np.int64),
+            "positions": np.array(positions, dtype=np.int64),
+            "weights": np.array(weights, dtype=np.int64),
+            **encoder.build(),
+        }
@@ -0,0 +1,155 @@
+from typing import Any, Dict, List, Tuple, Type, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+from ....curve import SpotCurve
+from ....flows import Flows
+from ....money import Money
+from ....rate.continuous import ContinuousRate
+from ....term import Term
+from ....termed import Termed
+from ....utilities.sequence import LazyValues
+from ...priced import PricedFlows
+
+Array = npt.NDArray[Any]
+P = TypeVar("P", bound="_PooledLegs")
+
+# arrays of legs (i.e., priced flows) stored as columns, along with the pool
+# of spot curves they reference by index
+LEGS_NAMES = (
+    "flows",
+    "spots",
+    "spreads",
+    "terms",
+    "cents",
+    "curves",
+    "tenors",
+    "rates",
+)
+
+
+class _PooledLegs:
+    # base of the representations of a table storing its legs as columns
+    # (see LEGS_NAMES), among the arrays named by NAMES; legs and spot
+    # curves are created on access, and spot curves are shared by the legs
+
+    NAMES: Tuple[str, ...] = LEGS_NAMES
+
+    @classmethod
+    def _trusted(cls: Type[P], arrays: Dict[str, Array]) -> P:
+        # create a representation from arrays known to represent a table
+        return cls(**arrays)
+
+    def __init__(self, **arrays: Array):
+        self._arrays = {name: arrays[name] for name in self.NAMES}
+        self._spots = LazyValues(len(self._arrays["curves"]) - 1, self._spot)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # pickled as its arrays only, since legs are created on access
+        return self.__class__._trusted, (self._arrays,)
+
+    @property
+    def arrays(self) -> Dict[str, Array]:
+        """Get the arrays of this representation by name."""
+        return dict(self._arrays)
+
+    @property
+    def nbytes(self) -> int:
+        """Get the size in bytes of the arrays of this representation."""
+        return sum(array.nbytes for array in self._arrays.values())
+
+    def _leg(self, leg: int) -> PricedFlows:
+        offsets = self._arrays["flows"]
+        start, stop = int(offsets[leg]), int(offsets[leg + 1])
+        terms = self._arrays["terms"][start:stop].tolist()
+        cents = self._arrays["cents"][start:stop].tolist()
+        return PricedFlows(
+            Flows._trusted(
+                tuple(
+                    Termed(Term(term), Money(cent))
+                    for term, cent in zip(terms, cents)
+                )
+            ),
+            self._spots[int(self._arrays["spots"][leg])],
+            ContinuousRate(self._arrays["spreads"][leg]),
+        )
+
+    def _spot(self, curve: int) -> SpotCurve:
+        offsets = self._arrays["curves"]
+        start, stop = int(offsets[curve]), int(offsets[curve + 1])
+        tenors = self._arrays["tenors"][start:stop].tolist()
+        rates = self._arrays["rates"][start:stop].tolist()
+        return SpotCurve._trusted(
+            tuple(
+                Termed(Term(tenor), ContinuousRate(rate))
+                for tenor, rate in zip(tenors, rates)
+            )
+        )
+
+
+class _LegsEncoder:
+    # encoder of legs as columns (see LEGS_NAMES); equal spot curves are
+    # stored once in the pool
+    def __init__(self) -> None:
+        self._counts: List[int] = []
+        self._spots: List[int] = []
+        self._spreads: List[float] = []
+        self._terms: List[Array] = []
+        self._cents: List[int] = []
+        self._curves: List[SpotCurve] = []
+        self._pool: Dict[SpotCurve, int] = {}
+        self._known: Dict[int, Tuple[SpotCurve, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._spots)
+
+    # noinspection PyProtectedMember
+    def add(self, leg: PricedFlows) -> int:
+        # add `leg`, and get its index
+        flows = leg.flows
+        self._counts.append(len(flows))
+        self._terms.append(flows._terms_array)
+        self._cents.extend(money.scaled for money in flows.values)
+        self._spots.append(self._curve(leg.spot))
+        self._spreads.append(float(leg.spread))
+        return len(self._spots) - 1
+
+    def _curve(self, spot: SpotCurve) -> int:
+        known = self._known.get(id(spot))
+        if known is not None:
+            return known[1]
+        index = self._pool.setdefault(spot, len(self._pool))
+        if index == len(self._curves):
+            self._curves.append(spot)
+        self._known[id(spot)] = (spot, index)  # keep spot alive for its id
+        return index
+
+    # noinspection PyProtectedMember
+    def build(self) -> Dict[str, Array]:
+        return {
+            "flows": _offsets(self._counts),
+            "spots": np.array(self._spots, dtype=np.int64),
+            "spreads": np.array(self._spreads, dtype=np.float64),
+            "terms": _concatenate(self._terms),
+            "cents": np.array(self._cents, dtype=np.int64),
+            "curves": _offsets([len(curve) for curve in self._curves]),
+            "tenors": _concatenate(
+                [curve._terms_array for curve in self._curves]
+            ),
+            "rates": _concatenate(
+                [curve._rates_array for curve in self._curves]
+            ),
+        }
+
+
+def _offsets(counts: List[int]) -> Array:
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
+
+def _concatenate(arrays: List[Array]) -> Array:
+    if not arrays:
+        return np.zeros(0, dtype=np.float64)
+    return np.concatenate(arrays).astype(np.float64, copy=False)
@@ -1,4 +1,4 @@
-from typing import Iterable
+from typing import Any, Iterable, Tuple, TypeVar
 
 from ....percent import Percent
 from ....percent.sequence import PercentSequence
@@ -6,6 +6,8 @@ from ....utilities.sequence import Sequence
 from ..sequence import PricedPointsSequence
 from .weighted import WeightedPricedPoints
 
+S = TypeVar("S", bound="WeightedPricedPointsSequence")
+
 
 class WeightedPricedPointsSequence(Sequence[WeightedPricedPoints]):
     """Immutable sequence of weighted priced points.
@@ -27,6 +29,13 @@ class WeightedPricedPointsSequence(Sequence[WeightedPricedPoints]):
         super().__init__(values)
         self._raise_if_not_summing_to_one()
 
+    def _slice(self: S, item: slice) -> S:
+        # a slice keeping every value sums to one; others must be validated
+        sliced = super()._slice(item)
+        if len(sliced) != len(self):
+            sliced._raise_if_not_summing_to_one()
+        return sliced
+
     def _raise_if_not_summing_to_one(self) -> None:
         if not self.is_empty() and not self.percents.sums_to(self._TARGET):
             message = (
@@ -35,11 +44,41 @@ class WeightedPricedPointsSequence(Sequence[WeightedPricedPoints]):
             )
             raise ValueError(message)
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # pickled as the columnar representation of a single period, unless
+        # it doesn't fit in it
+        from .columns import WeightedPricedPointsColumns  # circular import
+        from .table import WeightedPricedPointsTable
+
+        try:
+            columns = WeightedPricedPointsColumns.from_table(
+                WeightedPricedPointsTable._trusted((self,)),
+            )
+        except OverflowError:
+            return super().__reduce__()
+        return WeightedPricedPointsColumns.sequence, (columns, 0)
+
     @property
     def percents(self) -> PercentSequence:
         """Get the percent of each weighted priced points in this sequence."""
         return PercentSequence(value.percent for value in self)
 
+    def validate(self) -> None:
+        """Validate the priced points in this sequence which are not
+        already validated, at once (see
+        :py:meth:`PricedPointsSequence.validate`).
+
+        Raises
+        ------
+        ValueError
+            if the price of the initial priced flows of any priced points
+            is zero
+        OverflowError
+            if an overflow occurs while getting the price of the initial
+            priced flows of any priced points
+        """
+        self.points.validate()
+
     @property
     def points(self) -> PricedPointsSequence:
         """Get the priced points of each weighted priced points
@@ -1,6 +1,19 @@
+from typing import Any, Tuple
+
 from ....utilities.sequence import Sequence
 from .sequence import WeightedPricedPointsSequence
 
 
 class WeightedPricedPointsTable(Sequence[WeightedPricedPointsSequence]):
     """Immutable sequence of weighted priced points sequences."""
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # pickled as its columnar representation, unless it doesn't fit in
+        # it; unpickled tables create their sequences on first access
+        from .columns import WeightedPricedPointsColumns  # circular import
+
+        try:
+            columns = WeightedPricedPointsColumns.from_table(self)
+        except OverflowError:
+            return super().__reduce__()
+        return WeightedPricedPointsColumns.table, (columns,)
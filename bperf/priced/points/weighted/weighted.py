@@ -1,8 +1,11 @@
+from typing import Hashable
+
 from ....percent import Percent
+from ....utilities.hash import CachedHash
 from ..points import PricedPoints
 
 
-class WeightedPricedPoints:
+class WeightedPricedPoints(CachedHash):
     """Association of a priced points with a weight.
 
     Parameters
@@ -33,10 +36,5 @@ class WeightedPricedPoints:
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}{self}>"
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, self.__class__):
-            return NotImplemented
-        return self._percent == other._percent and self._points == other._points
-
-    def __hash__(self) -> int:
-        return hash((self._percent, self._points))
+    def _key(self) -> Hashable:
+        return (self._percent, self._points)
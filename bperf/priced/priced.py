@@ -1,14 +1,16 @@
-from typing import TypeVar
+from typing import Hashable, Optional, TypeVar
 
 from ..curve import SpotCurve
 from ..flows import Flows
 from ..pv import PresentValue
 from ..rate.continuous import ContinuousRate
+from ..utilities.hash import CachedHash
+from ..utilities.memory import deep_sizeof
 
 P = TypeVar("P", bound="PricedFlows")
 
 
-class PricedFlows:
+class PricedFlows(CachedHash):
     """Cash flows for which the price is determined.
 
     Parameters
@@ -26,17 +28,21 @@ class PricedFlows:
         self._flows = flows
         self._spot = spot
         self._spread = spread
+        self._price: Optional[PresentValue] = None
 
     @property
     def price(self) -> PresentValue:
-        """Price of the cash flows.
+        """Price of the cash flows. The price is determined on first
+        access, and then kept.
 
         Raises
         ------
         OverflowError
             if an overflow occurred while determining the price
         """
-        return self._flows.pv(self._spot_plus_spread)
+        if self._price is None:
+            self._price = self._flows.pv(self._spot_plus_spread)
+        return self._price
 
     @property
     def _spot_plus_spread(self) -> SpotCurve:
@@ -57,6 +63,17 @@ class PricedFlows:
         """Z-spread used to price the cash flows."""
         return self._spread
 
+    def deep_sizeof(self) -> int:
+        """Get the size in bytes of this priced including the size of
+        every object it references, directly or indirectly.
+
+        Returns
+        -------
+        int
+            size in bytes
+        """
+        return deep_sizeof(self)
+
     def update_flows(self: P, flows: Flows) -> P:
         """Update the cash flows of this priced.
 
@@ -122,14 +139,5 @@ class PricedFlows:
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}{self}>"
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, self.__class__):
-            return NotImplemented
-        return (
-            self._flows == other._flows
-            and self._spot == other._spot
-            and self._spread == other._spread
-        )
-
-    def __hash__(self) -> int:
-        return hash((self._flows, self._spot, self._spread))
+    def _key(self) -> Hashable:
+        return (self._flows, self._spot, self._spread)
@@ -0,0 +1,80 @@
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from ..curve import SpotCurve, SpotCurveInterner
+from ..pv import PresentValue
+from ..pv.sequence import PresentValueSequence
+from ..utilities.sequence import Sequence
+from .priced import PricedFlows
+
+
+class PricedFlowsSequence(Sequence[PricedFlows]):
+    """Immutable sequence of priced flows."""
+
+    def prices(self) -> PresentValueSequence:
+        """Get the price of each priced flows in this sequence.
+
+        Notes
+        -----
+        Equal spot curves are interned, and the discount factors of every
+        cash flow priced with the same spot curve are determined in a
+        single vectorized evaluation. Prices already kept by the priced
+        flows are reused; the prices determined are not kept, since they
+        may differ in the last bits from :py:attr:`PricedFlows.price`.
+
+        Raises
+        ------
+        OverflowError
+            if an overflow occurred while determining a price
+
+        Returns
+        -------
+        PresentValueSequence
+            price of each priced flows
+        """
+        batched: Dict[int, float] = {}
+        for spot, indices in self._group_by_spot().values():
+            batched.update(zip(indices, self._price(spot, indices)))
+        return PresentValueSequence(
+            PresentValue(batched[index]) if index in batched else priced.price
+            for index, priced in enumerate(self)
+        )
+
+    def _group_by_spot(self) -> Dict[int, Tuple[SpotCurve, List[int]]]:
+        interner = SpotCurveInterner()
+        groups: Dict[int, Tuple[SpotCurve, List[int]]] = {}
+        for index, priced in enumerate(self):
+            if priced._price is not None:  # skipcq: PYL-W0212
+                continue
+            spot = interner.intern(priced.spot)
+            groups.setdefault(id(spot), (spot, []))[1].append(index)
+        return groups
+
+    def _price(self, spot: SpotCurve, indices: List[int]) -> List[float]:
+        priced = [self[index] for index in indices]
+        flows = [value.flows for value in priced]
+        lengths = [len(value) for value in flows]
+        terms = np.concatenate([value._terms_array for value in flows])
+        amounts = np.concatenate([value._amounts_array for value in flows])
+        spreads = np.repeat([float(value.spread) for value in priced], lengths)
+        with np.errstate(over="ignore", invalid="ignore"):
+            rates = spot._interpolate(terms) + spreads
+            values = amounts * np.exp(-rates * terms)
+            prices = np.bincount(
+                np.repeat(np.arange(len(priced)), lengths),
+                weights=values,
+                minlength=len(priced),
+            )
+        self._raise_if_is_not_finite(prices)
+        result: List[float] = prices.tolist()
+        return result
+
+    def _raise_if_is_not_finite(self, prices: npt.NDArray[Any]) -> None:
+        if not np.all(np.isfinite(prices)):
+            message = (
+                f"cannot determine prices for {self.__class__.__name__}; "
+                f"an overflow occurred"
+            )
+            raise OverflowError(message)
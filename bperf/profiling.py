@@ -0,0 +1,196 @@
+import cProfile
+import pstats
+import tracemalloc
+from pathlib import Path
+from types import TracebackType
+from typing import Dict, Optional, Tuple, Type
+
+_ROOT = Path(__file__).resolve().parent
+
+
+class Profile:
+    """Profile of a single call aggregated by bperf component (e.g.,
+    curve, flows, priced or performance). Time and memory spent outside
+    of bperf is aggregated under the `external` component.
+
+    Parameters
+    ----------
+    stats: pstats.Stats
+        raw statistics collected by the profiler
+    memory: Dict[str, int]
+        bytes allocated, and still retained, by component
+    peak: int
+        peak of traced memory in bytes over the call
+    """
+
+    EXTERNAL = "external"
+
+    @classmethod
+    def component_of(cls, filename: str) -> str:
+        """Get the bperf component to which `filename` belongs.
+
+        Parameters
+        ----------
+        filename
+            name of the file in which a function is defined
+
+        Returns
+        -------
+        str
+            component (e.g., curve, flows, priced or performance)
+        """
+        try:
+            relative = Path(filename).resolve().relative_to(_ROOT)
+        except (OSError, ValueError):
+            return cls.EXTERNAL
+        return relative.parts[0].removesuffix(".py")
+
+    def __init__(
+        self,
+        stats: pstats.Stats,
+        memory: Dict[str, int],
+        peak: int,
+    ):
+        self._stats = stats
+        self._memory = dict(memory)
+        self._peak = peak
+        self._times, self._calls = self._aggregate(stats)
+
+    def _aggregate(
+        self,
+        stats: pstats.Stats,
+    ) -> Tuple[Dict[str, float], Dict[str, int]]:
+        times: Dict[str, float] = {}
+        calls: Dict[str, int] = {}
+        raw = stats.stats  # type: ignore[attr-defined]
+        for (filename, _, _), (_, count, internal, _, _) in raw.items():
+            component = self.component_of(filename)
+            times[component] = times.get(component, 0.0) + internal
+            calls[component] = calls.get(component, 0) + count
+        return times, calls
+
+    @property
+    def stats(self) -> pstats.Stats:
+        """Get the raw statistics collected by the profiler."""
+        return self._stats
+
+    @property
+    def times(self) -> Dict[str, float]:
+        """Get the internal time in seconds spent by component."""
+        return dict(self._times)
+
+    @property
+    def calls(self) -> Dict[str, int]:
+        """Get the number of function calls by component."""
+        return dict(self._calls)
+
+    @property
+    def memory(self) -> Dict[str, int]:
+        """Get the bytes allocated, and still retained at the end of
+        the call, by component.
+        """
+        return dict(self._memory)
+
+    @property
+    def peak(self) -> int:
+        """Get the peak of traced memory in bytes over the call."""
+        return self._peak
+
+    def __str__(self) -> str:
+        lines = [f"{'component':<16}{'calls':>12}{'time (s)':>12}{'bytes':>14}"]
+        for component in sorted(
+            self._times,
+            key=self._times.__getitem__,
+            reverse=True,
+        ):
+            lines.append(
+                f"{component:<16}"
+                f"{self._calls[component]:>12}"
+                f"{self._times[component]:>12.6f}"
+                f"{self._memory.get(component, 0):>14}"
+            )
+        lines.append(f"peak: {self._peak} bytes")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}(peak={self._peak})>"
+
+
+class Profiler:
+    """Context manager profiling the time and memory spent by the calls
+    performed within its block.
+
+    Notes
+    -----
+    Only the calling thread is profiled. Memory tracing is started only
+    if it isn't already active, and is stopped upon exit only if it
+    was started by this profiler; hence, the profiler can be used within
+    a running process.
+
+    Parameters
+    ----------
+    memory: bool, optional
+        whether to trace memory allocations, defaults to True
+    """
+
+    def __init__(self, *, memory: bool = True):
+        self._trace = memory
+        self._profiler = cProfile.Profile()
+        self._started = False
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._profile: Optional[Profile] = None
+
+    def __enter__(self) -> "Profiler":
+        if self._trace:
+            self._start_tracing()
+        self._profiler.enable()
+        return self
+
+    def _start_tracing(self) -> None:
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+        else:
+            tracemalloc.reset_peak()
+        self._snapshot = tracemalloc.take_snapshot()
+
+    def __exit__(
+        self,
+        type_: Optional[Type[BaseException]],
+        value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._profiler.disable()
+        memory, peak = self._stop_tracing() if self._trace else ({}, 0)
+        self._profile = Profile(pstats.Stats(self._profiler), memory, peak)
+
+    def _stop_tracing(self) -> Tuple[Dict[str, int], int]:
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        if self._started:
+            tracemalloc.stop()
+        memory: Dict[str, int] = {}
+        if self._snapshot is not None:
+            for stat in snapshot.compare_to(self._snapshot, "filename"):
+                component = Profile.component_of(
+                    stat.traceback[0].filename,
+                )
+                memory[component] = memory.get(component, 0) + stat.size_diff
+        return memory, peak
+
+    @property
+    def profile(self) -> Profile:
+        """Get the profile collected by this profiler.
+
+        Raises
+        ------
+        RuntimeError
+            if the profiler has not exited yet
+        """
+        if self._profile is None:
+            message = (
+                f"cannot get profile of {self.__class__.__name__}; "
+                f"profiler has not exited yet"
+            )
+            raise RuntimeError(message)
+        return self._profile
@@ -1,6 +1,9 @@
-from math import prod
+from functools import cached_property
 from typing import Iterable, SupportsFloat, Tuple, TypeVar
 
+import numpy as np
+import numpy.typing as npt
+
 from ...utilities.sequence import Sequence
 from .periodic import PeriodicRate
 
@@ -10,6 +13,14 @@ P = TypeVar("P", bound="PeriodicRateSequence")
 class PeriodicRateSequence(Sequence[PeriodicRate]):
     """Immutable sequence of periodic rates."""
 
+    @cached_property
+    def _rates_array(self) -> npt.NDArray[np.float64]:
+        # rates as a read-only array, created once since sequences are
+        # immutable
+        array = np.array([float(rate) for rate in self], np.float64)
+        array.flags.writeable = False
+        return array
+
     def dot(self, with_: Iterable[SupportsFloat]) -> PeriodicRate:
         """Get the dot product of this sequence with `with_`.
 
@@ -31,7 +42,20 @@ class PeriodicRateSequence(Sequence[PeriodicRate]):
         PeriodicRate
             dot product
         """
-        return self.scale(with_).sum()
+        by = tuple(with_)
+        self._raise_if_length_mismatch_with_by(by)
+        by_ = np.array([float(b) for b in by], np.float64)
+        self._raise_if_by_is_not_finite(by_)
+        with np.errstate(over="ignore", invalid="ignore"):
+            return self._accumulate(self._rates_array * by_)
+
+    def _raise_if_by_is_not_finite(self, by: npt.NDArray[np.float64]) -> None:
+        if not np.all(np.isfinite(by)):
+            message = (
+                f"cannot scale this {self.__class__.__name__}; "
+                f"by must be finite"
+            )
+            raise ValueError(message)
 
     def scale(self: P, by: Iterable[SupportsFloat]) -> P:
         """Scale each rate in this sequence by its corresponding value in
@@ -84,11 +108,34 @@ class PeriodicRateSequence(Sequence[PeriodicRate]):
         PeriodicRate
             sum of the rates in this sequence
         """
-        return sum(self, start=PeriodicRate(0.0))
+        with np.errstate(over="ignore", invalid="ignore"):
+            return self._accumulate(self._rates_array)
+
+    def _accumulate(self, values: npt.NDArray[np.float64]) -> PeriodicRate:
+        # sum sequentially, like the built-in sum, so that an overflow of
+        # any partial sum is detected
+        sums = np.cumsum(values)
+        self._raise_if_overflow(values, sums)
+        return PeriodicRate(sums[-1] if len(sums) else 0.0)
 
-    def compound(self) -> PeriodicRate:
+    def compound(self, *, log: bool = False) -> PeriodicRate:
         """Compound the rates in this sequence.
 
+        Notes
+        -----
+        By default, the growth factors (i.e., one plus each rate) are
+        multiplied sequentially, and an overflow of any partial product is
+        reported. When `log`, the logarithms of the growth factors are
+        summed instead, which only reports an overflow of the compounded
+        rate itself; it's suited to very long sequences, at the cost of a
+        slight loss of precision.
+
+        Parameters
+        ----------
+        log: bool, optional
+            whether to accumulate the growth factors in log-space,
+            defaults to False
+
         Raises
         ------
         OverflowError
@@ -99,11 +146,39 @@ class PeriodicRateSequence(Sequence[PeriodicRate]):
         PeriodicRate
             compounded rate
         """
-        product = prod(
-            self._increment(),
-            start=PeriodicRate(1.0),
+        with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+            if log:
+                return self._compound_in_log_space()
+            factors = self._rates_array + 1.0
+            products = np.cumprod(factors)
+            self._raise_if_overflow(factors, products)
+            return PeriodicRate(products[-1] - 1.0 if len(products) else 0.0)
+
+    def _compound_in_log_space(self) -> PeriodicRate:
+        rates = self._rates_array
+        factors = rates + 1.0
+        self._raise_if_overflow(factors)
+        if np.any(factors == 0.0):
+            return PeriodicRate(-1.0)
+        # log1p is exact for small rates, but only defined for positive
+        # factors; the sign of negative factors is accounted for separately
+        logs = np.where(
+            factors > 0.0,
+            np.log1p(np.maximum(rates, -1.0)),
+            np.log(np.abs(factors)),
         )
-        return product.decrement()  # type: ignore[attr-defined,no-any-return]
-
-    def _increment(self) -> Iterable[PeriodicRate]:
-        return (value.increment() for value in self)
+        total = np.sum(logs)
+        if np.count_nonzero(factors < 0.0) % 2 == 0:
+            compounded = np.expm1(total)
+        else:
+            compounded = -np.exp(total) - 1.0
+        self._raise_if_overflow(np.array([compounded]))
+        return PeriodicRate(compounded)
+
+    def _raise_if_overflow(self, *arrays: npt.NDArray[np.float64]) -> None:
+        if not all(np.all(np.isfinite(array)) for array in arrays):
+            message = (
+                f"cannot perform operation on {self.__class__.__name__}; "
+                f"an overflow occurred"
+            )
+            raise OverflowError(message)
@@ -1,7 +1,29 @@
-from typing import Dict, Tuple
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import (
+    Any,
+    Collection,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
+import numpy as np
+import numpy.typing as npt
+
+from .calendar import IBusinessCalendar
+from .percent import Percent
 from .performance import IPerformanceCalculator
 from .priced.points.weighted.table import WeightedPricedPointsTable
+from .profiling import Profile, Profiler
+from .storage.rates import IRatesStore
+from .utilities.runs import missing_runs
 
 
 class IDataPointsFetcher:
@@ -44,6 +66,166 @@ class IDataPointsFetcher:
         """
         raise NotImplementedError
 
+    def fetch_many(
+        self,
+        identifiers: Collection[str],
+        range_: Tuple[str, str],
+    ) -> Dict[str, WeightedPricedPointsTable]:
+        """Fetch the data points necessary for computing the performance
+        of each of `identifiers` over the period of time delimited by
+        `range_`.
+
+        Notes
+        -----
+        By default, data points are fetched by identifier (see
+        :py:meth:`fetch`); fetchers able to fetch many identifiers at once
+        (e.g., in a single query) should override this method, and may
+        share objects (e.g., spot curves) between the fetched tables.
+
+        Parameters
+        ----------
+        identifiers
+            identifiers of the entities for which to fetch data points
+        range_
+            dates delimiting the period over which to fetch;
+            each date must be a business day;
+            the first date represents the start of the period and
+            the second date represents the end of the period
+
+        Raises
+        ------
+        ValueError
+            if any of `identifiers` does not exist,
+            if any date in `range_` is an invalid business day, or
+            if the second date in `range_` is not strictly greater than the
+            first date in `range_`
+        RuntimeError
+            if an unexpected error occurs while fetching
+
+        Returns
+        -------
+        Dict[str, WeightedPricedPointsTable]
+            fetched data points of each identifier
+        """
+        return {
+            identifier: self.fetch(identifier, range_)
+            for identifier in identifiers
+        }
+
+
+class PerformanceReportTable:
+    """Columnar performance reports of multiple entities over the same
+    period of time, in basis points.
+
+    Parameters
+    ----------
+    identifiers: Sequence[str]
+        identifier of each entity (i.e., each row)
+    names: Sequence[str]
+        name of each performance (i.e., each column)
+    bps: npt.NDArray[np.int64]
+        performance in basis points of each entity (i.e., rows) by name
+        (i.e., columns)
+
+    Raises
+    ------
+    ValueError
+        if the shape of `bps` doesn't match with the lengths of
+        `identifiers` and `names`
+    """
+
+    def __init__(
+        self,
+        identifiers: Sequence[str],
+        names: Sequence[str],
+        bps: npt.NDArray[np.int64],
+    ):
+        self._identifiers = tuple(identifiers)
+        self._names = tuple(names)
+        self._bps = np.array(bps, dtype=np.int64)
+        self._raise_if_shape_mismatches()
+        self._bps.setflags(write=False)
+
+    def _raise_if_shape_mismatches(self) -> None:
+        if self._bps.shape != (len(self._identifiers), len(self._names)):
+            message = (
+                f"cannot instantiate {self.__class__.__name__}; "
+                f"shape of bps must match with identifiers and names"
+            )
+            raise ValueError(message)
+
+    @property
+    def identifiers(self) -> Tuple[str, ...]:
+        """Get the identifier of each entity (i.e., each row)."""
+        return self._identifiers
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Get the name of each performance (i.e., each column)."""
+        return self._names
+
+    @property
+    def bps(self) -> npt.NDArray[np.int64]:
+        """Get the performance in basis points of each entity by name
+        (read-only).
+        """
+        return self._bps
+
+    def __len__(self) -> int:
+        return len(self._identifiers)
+
+    def column(self, name: str) -> npt.NDArray[np.int64]:
+        """Get the performance named `name` of each entity in basis points.
+
+        Parameters
+        ----------
+        name
+            name of the performance
+
+        Raises
+        ------
+        KeyError
+            if `name` is not a name of this table
+
+        Returns
+        -------
+        npt.NDArray[np.int64]
+            performance of each entity (read-only)
+        """
+        try:
+            index = self._names.index(name)
+        except ValueError:
+            raise KeyError(name) from None
+        return self._bps[:, index]
+
+    def records(self) -> npt.NDArray[Any]:
+        """Get a structured record per entity, with an `identifier` field
+        followed by one 64-bit integer field per name.
+
+        Returns
+        -------
+        npt.NDArray[Any]
+            records
+        """
+        width = max(
+            (len(identifier) for identifier in self._identifiers), default=1
+        )
+        dtype = np.dtype(
+            [("identifier", f"U{width}")]
+            + [(name, np.int64) for name in self._names]
+        )
+        records = np.empty(len(self), dtype=dtype)
+        records["identifier"] = self._identifiers
+        for index, name in enumerate(self._names):
+            records[name] = self._bps[:, index]
+        return records
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}"
+            f"(identifiers={len(self._identifiers)}, names={self._names})>"
+        )
+
 
 class PerformanceReportGenerator:
     """Generator of performance report (incl. attribution by effects).
@@ -64,6 +246,441 @@ class PerformanceReportGenerator:
         self._fetcher = fetcher
         self._calculator = calculator
 
+    def generate(
+        self,
+        identifier: str,
+        range_: Tuple[str, str],
+        *,
+        outputs: Optional[Collection[str]] = None,
+    ) -> Dict[str, str]:
+        """Generate a performance report for `identifier` over the period
+        of time delimited by `range_`.
+
+        Parameters
+        ----------
+        identifier
+            identifier of the entity for which to generate a performance report
+        range_
+            dates delimiting the period over which to compute the performance;
+            each date must be a business day;
+            the first date represents the start of the period and
+            the second date represents the end of the period
+        outputs: Optional[Collection[str]], optional
+            names of the performance to report (see
+            :py:attr:`IPerformanceCalculator.names`), defaults to all of them
+
+        Raises
+        ------
+        ValueError
+            if `identifier` does not exist,
+            if any date in `range_` is an invalid business day,
+            if the second date in `range_` is not strictly greater than the
+            first date in `range_`, or
+            if `outputs` contains unknown names
+        OverflowError
+            if an overflow occurs while determining the performance
+        RuntimeError
+            if an unexpected error occurs while generating the performance
+            report
+
+        Returns
+        -------
+        Dict[str, str]
+            performance report
+        """
+        table = self._fetcher.fetch(identifier, range_)
+        performance = self._calculate(table, outputs)
+        return {name: str(percent) for name, percent in performance.items()}
+
+    def generate_bps(
+        self,
+        identifier: str,
+        range_: Tuple[str, str],
+        *,
+        outputs: Optional[Collection[str]] = None,
+    ) -> Dict[str, int]:
+        """Generate a performance report for `identifier` over the period
+        of time delimited by `range_`, in basis points.
+
+        Notes
+        -----
+        Same as :py:meth:`generate`, but each performance is reported as
+        an integer number of basis points (e.g., 2512 <=> 25.12%) rather
+        than as a string, hence avoiding its formatting and parsing.
+
+        Parameters
+        ----------
+        identifier
+            identifier of the entity for which to generate a performance report
+        range_
+            dates delimiting the period over which to compute the performance;
+            each date must be a business day;
+            the first date represents the start of the period and
+            the second date represents the end of the period
+        outputs: Optional[Collection[str]], optional
+            names of the performance to report (see
+            :py:attr:`IPerformanceCalculator.names`), defaults to all of them
+
+        Raises
+        ------
+        ValueError
+            if `identifier` does not exist,
+            if any date in `range_` is an invalid business day,
+            if the second date in `range_` is not strictly greater than the
+            first date in `range_`, or
+            if `outputs` contains unknown names
+        OverflowError
+            if an overflow occurs while determining the performance
+        RuntimeError
+            if an unexpected error occurs while generating the performance
+            report
+
+        Returns
+        -------
+        Dict[str, int]
+            performance report in basis points
+        """
+        table = self._fetcher.fetch(identifier, range_)
+        performance = self._calculate(table, outputs)
+        return {name: percent.scaled for name, percent in performance.items()}
+
+    def generate_table(
+        self,
+        identifiers: Sequence[str],
+        range_: Tuple[str, str],
+        *,
+        outputs: Optional[Collection[str]] = None,
+        prefetch: int = 0,
+        batch: int = 1,
+    ) -> PerformanceReportTable:
+        """Generate the performance reports of each of `identifiers` over
+        the period of time delimited by `range_`, as a columnar table in
+        basis points.
+
+        Parameters
+        ----------
+        identifiers
+            identifiers of the entities for which to generate a performance
+            report
+        range_
+            dates delimiting the period over which to compute the performance;
+            each date must be a business day;
+            the first date represents the start of the period and
+            the second date represents the end of the period
+        outputs: Optional[Collection[str]], optional
+            names of the performance to report (see
+            :py:attr:`IPerformanceCalculator.names`), defaults to all of them
+        prefetch: int, optional
+            number of upcoming batches of identifiers for which to fetch
+            data points in the background while calculating the performance
+            (see :py:meth:`generate_many`), defaults to 0 (i.e., no prefetch)
+        batch: int, optional
+            number of identifiers for which to fetch data points at once
+            (see :py:meth:`IDataPointsFetcher.fetch_many`), defaults to 1
+
+        Raises
+        ------
+        ValueError
+            if `prefetch` is negative,
+            if `batch` is not strictly positive,
+            if any of `identifiers` does not exist,
+            if any date in `range_` is an invalid business day,
+            if the second date in `range_` is not strictly greater than the
+            first date in `range_`, or
+            if `outputs` contains unknown names
+        OverflowError
+            if an overflow occurs while determining the performance
+        RuntimeError
+            if an unexpected error occurs while generating the performance
+            reports
+
+        Returns
+        -------
+        PerformanceReportTable
+            performance reports, with a row per identifier and a column
+            per performance; by default, the columns are the performance
+            reported for the first identifier (i.e., none if there are no
+            identifiers)
+        """
+        names = None if outputs is None else self._select(outputs)
+        rows: List[List[int]] = []
+        fetched = self._fetch_many(identifiers, range_, prefetch, batch)
+        for _, table in fetched:
+            performance = self._calculate(table, outputs)
+            if names is None:
+                names = tuple(performance)
+            rows.append([performance[name].scaled for name in names])
+        names = () if names is None else names
+        bps = np.array(rows, dtype=np.int64).reshape(len(rows), len(names))
+        return PerformanceReportTable(identifiers, names, bps)
+
+    def _calculate(
+        self,
+        table: WeightedPricedPointsTable,
+        outputs: Optional[Collection[str]],
+    ) -> Dict[str, Percent]:
+        # outputs are passed only when requested, so that calculators
+        # implementing calculate(table) keep working
+        if outputs is None:
+            return self._calculator.calculate(table)
+        return self._calculator.calculate(table, outputs=outputs)
+
+    def _select(self, outputs: Collection[str]) -> Tuple[str, ...]:
+        names = self._calculator.names
+        if not set(outputs).issubset(names):
+            message = (
+                f"cannot generate with {self.__class__.__name__}; "
+                f"outputs must be among the names of the calculator"
+            )
+            raise ValueError(message)
+        return tuple(name for name in names if name in outputs)
+
+    def generate_many(
+        self,
+        identifiers: Iterable[str],
+        range_: Tuple[str, str],
+        *,
+        outputs: Optional[Collection[str]] = None,
+        prefetch: int = 2,
+        batch: int = 1,
+    ) -> Iterator[Tuple[str, Dict[str, str]]]:
+        """Generate the performance report of each of `identifiers` over
+        the period of time delimited by `range_`, fetching the data points
+        of upcoming identifiers while calculating the performance of the
+        current one.
+
+        Notes
+        -----
+        Data points are fetched by batches of `batch` identifiers (see
+        :py:meth:`IDataPointsFetcher.fetch_many`), by a pool of `prefetch`
+        threads, at most `prefetch` batches ahead of the report being
+        generated; hence, at most `(prefetch + 1) * batch` tables are held
+        in memory at once. Reports are generated lazily, in the order of
+        `identifiers`, and errors are raised upon reaching the batch they
+        relate to. The fetcher must support being called from multiple
+        threads.
+
+        Parameters
+        ----------
+        identifiers
+            identifiers of the entities for which to generate a performance
+            report
+        range_
+            dates delimiting the period over which to compute the performance;
+            each date must be a business day;
+            the first date represents the start of the period and
+            the second date represents the end of the period
+        outputs: Optional[Collection[str]], optional
+            names of the performance to report (see
+            :py:attr:`IPerformanceCalculator.names`), defaults to all of them
+        prefetch: int, optional
+            number of upcoming batches of identifiers for which to fetch
+            data points in the background, defaults to 2; 0 fetches the
+            data points of each batch just before calculating the
+            performance of its identifiers
+        batch: int, optional
+            number of identifiers for which to fetch data points at once,
+            defaults to 1
+
+        Raises
+        ------
+        ValueError
+            if `prefetch` is negative,
+            if `batch` is not strictly positive,
+            if any of `identifiers` does not exist,
+            if any date in `range_` is an invalid business day,
+            if the second date in `range_` is not strictly greater than the
+            first date in `range_`, or
+            if `outputs` contains unknown names
+        OverflowError
+            if an overflow occurs while determining the performance
+        RuntimeError
+            if an unexpected error occurs while generating the performance
+            reports
+
+        Returns
+        -------
+        Iterator[Tuple[str, Dict[str, str]]]
+            identifier, and its performance report
+        """
+        self._raise_if_invalid_pipeline(prefetch, batch)
+        return self._generate_many(
+            identifiers,
+            range_,
+            outputs,
+            prefetch,
+            batch,
+        )
+
+    def _generate_many(
+        self,
+        identifiers: Iterable[str],
+        range_: Tuple[str, str],
+        outputs: Optional[Collection[str]],
+        prefetch: int,
+        batch: int,
+    ) -> Iterator[Tuple[str, Dict[str, str]]]:
+        for identifier, table in self._fetch_many(
+            identifiers,
+            range_,
+            prefetch,
+            batch,
+        ):
+            performance = self._calculate(table, outputs)
+            yield identifier, {
+                name: str(percent) for name, percent in performance.items()
+            }
+
+    def _fetch_many(
+        self,
+        identifiers: Iterable[str],
+        range_: Tuple[str, str],
+        prefetch: int,
+        batch: int,
+    ) -> Iterator[Tuple[str, WeightedPricedPointsTable]]:
+        self._raise_if_invalid_pipeline(prefetch, batch)
+        batches = self._batches(identifiers, batch)
+        if prefetch == 0:
+            for identifiers_ in batches:
+                yield from self._fetch_batch(identifiers_, range_)
+            return
+        pending: Deque[Future[List[Tuple[str, WeightedPricedPointsTable]]]]
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+        try:
+            for identifiers_ in batches:
+                pending.append(
+                    executor.submit(self._fetch_batch, identifiers_, range_),
+                )
+                if len(pending) > prefetch:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _batches(
+        identifiers: Iterable[str],
+        batch: int,
+    ) -> Iterator[List[str]]:
+        iterator = iter(identifiers)
+        while identifiers_ := list(islice(iterator, batch)):
+            yield identifiers_
+
+    def _fetch_batch(
+        self,
+        identifiers: List[str],
+        range_: Tuple[str, str],
+    ) -> List[Tuple[str, WeightedPricedPointsTable]]:
+        tables = self._fetcher.fetch_many(identifiers, range_)
+        return [(identifier, tables[identifier]) for identifier in identifiers]
+
+    def _raise_if_invalid_pipeline(self, prefetch: int, batch: int) -> None:
+        if prefetch < 0:
+            message = (
+                f"cannot generate with {self.__class__.__name__}; "
+                f"prefetch must be positive or zero"
+            )
+            raise ValueError(message)
+        if batch < 1:
+            message = (
+                f"cannot generate with {self.__class__.__name__}; "
+                f"batch must be strictly positive"
+            )
+            raise ValueError(message)
+
+    def generate_with_profile(
+        self,
+        identifier: str,
+        range_: Tuple[str, str],
+        *,
+        outputs: Optional[Collection[str]] = None,
+        memory: bool = True,
+    ) -> Tuple[Dict[str, str], Profile]:
+        """Generate a performance report for `identifier` over the period
+        of time delimited by `range_`, and profile the generation.
+
+        Notes
+        -----
+        Profiling is limited to this call, and can be performed within
+        a running process; see :py:class:`Profiler`.
+
+        Parameters
+        ----------
+        identifier
+            identifier of the entity for which to generate a performance report
+        range_
+            dates delimiting the period over which to compute the performance;
+            each date must be a business day;
+            the first date represents the start of the period and
+            the second date represents the end of the period
+        outputs: Optional[Collection[str]], optional
+            names of the performance to report (see
+            :py:attr:`IPerformanceCalculator.names`), defaults to all of them
+        memory: bool, optional
+            whether to trace memory allocations, defaults to True
+
+        Raises
+        ------
+        ValueError
+            if `identifier` does not exist,
+            if any date in `range_` is an invalid business day,
+            if the second date in `range_` is not strictly greater than the
+            first date in `range_`, or
+            if `outputs` contains unknown names
+        OverflowError
+            if an overflow occurs while determining the performance
+        RuntimeError
+            if an unexpected error occurs while generating the performance
+            report
+
+        Returns
+        -------
+        Tuple[Dict[str, str], Profile]
+            performance report, and profile of its generation aggregated
+            by component
+        """
+        with Profiler(memory=memory) as profiler:
+            report = self.generate(identifier, range_, outputs=outputs)
+        return report, profiler.profile
+
+
+class IncrementalPerformanceReportGenerator:
+    """Generator of performance report (incl. attribution by effects)
+    computing the performance of each period of time (i.e., each pair of
+    consecutive business days) only once. The performance of the periods
+    missing from the store is calculated, and stored; the performance over
+    the whole range is then compounded from the store. A period is missing
+    unless every name calculated by period is stored for it (see
+    :py:attr:`IPerformanceCalculator.rate_names`); e.g., periods stored
+    before the calculator gained an effect are calculated again, and names
+    no longer calculated are ignored.
+
+    Parameters
+    ----------
+    fetcher: IDataPointsFetcher
+        fetcher of the necessary data points to compute the performance
+    calculator: IPerformanceCalculator
+        calculator of performance
+    calendar: IBusinessCalendar
+        calendar of the business days delimiting the periods
+    store: IRatesStore
+        store of the performance of each period
+    """
+
+    def __init__(
+        self,
+        fetcher: IDataPointsFetcher,
+        calculator: IPerformanceCalculator,
+        calendar: IBusinessCalendar,
+        store: IRatesStore,
+    ):
+        self._fetcher = fetcher
+        self._calculator = calculator
+        self._calendar = calendar
+        self._store = store
+
     def generate(
         self,
         identifier: str,
@@ -100,6 +717,31 @@ class PerformanceReportGenerator:
         Dict[str, str]
             performance report
         """
-        table = self._fetcher.fetch(identifier, range_)
-        performance = self._calculator.calculate(table)
+        dates = self._calendar.dates(range_)
+        periods = list(zip(dates, dates[1:]))
+        self._raise_if_no_period(periods)
+        names = self._calculator.rate_names
+        self._update(identifier, periods, names)
+        performance = self._calculator.compound(
+            self._store.get(identifier, periods, names=names),
+        )
         return {name: str(percent) for name, percent in performance.items()}
+
+    def _raise_if_no_period(self, periods: List[Tuple[str, str]]) -> None:
+        if not periods:
+            message = (
+                f"cannot generate with {self.__class__.__name__}; "
+                f"range must contain at least one period"
+            )
+            raise ValueError(message)
+
+    def _update(
+        self,
+        identifier: str,
+        periods: List[Tuple[str, str]],
+        names: Collection[str],
+    ) -> None:
+        stored = self._store.stored(identifier, periods, names=names)
+        for run in missing_runs(periods, stored):
+            table = self._fetcher.fetch(identifier, (run[0][0], run[-1][1]))
+            self._store.put(identifier, run, self._calculator.rates(table))
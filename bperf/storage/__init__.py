@@ -0,0 +1,13 @@
+from .daily import DailyPointsStore
+from .npy import NpyTableStorage
+from .rates import IRatesStore, SqliteRatesStore
+from .shared import SharedTable, SharedTableDescriptor
+
+__all__ = [
+    "DailyPointsStore",
+    "IRatesStore",
+    "NpyTableStorage",
+    "SharedTable",
+    "SharedTableDescriptor",
+    "SqliteRatesStore",
+]
@@ -0,0 +1,470 @@
+import json
+import os
+from bisect import bisect_left
+from functools import partial
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from ..priced.points.weighted.assembler import (
+    Rows,
+    WeightedPricedPointsAssembler,
+)
+from ..priced.points.weighted.columns import WeightedPricedPointsColumns
+from ..priced.points.weighted.sequence import WeightedPricedPointsSequence
+from ..priced.points.weighted.table import WeightedPricedPointsTable
+from ..utilities.sequence import LazyValues
+
+Array = npt.NDArray[Any]
+Day = Dict[str, Dict[str, Array]]
+
+
+class DailyPointsStore:
+    """Append-only store of the data points of each day in a directory,
+    from which the table of any entity over any range of stored days is
+    read without copying.
+
+    Notes
+    -----
+    A day holds the positions of each entity, and the securities, flows
+    and curves with which they're priced (see
+    :py:class:`SqliteDataPointsFetcher` for the meaning of each column).
+    Upon appending a day, the period from the previous day is written once,
+    as the columnar representation of a table (see
+    :py:class:`WeightedPricedPointsColumns`) holding one block of positions
+    per entity, at the end of a file per column, and the block of each
+    entity is indexed by entity and day; hence, appending a day takes a
+    time proportional to the size of the day, regardless of the history.
+    Reading memory-maps the files, and the sequence of each period is
+    created from the maps on first access.
+
+    A manifest records the stored days, the entities and the length of
+    each file; it's replaced after the files are appended to, hence an
+    interrupted append leaves the store as it was before the append.
+
+    The store is safe to share between threads; only one process may
+    append to it at a time.
+
+    Parameters
+    ----------
+    path: Union[str, Path]
+        directory in which the data points are stored, created empty if it
+        doesn't exist
+
+    Raises
+    ------
+    ValueError
+        if the directory holds a store in an unsupported format
+    """
+
+    FORMAT = "bperf-daily"
+    VERSION = 1
+    _MANIFEST = "manifest.json"
+    _DTYPES = {
+        "periods": "<i8",
+        "weights": "<i8",
+        "flows": "<i8",
+        "spots": "<i8",
+        "spreads": "<f8",
+        "terms": "<f8",
+        "cents": "<i8",
+        "curves": "<i8",
+        "tenors": "<f8",
+        "rates": "<f8",
+        "identifiers": "<i8",
+        "days": "<i8",
+    }
+    _OFFSETS = {"periods": "weights", "flows": "terms", "curves": "tenors"}
+    _TABLES: Dict[str, Dict[str, Any]] = {
+        "positions": {"identifier": str, "security": str, "weight": np.int64},
+        "securities": {"security": str, "curve": str, "spread": np.float64},
+        "flows": {"security": str, "term": np.float64, "cents": np.int64},
+        "curves": {"curve": str, "tenor": np.float64, "rate": np.float64},
+    }
+
+    def __init__(self, path: Union[str, Path]):
+        self._path = Path(path)
+        self._lock = Lock()
+        self._columns: Optional[WeightedPricedPointsColumns] = None
+        if not (self._path / self._MANIFEST).exists():
+            self._create()
+        self._manifest = json.loads((self._path / self._MANIFEST).read_text())
+        self._raise_if_unsupported()
+        self._days = {
+            date: day for day, date in enumerate(self._manifest["dates"])
+        }
+        self._codes = {
+            identifier: code
+            for code, identifier in enumerate(self._manifest["identifiers"])
+        }
+        self._index: Dict[int, Tuple[List[int], List[int]]] = {}
+        for block, (code, day) in enumerate(
+            zip(self._map("identifiers").tolist(), self._map("days").tolist())
+        ):
+            days, blocks = self._index.setdefault(code, ([], []))
+            days.append(day)
+            blocks.append(block)
+
+    def _create(self) -> None:
+        self._path.mkdir(parents=True, exist_ok=True)
+        lengths = {}
+        for name, dtype in self._DTYPES.items():
+            initial = np.zeros(1 if name in self._OFFSETS else 0, dtype=dtype)
+            (self._path / f"{name}.bin").write_bytes(initial.tobytes())
+            lengths[name] = len(initial)
+        self._commit(
+            {
+                "format": self.FORMAT,
+                "version": self.VERSION,
+                "dates": [],
+                "identifiers": [],
+                "lengths": lengths,
+                "pending": None,
+            }
+        )
+
+    def _raise_if_unsupported(self) -> None:
+        header = {
+            "format": self._manifest.get("format"),
+            "version": self._manifest.get("version"),
+        }
+        if header != {"format": self.FORMAT, "version": self.VERSION}:
+            message = (
+                f"cannot open {self.__class__.__name__}; "
+                f"unsupported format {header}"
+            )
+            raise ValueError(message)
+
+    @property
+    def path(self) -> Path:
+        """Get the directory in which the data points are stored."""
+        return self._path
+
+    @property
+    def dates(self) -> Tuple[str, ...]:
+        """Get the stored days, in increasing order."""
+        with self._lock:
+            return tuple(self._manifest["dates"])
+
+    def append(
+        self,
+        date: str,
+        positions: Mapping[str, npt.ArrayLike],
+        securities: Mapping[str, npt.ArrayLike],
+        flows: Mapping[str, npt.ArrayLike],
+        curves: Mapping[str, npt.ArrayLike],
+    ) -> None:
+        """Append the data points of `date` after the stored days.
+
+        Parameters
+        ----------
+        date
+            day of the data points; must be greater than every stored day
+        positions
+            columns `identifier`, `security` and `weight` of the positions
+            held by each entity on `date`
+        securities
+            columns `security`, `curve` and `spread` of the securities on
+            `date`
+        flows
+            columns `security`, `term` and `cents` of the flows remaining
+            on `date`
+        curves
+            columns `curve`, `tenor` and `rate` of the spot curves on
+            `date`
+
+        Raises
+        ------
+        ValueError
+            if `date` is not greater than every stored day, if a column is
+            missing or has an invalid value, if a security or a curve held
+            on `date` or on the previous day is missing, or if the
+            positions don't represent valid data points (e.g., weights of
+            an entity not summing to one)
+        OSError
+            if the data points cannot be written
+        """
+        with self._lock:
+            self._raise_if_not_after(date)
+            day = {
+                "positions": self._table("positions", positions),
+                "securities": self._table("securities", securities),
+                "flows": self._table("flows", flows),
+                "curves": self._table("curves", curves),
+            }
+            self._assemble(day, day, date, date)  # validates the day
+            manifest = dict(
+                self._manifest, lengths=dict(self._manifest["lengths"])
+            )
+            codes = dict(self._codes)
+            blocks: List[Tuple[int, int]] = []
+            if manifest["pending"] is not None:
+                blocks = self._write(
+                    manifest["lengths"],
+                    codes,
+                    self._load(manifest["pending"]),
+                    day,
+                    (manifest["dates"][-1], date),
+                )
+            pending = f"pending-{len(manifest['dates'])}.npz"
+            np.savez(
+                self._path / pending,
+                **{
+                    f"{table}.{column}": values
+                    for table, columns in day.items()
+                    for column, values in columns.items()
+                },
+            )
+            manifest.update(
+                dates=[*manifest["dates"], date],
+                identifiers=list(codes),
+                pending=pending,
+            )
+            self._commit(manifest)
+            if self._manifest["pending"] is not None:
+                (self._path / self._manifest["pending"]).unlink()
+            self._manifest = manifest
+            self._days[date] = len(self._days)
+            self._codes = codes
+            start = len(self._days) - 2
+            for block, code in blocks:
+                days, indices = self._index.setdefault(code, ([], []))
+                days.append(start)
+                indices.append(block)
+            self._columns = None
+
+    def _raise_if_not_after(self, date: str) -> None:
+        dates = self._manifest["dates"]
+        if dates and date <= dates[-1]:
+            message = (
+                f"cannot append to {self.__class__.__name__}; "
+                f"date {date} must be greater than {dates[-1]}"
+            )
+            raise ValueError(message)
+
+    def _table(
+        self,
+        name: str,
+        columns: Mapping[str, npt.ArrayLike],
+    ) -> Dict[str, Array]:
+        converted = {}
+        for column, dtype in self._TABLES[name].items():
+            if column not in columns:
+                raise self._invalid(f"{name} must have column {column}")
+            try:
+                converted[column] = np.asarray(columns[column], dtype=dtype)
+            except ValueError as err:
+                raise self._invalid(f"{name}.{column} is invalid") from err
+        if len({np.shape(values) for values in converted.values()}) != 1 or any(
+            np.ndim(values) != 1 for values in converted.values()
+        ):
+            raise self._invalid(f"columns of {name} must have equal lengths")
+        return converted
+
+    def _load(self, name: str) -> Day:
+        day: Day = {table: {} for table in self._TABLES}
+        with np.load(self._path / name, allow_pickle=False) as arrays:
+            for key in arrays.files:
+                table, column = key.split(".")
+                day[table][column] = arrays[key]
+        return day
+
+    def _write(
+        self,
+        lengths: Dict[str, int],
+        codes: Dict[str, int],
+        previous: Day,
+        day: Day,
+        dates: Tuple[str, str],
+    ) -> List[Tuple[int, int]]:
+        # write the period from the previous day, and return the block and
+        # the code of the entity of each block; new entities are coded
+        held, local = np.unique(
+            previous["positions"]["identifier"],
+            return_inverse=True,
+        )
+        arrays = self._assemble(previous, day, *dates, held=local).arrays
+        entities = [
+            codes.setdefault(identifier, len(codes))
+            for identifier in held.tolist()
+        ]
+        bases = {name: lengths[name] for name in self._DTYPES}
+        rebased = {
+            "periods": arrays["periods"][1:] + bases["weights"],
+            "flows": arrays["flows"][1:] + bases["terms"],
+            "curves": arrays["curves"][1:] + bases["tenors"],
+            "spots": arrays["spots"] + bases["curves"] - 1,
+            "identifiers": np.array(entities, dtype=np.int64),
+            "days": np.full(len(entities), len(self._days) - 1, dtype=np.int64),
+        }
+        for name, dtype in self._DTYPES.items():
+            values = np.asarray(
+                rebased.get(name, arrays.get(name)), dtype=dtype
+            )
+            with open(self._path / f"{name}.bin", "r+b") as file:
+                # drop what an interrupted append may have left
+                file.seek(lengths[name] * values.itemsize)
+                file.truncate()
+                file.write(values.tobytes())
+            lengths[name] += len(values)
+        first = bases["periods"] - 1
+        return [(first + block, code) for block, code in enumerate(entities)]
+
+    def _assemble(
+        self,
+        previous: Day,
+        day: Day,
+        start: str,
+        end: str,
+        held: Optional[Array] = None,
+    ) -> WeightedPricedPointsColumns:
+        # columns of the period from `previous` to `day`, with a block of
+        # positions per entity
+        positions = previous["positions"]
+        if held is None:
+            held = np.unique(positions["identifier"], return_inverse=True)[1]
+        try:
+            return WeightedPricedPointsAssembler(
+                int(held.max(initial=-1)) + 1, (start, end)
+            ).columns(
+                (
+                    held.astype(np.int64),
+                    np.zeros(len(held), dtype=np.int64),
+                    positions["security"],
+                    positions["weight"],
+                ),
+                self._rows(previous, day, "securities", "security"),
+                self._rows(previous, day, "flows", "security"),
+                self._rows(previous, day, "curves", "curve"),
+            )
+        except ValueError as err:
+            raise self._invalid(str(err)) from err
+
+    @classmethod
+    def _rows(cls, previous: Day, day: Day, table: str, key: str) -> Rows:
+        # rows of `table` on the previous day (0) and on the day (1)
+        first, second = previous[table], day[table]
+        third, fourth = (
+            column for column in cls._TABLES[table] if column != key
+        )
+        return (
+            np.concatenate((first[key], second[key])),
+            np.repeat(
+                np.arange(2, dtype=np.int64),
+                (len(first[key]), len(second[key])),
+            ),
+            np.concatenate((first[third], second[third])),
+            np.concatenate((first[fourth], second[fourth])),
+        )
+
+    def _commit(self, manifest: Dict[str, Any]) -> None:
+        temporary = self._path / f"{self._MANIFEST}.tmp"
+        temporary.write_text(json.dumps(manifest))
+        os.replace(temporary, self._path / self._MANIFEST)
+
+    def read(
+        self,
+        identifier: str,
+        range_: Tuple[str, str],
+    ) -> WeightedPricedPointsTable:
+        """Read the data points of `identifier` over the period of time
+        delimited by `range_`. The sequence of each period is created on
+        first access, from the memory-mapped files; a period during which
+        the entity held no position is an empty sequence.
+
+        Parameters
+        ----------
+        identifier
+            identifier of the entity for which to read data points
+        range_
+            stored days delimiting the period over which to read;
+            the first day represents the start of the period and
+            the second day represents the end of the period
+
+        Raises
+        ------
+        ValueError
+            if `identifier` has no stored period, if any day in `range_`
+            is not stored, or if the second day in `range_` is not strictly
+            greater than the first day in `range_`
+
+        Returns
+        -------
+        WeightedPricedPointsTable
+            data points
+        """
+        with self._lock:
+            start, end = self._range(range_)
+            code = self._codes.get(identifier)
+            if code is None or code not in self._index:
+                message = (
+                    f"cannot read {self.__class__.__name__}; "
+                    f"identifier {identifier} does not exist"
+                )
+                raise ValueError(message)
+            days, blocks = self._index[code]
+            lower, upper = bisect_left(days, start), bisect_left(days, end)
+            found = dict(zip(days[lower:upper], blocks[lower:upper]))
+            columns = self._mapped()
+        periods = [found.get(day, -1) for day in range(start, end)]
+        return WeightedPricedPointsTable._trusted(
+            LazyValues(len(periods), partial(self._sequence, columns, periods))
+        )
+
+    def _range(self, range_: Tuple[str, str]) -> Tuple[int, int]:
+        missing = [date for date in range_ if date not in self._days]
+        if missing:
+            message = (
+                f"cannot read {self.__class__.__name__}; "
+                f"date {missing[0]} is not stored"
+            )
+            raise ValueError(message)
+        start, end = (self._days[date] for date in range_)
+        if start >= end:
+            message = (
+                f"cannot read {self.__class__.__name__}; "
+                f"range must contain at least one period"
+            )
+            raise ValueError(message)
+        return start, end
+
+    def _mapped(self) -> WeightedPricedPointsColumns:
+        if self._columns is None:
+            self._columns = WeightedPricedPointsColumns(
+                **{
+                    name: self._map(name)
+                    for name in WeightedPricedPointsColumns.NAMES
+                },
+                validate=False,
+            )
+        return self._columns
+
+    def _map(self, name: str) -> Array:
+        length = self._manifest["lengths"][name]
+        dtype = self._DTYPES[name]
+        if length == 0:
+            return np.zeros(0, dtype=dtype)  # empty files cannot be mapped
+        return np.memmap(
+            self._path / f"{name}.bin",
+            dtype=dtype,
+            mode="r",
+            shape=(length,),
+        )
+
+    @staticmethod
+    def _sequence(
+        columns: WeightedPricedPointsColumns,
+        periods: Sequence[int],
+        period: int,
+    ) -> WeightedPricedPointsSequence:
+        block = periods[period]
+        if block < 0:
+            return WeightedPricedPointsSequence._trusted(())
+        return columns.sequence(block)
+
+    def _invalid(self, reason: str) -> ValueError:
+        message = f"cannot append to {self.__class__.__name__}; {reason}"
+        return ValueError(message)
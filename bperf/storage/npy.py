@@ -0,0 +1,159 @@
+import json
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+
+from ..priced.points.weighted.columns import WeightedPricedPointsColumns
+from ..priced.points.weighted.table import WeightedPricedPointsTable
+
+
+class NpyTableStorage:
+    """Storage of a :py:class:`WeightedPricedPointsTable` in a directory
+    as one NumPy `.npy` file per column of its columnar representation
+    (see :py:class:`WeightedPricedPointsColumns`).
+
+    Parameters
+    ----------
+    path: Union[str, Path]
+        directory in which the table is stored
+    """
+
+    FORMAT = "bperf-table"
+    VERSION = 1
+    _HEADER = "header.json"
+
+    def __init__(self, path: Union[str, Path]):
+        self._path = Path(path)
+
+    @property
+    def path(self) -> Path:
+        """Get the directory in which the table is stored."""
+        return self._path
+
+    def write(self, table: WeightedPricedPointsTable) -> None:
+        """Write `table` to this storage, overwriting any stored table.
+
+        Parameters
+        ----------
+        table
+            table to write
+
+        Raises
+        ------
+        OverflowError
+            if a weight or a flow doesn't fit in a 64-bit integer
+        OSError
+            if the table cannot be written
+        """
+        self.write_columns(WeightedPricedPointsColumns.from_table(table))
+
+    def write_columns(self, columns: WeightedPricedPointsColumns) -> None:
+        """Write the table represented by `columns` to this storage,
+        overwriting any stored table.
+
+        Parameters
+        ----------
+        columns
+            columnar representation of the table to write
+
+        Raises
+        ------
+        OSError
+            if the table cannot be written
+        """
+        self._path.mkdir(parents=True, exist_ok=True)
+        for name, array in columns.arrays.items():
+            np.save(self._path / f"{name}.npy", array, allow_pickle=False)
+        header = {"format": self.FORMAT, "version": self.VERSION}
+        (self._path / self._HEADER).write_text(json.dumps(header))
+
+    def read(
+        self,
+        *,
+        mmap: bool = True,
+        validate: bool = True,
+    ) -> WeightedPricedPointsTable:
+        """Read the table stored in this storage. The sequence of each
+        period of the table is created on first access.
+
+        Parameters
+        ----------
+        mmap: bool, optional
+            whether to memory-map the columns instead of loading them in
+            memory, defaults to True
+        validate: bool, optional
+            whether to validate the columns (see
+            :py:class:`WeightedPricedPointsColumns`), defaults to True;
+            columns must only be left unvalidated if the stored files are
+            trusted (e.g., written by this storage, and left untouched)
+
+        Raises
+        ------
+        ValueError
+            if the storage doesn't contain a table in a supported format, or
+            if `validate` and the stored columns don't represent a valid
+            table (e.g., a truncated or edited file)
+        OSError
+            if the table cannot be read
+
+        Returns
+        -------
+        WeightedPricedPointsTable
+            table
+        """
+        return self.read_columns(mmap=mmap, validate=validate).table()
+
+    def read_columns(
+        self,
+        *,
+        mmap: bool = True,
+        validate: bool = True,
+    ) -> WeightedPricedPointsColumns:
+        """Read the columnar representation of the table stored in this
+        storage.
+
+        Parameters
+        ----------
+        mmap: bool, optional
+            whether to memory-map the columns instead of loading them in
+            memory, defaults to True
+        validate: bool, optional
+            whether to validate the columns (see
+            :py:class:`WeightedPricedPointsColumns`), defaults to True;
+            columns must only be left unvalidated if the stored files are
+            trusted (e.g., written by this storage, and left untouched)
+
+        Raises
+        ------
+        ValueError
+            if the storage doesn't contain a table in a supported format, or
+            if `validate` and the stored columns don't represent a valid
+            table (e.g., a truncated or edited file)
+        OSError
+            if the table cannot be read
+
+        Returns
+        -------
+        WeightedPricedPointsColumns
+            columnar representation of the table
+        """
+        self._raise_if_unsupported()
+        arrays = {
+            name: np.load(
+                self._path / f"{name}.npy",
+                mmap_mode="r" if mmap else None,
+                allow_pickle=False,
+            )
+            for name in WeightedPricedPointsColumns.NAMES
+        }
+        return WeightedPricedPointsColumns(**arrays, validate=validate)
+
+    def _raise_if_unsupported(self) -> None:
+        header = json.loads((self._path / self._HEADER).read_text())
+        if header != {"format": self.FORMAT, "version": self.VERSION}:
+            message = (
+                f"cannot read {self.__class__.__name__}; "
+                f"unsupported format {header}"
+            )
+            raise ValueError(message)
@@ -0,0 +1,312 @@
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from typing import Collection, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from ..rate.periodic import PeriodicRate
+from ..rate.periodic.sequence import PeriodicRateSequence
+
+Period = Tuple[str, str]
+
+
+class IRatesStore:
+    """Interface for stores of the performance (e.g., total performance
+    and effects) of each period of time (i.e., each pair of consecutive
+    business days) of entities.
+    """
+
+    def stored(
+        self,
+        identifier: str,
+        periods: Sequence[Period],
+        *,
+        names: Optional[Collection[str]] = None,
+    ) -> Set[Period]:
+        """Get which of `periods` have their performance stored for
+        `identifier`. A period is stored only if the performance of every
+        one of `names` is stored for it.
+
+        Parameters
+        ----------
+        identifier
+            identifier of the entity
+        periods
+            periods of time, as pairs of consecutive business days
+        names: Optional[Collection[str]], optional
+            names of the performance (e.g., total or carry), defaults to
+            every name stored for any of `periods`
+
+        Returns
+        -------
+        Set[Period]
+            stored periods
+        """
+        raise NotImplementedError
+
+    def put(
+        self,
+        identifier: str,
+        periods: Sequence[Period],
+        rates: Dict[str, PeriodicRateSequence],
+    ) -> None:
+        """Store the performance of each of `periods` for `identifier`,
+        replacing any stored performance of those periods.
+
+        Parameters
+        ----------
+        identifier
+            identifier of the entity
+        periods
+            periods of time, as pairs of consecutive business days
+        rates
+            performance of each period by name (e.g., total or carry)
+
+        Raises
+        ------
+        ValueError
+            if the length of any sequence in `rates` doesn't match with the
+            length of `periods`
+        """
+        raise NotImplementedError
+
+    def get(
+        self,
+        identifier: str,
+        periods: Sequence[Period],
+        *,
+        names: Optional[Collection[str]] = None,
+    ) -> Dict[str, PeriodicRateSequence]:
+        """Get the stored performance of each of `periods` for `identifier`.
+
+        Parameters
+        ----------
+        identifier
+            identifier of the entity
+        periods
+            periods of time, as pairs of consecutive business days
+        names: Optional[Collection[str]], optional
+            names of the performance (e.g., total or carry), defaults to
+            every name stored for any of `periods`
+
+        Raises
+        ------
+        KeyError
+            if any of `periods` is not stored (see :py:meth:`stored`)
+
+        Returns
+        -------
+        Dict[str, PeriodicRateSequence]
+            performance of each period by name, in the order in which the
+            names were stored if `names` is None, else in the order of
+            `names`
+        """
+        raise NotImplementedError
+
+
+class SqliteRatesStore(IRatesStore):
+    """Store of the performance of each period of time of entities in a
+    local SQLite database. The store is safe to share between threads.
+
+    Parameters
+    ----------
+    path: Union[str, Path]
+        path of the database, created if it doesn't exist; ":memory:"
+        creates a transient database in memory
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS rates ("
+        "identifier TEXT NOT NULL, "
+        "start TEXT NOT NULL, "
+        "end TEXT NOT NULL, "
+        "position INTEGER NOT NULL, "
+        "name TEXT NOT NULL, "
+        "rate REAL NOT NULL, "
+        "PRIMARY KEY (identifier, start, end, name)"
+        ") WITHOUT ROWID"
+    )
+
+    def __init__(self, path: Union[str, Path]):
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = Lock()
+        with self._lock, self._connection:
+            self._connection.execute(self._SCHEMA)
+
+    def stored(
+        self,
+        identifier: str,
+        periods: Sequence[Period],
+        *,
+        names: Optional[Collection[str]] = None,
+    ) -> Set[Period]:
+        """Get which of `periods` have their performance stored for
+        `identifier`. A period is stored only if the performance of every
+        one of `names` is stored for it.
+
+        Parameters
+        ----------
+        identifier
+            identifier of the entity
+        periods
+            periods of time, as pairs of consecutive business days
+        names: Optional[Collection[str]], optional
+            names of the performance (e.g., total or carry), defaults to
+            every name stored for any of `periods`
+
+        Returns
+        -------
+        Set[Period]
+            stored periods
+        """
+        stored, found = self._found(identifier, periods)
+        required = stored if names is None else names
+        return {
+            period
+            for period, rates in found.items()
+            if all(name in rates for name in required)
+        }
+
+    def put(
+        self,
+        identifier: str,
+        periods: Sequence[Period],
+        rates: Dict[str, PeriodicRateSequence],
+    ) -> None:
+        """Store the performance of each of `periods` for `identifier`,
+        replacing any stored performance of those periods.
+
+        Parameters
+        ----------
+        identifier
+            identifier of the entity
+        periods
+            periods of time, as pairs of consecutive business days
+        rates
+            performance of each period by name (e.g., total or carry)
+
+        Raises
+        ------
+        ValueError
+            if the length of any sequence in `rates` doesn't match with the
+            length of `periods`
+        """
+        self._raise_if_length_mismatch(periods, rates)
+        rows = [
+            (identifier, start, end, position, name, float(rate))
+            for position, (name, rates_) in enumerate(rates.items())
+            for (start, end), rate in zip(periods, rates_)
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM rates WHERE identifier = ? AND start = ? "
+                "AND end = ?",
+                [(identifier, start, end) for start, end in periods],
+            )
+            self._connection.executemany(
+                "INSERT INTO rates VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def _raise_if_length_mismatch(
+        self,
+        periods: Sequence[Period],
+        rates: Dict[str, PeriodicRateSequence],
+    ) -> None:
+        if any(len(rates_) != len(periods) for rates_ in rates.values()):
+            message = (
+                f"cannot put in {self.__class__.__name__}; "
+                f"there must be one rate per period"
+            )
+            raise ValueError(message)
+
+    def get(
+        self,
+        identifier: str,
+        periods: Sequence[Period],
+        *,
+        names: Optional[Collection[str]] = None,
+    ) -> Dict[str, PeriodicRateSequence]:
+        """Get the stored performance of each of `periods` for `identifier`.
+
+        Parameters
+        ----------
+        identifier
+            identifier of the entity
+        periods
+            periods of time, as pairs of consecutive business days
+        names: Optional[Collection[str]], optional
+            names of the performance (e.g., total or carry), defaults to
+            every name stored for any of `periods`
+
+        Raises
+        ------
+        KeyError
+            if any of `periods` is not stored (see :py:meth:`stored`)
+
+        Returns
+        -------
+        Dict[str, PeriodicRateSequence]
+            performance of each period by name, in the order in which the
+            names were stored if `names` is None, else in the order of
+            `names`
+        """
+        stored, found = self._found(identifier, periods)
+        required = stored if names is None else list(names)
+        for period in periods:
+            rates = found.get(period, {})
+            if not rates or any(name not in rates for name in required):
+                raise self._not_stored(identifier, period)
+        return {
+            name: PeriodicRateSequence(
+                PeriodicRate(found[period][name]) for period in periods
+            )
+            for name in required
+        }
+
+    def _found(
+        self,
+        identifier: str,
+        periods: Sequence[Period],
+    ) -> Tuple[List[str], Dict[Period, Dict[str, float]]]:
+        # names stored for any of `periods`, in the order in which they
+        # were stored, and the stored performance of each period by name
+        requested = set(periods)
+        names: Dict[str, None] = {}
+        found: Dict[Period, Dict[str, float]] = {}
+        for start, end, _, name, rate in self._select(identifier, periods):
+            if (start, end) in requested:
+                names.setdefault(name)
+                found.setdefault((start, end), {})[name] = rate
+        return list(names), found
+
+    def _not_stored(self, identifier: str, period: Period) -> KeyError:
+        message = (
+            f"cannot get from {self.__class__.__name__}; "
+            f"period {period} is not stored for {identifier}"
+        )
+        return KeyError(message)
+
+    def _select(
+        self,
+        identifier: str,
+        periods: Sequence[Period],
+    ) -> List[Tuple[str, str, int, str, float]]:
+        if not periods:
+            return []
+        with self._lock:
+            cursor = self._connection.execute(
+                "SELECT start, end, position, name, rate FROM rates "
+                "WHERE identifier = ? AND start >= ? AND end <= ? "
+                "ORDER BY position",
+                (
+                    identifier,
+                    min(start for start, _ in periods),
+                    max(end for _, end in periods),
+                ),
+            )
+            return cursor.fetchall()
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,246 @@
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import Any, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+
+from ..priced.points.weighted.columns import WeightedPricedPointsColumns
+from ..priced.points.weighted.table import WeightedPricedPointsTable
+
+Layout = Tuple[Tuple[str, str, int, int], ...]
+
+
+class SharedTableDescriptor:
+    """Descriptor of a :py:class:`SharedTable` sufficient to attach to it
+    from another process; it's small and cheap to pickle, regardless of
+    the size of the table.
+
+    Parameters
+    ----------
+    name: str
+        name of the block of shared memory
+    layout: Sequence[Tuple[str, str, int, int]]
+        name, data type, length and offset in bytes within the block of
+        each column
+    """
+
+    def __init__(self, name: str, layout: Sequence[Tuple[str, str, int, int]]):
+        self._name = name
+        self._layout: Layout = tuple(
+            (column, dtype, int(length), int(offset))
+            for column, dtype, length, offset in layout
+        )
+
+    @property
+    def name(self) -> str:
+        """Get the name of the block of shared memory."""
+        return self._name
+
+    @property
+    def layout(self) -> Layout:
+        """Get the name, data type, length and offset in bytes within the
+        block of each column.
+        """
+        return self._layout
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._name == other._name and self._layout == other._layout
+
+    def __hash__(self) -> int:
+        return hash((self._name, self._layout))
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}(name={self._name!r})>"
+
+
+class SharedTable:
+    """Columnar representation of a :py:class:`WeightedPricedPointsTable`
+    (see :py:class:`WeightedPricedPointsColumns`) held in a block of
+    shared memory, to be transported cheaply to other processes (e.g.,
+    the workers of a process pool).
+
+    Notes
+    -----
+    The table is copied once into shared memory by :py:meth:`create`;
+    other processes receive only the :py:attr:`descriptor`, and attach to
+    the block by instantiating this class, without copying the columns.
+    The process that created the block is responsible for unlinking it
+    (e.g., by exiting the `with` block of the created table) once every
+    process is done with it.
+
+    Parameters
+    ----------
+    descriptor: SharedTableDescriptor
+        descriptor of the shared table to attach to
+
+    Raises
+    ------
+    FileNotFoundError
+        if the block of shared memory doesn't exist (e.g., it has been
+        unlinked)
+    """
+
+    _ALIGNMENT = 8
+
+    @classmethod
+    def create(
+        cls,
+        source: Union[WeightedPricedPointsTable, WeightedPricedPointsColumns],
+    ) -> "SharedTable":
+        """Create a block of shared memory, and copy the columnar
+        representation of `source` into it.
+
+        Parameters
+        ----------
+        source
+            table, or its columnar representation, to share
+
+        Raises
+        ------
+        OverflowError
+            if a weight or a flow doesn't fit in a 64-bit integer
+        OSError
+            if the block of shared memory cannot be created
+
+        Returns
+        -------
+        SharedTable
+            shared table, which unlinks the block upon exiting its `with`
+            block
+        """
+        columns = (
+            source
+            if isinstance(source, WeightedPricedPointsColumns)
+            else WeightedPricedPointsColumns.from_table(source)
+        )
+        arrays = columns.arrays
+        layout, size = [], 0
+        for name in WeightedPricedPointsColumns.NAMES:
+            array = arrays[name]
+            layout.append((name, array.dtype.str, len(array), size))
+            size += -(-array.nbytes // cls._ALIGNMENT) * cls._ALIGNMENT
+        memory = SharedMemory(create=True, size=max(size, 1))
+        try:
+            for name, dtype, length, offset in layout:
+                view: np.ndarray[Any, Any] = np.ndarray(
+                    (length,), dtype, memory.buf, offset
+                )
+                view[:] = arrays[name]
+                del view
+            shared = cls(SharedTableDescriptor(memory.name, layout))
+        except BaseException:
+            memory.unlink()
+            raise
+        finally:
+            memory.close()
+        shared._owner = True
+        return shared
+
+    def __init__(self, descriptor: SharedTableDescriptor):
+        self._memory: Optional[SharedMemory] = SharedMemory(descriptor.name)
+        self._descriptor = descriptor
+        self._owner = False
+        self._columns: Optional[WeightedPricedPointsColumns] = None
+
+    @property
+    def descriptor(self) -> SharedTableDescriptor:
+        """Get the descriptor to attach to this shared table from another
+        process.
+        """
+        return self._descriptor
+
+    def columns(self) -> WeightedPricedPointsColumns:
+        """Get the columnar representation of the shared table. Columns
+        are read-only views on the block of shared memory.
+
+        Raises
+        ------
+        ValueError
+            if this shared table is closed
+
+        Returns
+        -------
+        WeightedPricedPointsColumns
+            columnar representation of the table
+        """
+        if self._columns is None:
+            memory = self._raise_if_closed()
+            arrays = {}
+            for name, dtype, length, offset in self._descriptor.layout:
+                array: np.ndarray[Any, Any] = np.ndarray(
+                    (length,), dtype, memory.buf, offset
+                )
+                array.setflags(write=False)
+                arrays[name] = array
+            self._columns = WeightedPricedPointsColumns(
+                **arrays,
+                validate=False,
+            )
+        return self._columns
+
+    def table(self) -> WeightedPricedPointsTable:
+        """Get the shared table. The sequence of each period is created on
+        first access.
+
+        Raises
+        ------
+        ValueError
+            if this shared table is closed
+
+        Returns
+        -------
+        WeightedPricedPointsTable
+            table
+        """
+        return self.columns().table()
+
+    def close(self) -> None:
+        """Close access to the block of shared memory from this instance;
+        the block itself is left untouched (see :py:meth:`unlink`).
+
+        Raises
+        ------
+        BufferError
+            if a column (or an object created from it, e.g., the table)
+            is still referenced
+        """
+        if self._memory is None:
+            return
+        self._columns = None
+        self._memory.close()
+        self._memory = None
+
+    def unlink(self) -> None:
+        """Request the destruction of the block of shared memory; it's
+        destroyed once every process has closed it.
+
+        Raises
+        ------
+        ValueError
+            if this shared table is closed
+        """
+        self._raise_if_closed().unlink()
+
+    def __enter__(self) -> "SharedTable":
+        return self
+
+    def __exit__(
+        self,
+        type_: Optional[Type[BaseException]],
+        value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self._owner and self._memory is not None:
+            self.unlink()
+        self.close()
+
+    def _raise_if_closed(self) -> SharedMemory:
+        if self._memory is None:
+            message = (
+                f"cannot access {self.__class__.__name__}; "
+                f"shared memory is closed"
+            )
+            raise ValueError(message)
+        return self._memory
@@ -1,8 +1,12 @@
+from functools import cached_property
 from typing import Any, Iterable, Tuple, Type, TypeVar
 
+import numpy as np
+import numpy.typing as npt
+
 from ..term import Term
 from ..term.sequence import TermSequence
-from ..utilities.sequence import Sequence
+from ..utilities.sequence import Sequence, SlicedValues
 from .termed import Termed
 
 T = TypeVar("T")
@@ -56,11 +60,56 @@ class TermedSequence(Sequence[Termed[T]]):
             )
             raise ValueError(message)
 
+    def _slice(self: S, item: slice) -> S:
+        # a slice is ordered, unless its step is negative, in which case it's
+        # ordered once reversed
+        values = SlicedValues(self._values, item)
+        if values.step < 0:
+            values = SlicedValues(values, slice(None, None, -1))
+        return self._trusted(values)
+
     @property
     def terms(self) -> TermSequence:
         """Get the terms of the termed in this sequence."""
         return TermSequence(termed.term for termed in self)
 
+    @cached_property
+    def _terms_array(self) -> npt.NDArray[np.float64]:
+        # terms as a read-only array, created once since sequences are
+        # immutable
+        array = np.array([float(termed.term) for termed in self], np.float64)
+        array.flags.writeable = False
+        return array
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # pickled as packed terms and values, rather than as termed objects
+        return self.__class__._unpack, (
+            self._terms_array.tobytes(),
+            self._pack_values(),
+        )
+
+    def _pack_values(self) -> Any:
+        return tuple(self.values)  # packed by subclasses with known values
+
+    @classmethod
+    def _unpack(cls: Type[S], terms: bytes, values: Any) -> S:
+        array = np.frombuffer(terms, np.float64)
+        sequence = cls._trusted(
+            tuple(
+                Termed(Term(term), value)
+                for term, value in zip(
+                    array.tolist(),
+                    cls._unpack_values(values),
+                )
+            )
+        )
+        sequence.__dict__["_terms_array"] = array  # read-only, as cached
+        return sequence
+
+    @classmethod
+    def _unpack_values(cls, values: Any) -> Iterable[Any]:
+        return tuple(values)
+
     @property
     def values(self) -> Iterable[T]:
         """Get the values of the termed in this sequence."""
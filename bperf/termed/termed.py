@@ -1,11 +1,12 @@
-from typing import Generic, TypeVar
+from typing import Generic, Hashable, TypeVar
 
 from ..term import Term
+from ..utilities.hash import CachedHash
 
 T = TypeVar("T")
 
 
-class Termed(Generic[T]):
+class Termed(CachedHash, Generic[T]):
     """Combination of a value and a term.
 
     Parameters
@@ -36,11 +37,6 @@ class Termed(Generic[T]):
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}{self}>"
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, self.__class__):
-            return NotImplemented
-        return self._term == other._term and self._value == other._value
-
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
             return NotImplemented
@@ -61,5 +57,5 @@ class Termed(Generic[T]):
             return NotImplemented
         return self._term >= other._term
 
-    def __hash__(self) -> int:
-        return hash((self._term, self._value))
+    def _key(self) -> Hashable:
+        return (self._term, self._value)
@@ -15,7 +15,7 @@ class Precise:
 
     Examples
     --------
-    `Precise(3, 2)` <=> 0.03
+    `Precise(3, 2)` <=> 0.03, and `Precise(3, 2).scaled` <=> 3
 
     Raises
     ------
@@ -113,6 +113,13 @@ class Precise:
     def __str__(self) -> str:
         return str(self._decimal)
 
+    @property
+    def scaled(self) -> int:
+        """Get the value of this precise as an integer (i.e., scaled by its
+        precision; e.g., cents for money, or basis points for percent).
+        """
+        return self._value
+
     @property
     def _decimal(self) -> Decimal:
         return Decimal(
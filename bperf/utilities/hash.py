@@ -0,0 +1,48 @@
+from typing import Any, Dict, Hashable, Optional
+
+
+class CachedHash:
+    """Mixin implementing __eq__ and __hash__ of immutable objects, which
+    are equal if they're of the same class and have equal keys (see
+    :py:meth:`_key`).
+
+    Notes
+    -----
+    The hash is computed once, on first use, and kept; since equal objects
+    have equal hashes, objects with different hashes, when both already
+    computed, are known to differ without comparing their keys. The hash
+    isn't pickled, since hashes (e.g., of strings) may differ from one
+    process to another.
+    """
+
+    _hash: Optional[int] = None
+
+    def _key(self) -> Hashable:
+        # components compared and hashed, implemented by subclasses
+        raise NotImplementedError
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        if self._hashes_differ(other):
+            return False
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self._key())
+        return self._hash
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        state.pop("_hash", None)
+        return state
+
+    def _hashes_differ(self, other: "CachedHash") -> bool:
+        return (
+            self._hash is not None
+            and other._hash is not None
+            and self._hash != other._hash
+        )
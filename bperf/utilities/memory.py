@@ -0,0 +1,56 @@
+import sys
+from types import BuiltinFunctionType, FunctionType, ModuleType
+from typing import Any, Iterable, List, Set
+
+import numpy as np
+
+_SHARED = (type, ModuleType, FunctionType, BuiltinFunctionType)
+
+
+def deep_sizeof(obj: object) -> int:
+    """Get the size in bytes of `obj` and of every object it references,
+    directly or indirectly. Each object is accounted for only once, even
+    if it's referenced multiple times; classes, modules and functions are
+    not accounted for.
+
+    Parameters
+    ----------
+    obj
+        object for which to get the size
+
+    Returns
+    -------
+    int
+        size in bytes
+    """
+    seen: Set[int] = set()
+    stack: List[object] = [obj]
+    size = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _SHARED):
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        stack.extend(_referents(current))
+    return size
+
+
+def _referents(obj: object) -> Iterable[Any]:
+    if isinstance(obj, (str, bytes, int, float)):
+        return ()
+    if isinstance(obj, np.ndarray):
+        return () if obj.base is None else (obj.base,)
+    if isinstance(obj, dict):
+        return (*obj.keys(), *obj.values())
+    if isinstance(obj, (tuple, list, set, frozenset)):
+        return obj
+    referents: List[Any] = []
+    if hasattr(obj, "__dict__"):
+        referents.append(vars(obj))
+    for cls in type(obj).__mro__:
+        slots = getattr(cls, "__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if hasattr(obj, name):
+                referents.append(getattr(obj, name))
+    return referents
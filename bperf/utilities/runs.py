@@ -0,0 +1,34 @@
+from typing import Container, Iterable, List, TypeVar
+
+K = TypeVar("K")
+
+
+def missing_runs(keys: Iterable[K], present: Container[K]) -> List[List[K]]:
+    """Get the contiguous runs of `keys` which are not in `present`.
+
+    Parameters
+    ----------
+    keys
+        ordered keys
+    present
+        keys which are present
+
+    Examples
+    --------
+    `missing_runs([1, 2, 3, 4, 5], {3})` <=> `[[1, 2], [4, 5]]`
+
+    Returns
+    -------
+    List[List[K]]
+        runs of missing keys, in order
+    """
+    runs: List[List[K]] = []
+    previous = True
+    for key in keys:
+        missing = key not in present
+        if missing:
+            if previous:
+                runs.append([])
+            runs[-1].append(key)
+        previous = not missing
+    return runs
@@ -1,11 +1,137 @@
 from collections.abc import Sequence as abcSequence
-from typing import Any, Iterable, Type, TypeVar, Union, overload
-
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from .hash import CachedHash
+from .memory import deep_sizeof
+
+T = TypeVar("T")
 T_co = TypeVar("T_co", covariant=True)
 S = TypeVar("S", bound="Sequence[Any]")
 
 
-class Sequence(abcSequence[T_co]):
+class LazyValues(abcSequence[T]):
+    """Immutable sequence of values created on first access, and then
+    kept. Equality and hashing are consistent with those of a tuple
+    of the same values.
+
+    Parameters
+    ----------
+    length: int
+        number of values
+    factory: Callable[[int], T]
+        creator of the value at a given index
+    """
+
+    def __init__(self, length: int, factory: Callable[[int], T]):
+        self._factory = factory
+        self._cache: List[Optional[T]] = [None] * length
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @overload
+    def __getitem__(self, item: int) -> T:
+        pass
+
+    @overload
+    def __getitem__(self, item: slice) -> "abcSequence[T]":
+        pass
+
+    def __getitem__(self, item: Union[slice, int]) -> Any:
+        if isinstance(item, slice):
+            return SlicedValues(self, item)
+        index = range(len(self))[item]
+        value = self._cache[index]
+        if value is None:
+            value = self._cache[index] = self._factory(index)
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, abcSequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            value == other_ for value, other_ in zip(self, other)
+        )
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+
+class SlicedValues(abcSequence[T]):
+    """Immutable view of a slice of values sharing the values instead of
+    copying them. Equality and hashing are consistent with those of a
+    tuple of the same values.
+
+    Parameters
+    ----------
+    values: abcSequence[T]
+        values to view
+    item: slice
+        slice of `values` to view
+    """
+
+    def __init__(self, values: abcSequence[T], item: slice):
+        self._values: abcSequence[T]
+        self._indices: range
+        if isinstance(values, SlicedValues):
+            self._values = values._values
+            self._indices = values._indices[item]
+        else:
+            self._values = values
+            self._indices = range(len(values))[item]
+
+    @property
+    def step(self) -> int:
+        """Get the step between the viewed values in the underlying
+        values.
+        """
+        return self._indices.step
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, item: int) -> T:
+        pass
+
+    @overload
+    def __getitem__(self, item: slice) -> "abcSequence[T]":
+        pass
+
+    def __getitem__(self, item: Union[slice, int]) -> Any:
+        if isinstance(item, slice):
+            return SlicedValues(self, item)
+        return self._values[self._indices[item]]
+
+    def __iter__(self) -> Iterator[T]:
+        values = self._values
+        return (values[index] for index in self._indices)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, abcSequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            value == other_ for value, other_ in zip(self, other)
+        )
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+
+class Sequence(CachedHash, abcSequence[T_co]):
     """Immutable sequence of objects with default implementation
     for __init__, __getitem__, __len__, __eq__, __hash__,
     __str__, and __repr__.
@@ -27,8 +153,16 @@ class Sequence(abcSequence[T_co]):
         """
         return cls([])
 
+    @classmethod
+    def _trusted(cls: Type[S], values: abcSequence[Any]) -> S:
+        # create a sequence from values known to satisfy its invariants,
+        # without copying nor validating them
+        sequence = cls.__new__(cls)
+        sequence._values = values
+        return sequence
+
     def __init__(self, values: Iterable[T_co]):
-        self._values = tuple(values)
+        self._values: abcSequence[T_co] = tuple(values)
 
     def is_empty(self) -> bool:
         """Verify if this sequence is empty.
@@ -40,6 +174,17 @@ class Sequence(abcSequence[T_co]):
         """
         return len(self) == 0
 
+    def deep_sizeof(self) -> int:
+        """Get the size in bytes of this sequence including the size of
+        every object it references, directly or indirectly.
+
+        Returns
+        -------
+        int
+            size in bytes
+        """
+        return deep_sizeof(self)
+
     def __len__(self) -> int:
         return len(self._values)
 
@@ -53,19 +198,26 @@ class Sequence(abcSequence[T_co]):
 
     def __getitem__(self: S, item: Union[slice, int]) -> Any:
         if isinstance(item, slice):
-            return self.__class__(self._values[item])
+            return self._slice(item)
         return self._values[item]
 
+    def _slice(self: S, item: slice) -> S:
+        # a slice of a sequence satisfying its invariants satisfies them as
+        # well; hence, it shares the values of the sequence, and it's not
+        # validated (subclasses for which it's not the case must override)
+        return self._trusted(SlicedValues(self._values, item))
+
     def __str__(self) -> str:
         return f"({', '.join(str(value) for value in self)})"
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}{self}>"
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, self.__class__):
-            return NotImplemented
-        return self._values == other._values
+    def _key(self) -> Hashable:
+        return self._values
 
-    def __hash__(self) -> int:
-        return hash(self._values)
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # pickled as a tuple of its values (e.g., lazy or sliced values are
+        # materialized, and cached hashes are dropped), and rebuilt without
+        # being validated again
+        return self.__class__._trusted, (tuple(self._values),)
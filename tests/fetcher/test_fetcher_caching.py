@@ -0,0 +1,232 @@
+from typing import List, Tuple
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from bperf.calendar import IBusinessCalendar
+from bperf.curve import SpotCurve
+from bperf.fetcher import CachingDataPointsFetcher
+from bperf.flows import Flows
+from bperf.money import Money
+from bperf.percent import Percent
+from bperf.priced import PricedFlows
+from bperf.priced.points import PricedPoints
+from bperf.priced.points.weighted import WeightedPricedPoints
+from bperf.priced.points.weighted.sequence import WeightedPricedPointsSequence
+from bperf.priced.points.weighted.table import WeightedPricedPointsTable
+from bperf.rate.continuous import ContinuousRate
+from bperf.report import IDataPointsFetcher
+from bperf.term import Term
+from bperf.termed import Termed
+
+_DATES = tuple(f"2022-05-{day:02}" for day in range(10, 20))
+
+
+class _Calendar(IBusinessCalendar):
+    def dates(self, range_: Tuple[str, str]) -> Tuple[str, ...]:
+        start, end = range_
+        return tuple(date for date in _DATES if start <= date <= end)
+
+
+def _sequence(period: int) -> WeightedPricedPointsSequence:
+    priced = PricedFlows(
+        Flows([Termed(Term(1.0), Money(100))]),
+        SpotCurve([Termed(Term(1.0), ContinuousRate(0.01))]),
+        ContinuousRate(0.001 * period),
+    )
+    return WeightedPricedPointsSequence(
+        [WeightedPricedPoints(Percent(10000), PricedPoints(priced, priced))]
+    )
+
+
+_SEQUENCES = {
+    (start, end): _sequence(period)
+    for period, (start, end) in enumerate(zip(_DATES, _DATES[1:]))
+}
+
+
+def _table(range_: Tuple[str, str]) -> WeightedPricedPointsTable:
+    dates = _Calendar().dates(range_)
+    return WeightedPricedPointsTable(
+        _SEQUENCES[period] for period in zip(dates, dates[1:])
+    )
+
+
+@pytest.fixture
+def inner() -> MagicMock:
+    return MagicMock(
+        spec=IDataPointsFetcher,
+        **{
+            "fetch.side_effect": lambda _, range_: _table(range_),
+            "fetch_many.side_effect": lambda identifiers, range_: {
+                identifier: _table(range_) for identifier in identifiers
+            },
+        },
+    )
+
+
+@pytest.fixture
+def fetcher(inner: MagicMock) -> CachingDataPointsFetcher:
+    return CachingDataPointsFetcher(inner, _Calendar(), 10**9)
+
+
+class TestCachingDataPointsFetcherInvariants:
+    def test_when_budget_is_negative(self, inner: MagicMock) -> None:
+        with pytest.raises(ValueError, match="budget"):
+            CachingDataPointsFetcher(inner, _Calendar(), -1)
+
+
+class TestCachingDataPointsFetcherFetch:
+    def test_when_not_cached(
+        self,
+        fetcher: CachingDataPointsFetcher,
+        inner: MagicMock,
+    ) -> None:
+        range_ = (_DATES[1], _DATES[4])
+        assert fetcher.fetch("a", range_) == _table(range_)
+        assert inner.method_calls == [call.fetch("a", range_)]
+
+    def test_when_cached(
+        self,
+        fetcher: CachingDataPointsFetcher,
+        inner: MagicMock,
+    ) -> None:
+        range_ = (_DATES[1], _DATES[4])
+        fetcher.fetch("a", range_)
+        assert fetcher.fetch("a", range_) == _table(range_)
+        assert fetcher.fetch("a", (_DATES[2], _DATES[3])) == _table(
+            (_DATES[2], _DATES[3])
+        )
+        assert inner.fetch.call_count == 1
+
+    def test_fetches_missing_runs_only(
+        self,
+        fetcher: CachingDataPointsFetcher,
+        inner: MagicMock,
+    ) -> None:
+        fetcher.fetch("a", (_DATES[2], _DATES[4]))
+        fetcher.fetch("a", (_DATES[6], _DATES[7]))
+        inner.reset_mock()
+        range_ = (_DATES[0], _DATES[9])
+        assert fetcher.fetch("a", range_) == _table(range_)
+        assert inner.method_calls == [
+            call.fetch("a", (_DATES[0], _DATES[2])),
+            call.fetch("a", (_DATES[4], _DATES[6])),
+            call.fetch("a", (_DATES[7], _DATES[9])),
+        ]
+
+    def test_caches_by_identifier(
+        self,
+        fetcher: CachingDataPointsFetcher,
+        inner: MagicMock,
+    ) -> None:
+        range_ = (_DATES[1], _DATES[4])
+        fetcher.fetch("a", range_)
+        fetcher.fetch("b", range_)
+        assert inner.method_calls == [
+            call.fetch("a", range_),
+            call.fetch("b", range_),
+        ]
+
+    def test_when_range_without_period(
+        self,
+        fetcher: CachingDataPointsFetcher,
+    ) -> None:
+        with pytest.raises(ValueError, match="period"):
+            fetcher.fetch("a", (_DATES[1], _DATES[1]))
+
+    def test_when_fetched_length_mismatch(self) -> None:
+        inner = MagicMock(
+            spec=IDataPointsFetcher,
+            **{"fetch.return_value": WeightedPricedPointsTable([])},
+        )
+        fetcher = CachingDataPointsFetcher(inner, _Calendar(), 10**9)
+        with pytest.raises(RuntimeError, match="period"):
+            fetcher.fetch("a", (_DATES[1], _DATES[4]))
+
+
+class TestCachingDataPointsFetcherEviction:
+    @pytest.fixture
+    def size(self) -> int:
+        return _SEQUENCES[_DATES[0], _DATES[1]].deep_sizeof()
+
+    def test_evicts_least_recently_used(
+        self,
+        inner: MagicMock,
+        size: int,
+    ) -> None:
+        fetcher = CachingDataPointsFetcher(inner, _Calendar(), 2 * size)
+        fetcher.fetch("a", (_DATES[0], _DATES[1]))
+        fetcher.fetch("a", (_DATES[1], _DATES[2]))
+        fetcher.fetch("a", (_DATES[0], _DATES[1]))  # most recently used
+        fetcher.fetch("a", (_DATES[2], _DATES[3]))  # evicts second period
+        assert fetcher.size <= 2 * size
+        inner.reset_mock()
+        fetcher.fetch("a", (_DATES[0], _DATES[1]))
+        fetcher.fetch("a", (_DATES[1], _DATES[2]))
+        calls: List[object] = [call.fetch("a", (_DATES[1], _DATES[2]))]
+        assert inner.method_calls == calls
+
+    def test_when_budget_is_zero(self, inner: MagicMock) -> None:
+        fetcher = CachingDataPointsFetcher(inner, _Calendar(), 0)
+        range_ = (_DATES[0], _DATES[2])
+        assert fetcher.fetch("a", range_) == _table(range_)
+        assert fetcher.fetch("a", range_) == _table(range_)
+        assert inner.fetch.call_count == 2
+        assert fetcher.size == 0
+
+    def test_clear(self, fetcher: CachingDataPointsFetcher) -> None:
+        fetcher.fetch("a", (_DATES[0], _DATES[2]))
+        assert fetcher.size > 0
+        fetcher.clear()
+        assert fetcher.size == 0
+
+
+class TestCachingDataPointsFetcherFetchMany:
+    def test_when_not_cached(
+        self,
+        fetcher: CachingDataPointsFetcher,
+        inner: MagicMock,
+    ) -> None:
+        range_ = (_DATES[1], _DATES[4])
+        assert fetcher.fetch_many(["a", "b"], range_) == {
+            "a": _table(range_),
+            "b": _table(range_),
+        }
+        assert inner.method_calls == [call.fetch_many(["a", "b"], range_)]
+
+    def test_caches(
+        self,
+        fetcher: CachingDataPointsFetcher,
+        inner: MagicMock,
+    ) -> None:
+        range_ = (_DATES[1], _DATES[4])
+        fetcher.fetch_many(["a", "b"], range_)
+        inner.reset_mock()
+        assert fetcher.fetch("b", range_) == _table(range_)
+        assert fetcher.fetch_many(["a"], range_) == {"a": _table(range_)}
+        assert inner.method_calls == []
+
+    def test_when_partially_cached(
+        self,
+        fetcher: CachingDataPointsFetcher,
+        inner: MagicMock,
+    ) -> None:
+        fetcher.fetch("a", (_DATES[1], _DATES[2]))
+        inner.reset_mock()
+        range_ = (_DATES[1], _DATES[4])
+        assert fetcher.fetch_many(["a", "b", "a"], range_) == {
+            "a": _table(range_),
+            "b": _table(range_),
+        }
+        assert inner.method_calls == [
+            call.fetch_many(["b"], range_),
+            call.fetch("a", (_DATES[2], _DATES[4])),
+        ]
+
+    def test_when_range_without_period(
+        self,
+        fetcher: CachingDataPointsFetcher,
+    ) -> None:
+        with pytest.raises(ValueError, match="period"):
+            fetcher.fetch_many(["a"], (_DATES[1], _DATES[1]))
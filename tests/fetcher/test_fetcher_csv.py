@@ -0,0 +1,235 @@
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from bperf.calendar import IBusinessCalendar
+from bperf.curve import SpotCurve
+from bperf.fetcher import CsvDataPointsFetcher
+from bperf.flows import Flows
+from bperf.money import Money
+from bperf.percent import Percent
+from bperf.priced import PricedFlows
+from bperf.priced.points import PricedPoints
+from bperf.priced.points.weighted import WeightedPricedPoints
+from bperf.priced.points.weighted.sequence import WeightedPricedPointsSequence
+from bperf.priced.points.weighted.table import WeightedPricedPointsTable
+from bperf.rate.continuous import ContinuousRate
+from bperf.term import Term
+from bperf.termed import Termed
+
+_DATES = ("2022-05-10", "2022-05-11", "2022-05-12")
+_RANGE = (_DATES[0], _DATES[-1])
+
+
+class _Calendar(IBusinessCalendar):
+    def dates(self, range_: Tuple[str, str]) -> Tuple[str, ...]:
+        start, end = range_
+        return tuple(date for date in _DATES if start <= date <= end)
+
+
+def _curve(day: int) -> SpotCurve:
+    return SpotCurve(
+        [
+            Termed(Term(1.0), ContinuousRate(0.01 + 0.001 * day)),
+            Termed(Term(2.0), ContinuousRate(0.02 + 0.001 * day)),
+        ]
+    )
+
+
+def _flows(day: int, cents: int) -> Flows:
+    return Flows(
+        [
+            Termed(Term(1.0 - 0.01 * day), Money(cents // 10)),
+            Termed(Term(2.0 - 0.01 * day), Money(cents)),
+        ]
+    )
+
+
+def _priced(day: int, cents: int) -> PricedFlows:
+    return PricedFlows(_flows(day, cents), _curve(day), ContinuousRate(0.001))
+
+
+def _points(weight: int, start: int, cents: int) -> WeightedPricedPoints:
+    return WeightedPricedPoints(
+        Percent(weight),
+        PricedPoints(_priced(start, cents), _priced(start + 1, cents)),
+    )
+
+
+def _write(path: Path, header: str, lines: List[str]) -> None:
+    path.write_text("".join(f"{line}\n" for line in [header, *lines]))
+
+
+@pytest.fixture
+def directory(tmp_path: Path) -> Path:
+    curves: List[str] = []
+    securities: List[str] = []
+    flows: List[str] = []
+    for day, date in enumerate(_DATES):
+        curves.extend(
+            f"{float(termed.value)!r},govt,{date},{float(termed.term)!r}"
+            for termed in _curve(day)
+        )
+        for security, cents in (("bond", 10000), ("note", 5000)):
+            securities.append(f"{security},{date},govt,0.001")
+            flows.extend(
+                f"{security},{date},{float(termed.term)!r},"
+                f"{termed.value.scaled}"
+                for termed in _flows(day, cents)
+            )
+    _write(tmp_path / "curves.csv", "rate,curve,date,tenor", curves)
+    _write(
+        tmp_path / "securities.csv", "security,date,curve,spread", securities
+    )
+    _write(tmp_path / "flows.csv", "security,date,term,cents", flows)
+    _write(
+        tmp_path / "positions.csv",
+        "identifier,date,security,weight",
+        [
+            f"alpha,{_DATES[0]},bond,10000",
+            f"alpha,{_DATES[1]},note,6000",
+            f"alpha,{_DATES[1]},bond,4000",
+            f"beta,{_DATES[0]},note,10000",
+            f"beta,{_DATES[1]},note,10000",
+            f"gamma,{_DATES[2]},note,10000",
+        ],
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def fetcher(directory: Path) -> CsvDataPointsFetcher:
+    return CsvDataPointsFetcher(directory, _Calendar())
+
+
+_ALPHA = WeightedPricedPointsTable(
+    [
+        WeightedPricedPointsSequence([_points(10000, 0, 10000)]),
+        WeightedPricedPointsSequence(
+            [_points(4000, 1, 10000), _points(6000, 1, 5000)]
+        ),
+    ]
+)
+_BETA = WeightedPricedPointsTable(
+    [
+        WeightedPricedPointsSequence([_points(10000, 0, 5000)]),
+        WeightedPricedPointsSequence([_points(10000, 1, 5000)]),
+    ]
+)
+
+
+class TestCsvDataPointsFetcherInvariants:
+    def test_when_chunk_is_not_positive(self, directory: Path) -> None:
+        with pytest.raises(ValueError, match="chunk"):
+            CsvDataPointsFetcher(directory, _Calendar(), chunk=0)
+
+
+class TestCsvDataPointsFetcherFetch:
+    def test(self, fetcher: CsvDataPointsFetcher) -> None:
+        assert fetcher.fetch("alpha", _RANGE) == _ALPHA
+
+    @pytest.mark.parametrize("chunk", [1, 2, 5])
+    def test_when_streamed(self, directory: Path, chunk: int) -> None:
+        fetcher = CsvDataPointsFetcher(directory, _Calendar(), chunk=chunk)
+        assert fetcher.fetch("alpha", _RANGE) == _ALPHA
+
+    def test_when_partial_range(self, fetcher: CsvDataPointsFetcher) -> None:
+        assert fetcher.fetch("alpha", (_DATES[1], _DATES[2])) == _ALPHA[1:]
+
+    def test_when_unknown_identifier(
+        self, fetcher: CsvDataPointsFetcher
+    ) -> None:
+        with pytest.raises(ValueError, match="joker"):
+            fetcher.fetch("joker", _RANGE)
+
+    def test_when_no_period(self, fetcher: CsvDataPointsFetcher) -> None:
+        with pytest.raises(ValueError, match="period"):
+            fetcher.fetch("alpha", (_DATES[0], _DATES[0]))
+
+    def test_when_security_missing(
+        self, directory: Path, fetcher: CsvDataPointsFetcher
+    ) -> None:
+        _write(directory / "securities.csv", "security,date,curve,spread", [])
+        with pytest.raises(RuntimeError, match="bond"):
+            fetcher.fetch("alpha", _RANGE)
+
+    def test_when_curve_missing(
+        self, directory: Path, fetcher: CsvDataPointsFetcher
+    ) -> None:
+        _write(directory / "curves.csv", "curve,date,tenor,rate", [])
+        with pytest.raises(RuntimeError, match="govt"):
+            fetcher.fetch("alpha", _RANGE)
+
+    def test_when_matured(
+        self, directory: Path, fetcher: CsvDataPointsFetcher
+    ) -> None:
+        _write(
+            directory / "flows.csv",
+            "security,date,term,cents",
+            [
+                f"note,{date},{float(termed.term)!r},{termed.value.scaled}"
+                for day, date in enumerate(_DATES[:2])
+                for termed in _flows(day, 5000)
+            ],
+        )
+        table = fetcher.fetch("beta", _RANGE)
+        assert table[0] == _BETA[0]
+        assert len(table[1][0].points.final.flows) == 0
+
+    def test_when_column_missing(
+        self, directory: Path, fetcher: CsvDataPointsFetcher
+    ) -> None:
+        _write(directory / "flows.csv", "security,date,term", [])
+        with pytest.raises(RuntimeError, match="cents"):
+            fetcher.fetch("alpha", _RANGE)
+
+    def test_when_malformed(
+        self, directory: Path, fetcher: CsvDataPointsFetcher
+    ) -> None:
+        _write(
+            directory / "positions.csv",
+            "identifier,date,security,weight",
+            [f"alpha,{_DATES[0]},bond,10000", f"alpha,{_DATES[1]}"],
+        )
+        with pytest.raises(RuntimeError, match="malformed"):
+            fetcher.fetch("alpha", _RANGE)
+
+    def test_when_invalid_value(
+        self, directory: Path, fetcher: CsvDataPointsFetcher
+    ) -> None:
+        _write(
+            directory / "positions.csv",
+            "identifier,date,security,weight",
+            [f"alpha,{_DATES[0]},bond,all"],
+        )
+        with pytest.raises(RuntimeError, match="all"):
+            fetcher.fetch("alpha", _RANGE)
+
+    def test_when_cents_overflow(
+        self, directory: Path, fetcher: CsvDataPointsFetcher
+    ) -> None:
+        _write(
+            directory / "flows.csv",
+            "security,date,term,cents",
+            [f"bond,{date},1.0,{10 ** 20}" for date in _DATES],
+        )
+        with pytest.raises(RuntimeError, match="too large"):
+            fetcher.fetch("alpha", _RANGE)
+
+
+class TestCsvDataPointsFetcherFetchMany:
+    def test(self, fetcher: CsvDataPointsFetcher) -> None:
+        tables = fetcher.fetch_many(["beta", "alpha"], _RANGE)
+        assert tables == {"alpha": _ALPHA, "beta": _BETA}
+
+    def test_shares_curves(self, fetcher: CsvDataPointsFetcher) -> None:
+        tables = fetcher.fetch_many(["alpha", "beta"], _RANGE)
+        alpha, beta = tables["alpha"][0][0], tables["beta"][0][0]
+        assert alpha.points.final.spot is beta.points.final.spot
+
+    def test_when_unknown_identifier(
+        self, fetcher: CsvDataPointsFetcher
+    ) -> None:
+        with pytest.raises(ValueError, match="joker"):
+            fetcher.fetch_many(["alpha", "joker"], _RANGE)
@@ -0,0 +1,13 @@
+from unittest.mock import MagicMock
+
+from bperf.fetcher import DailyDataPointsFetcher
+from bperf.storage import DailyPointsStore
+
+
+class TestDailyDataPointsFetcherFetch:
+    def test(self) -> None:
+        store = MagicMock(spec=DailyPointsStore)
+        fetcher = DailyDataPointsFetcher(store)
+        range_ = ("2022-05-10", "2022-05-12")
+        assert fetcher.fetch("alpha", range_) is store.read.return_value
+        store.read.assert_called_once_with("alpha", range_)
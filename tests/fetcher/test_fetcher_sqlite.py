@@ -0,0 +1,266 @@
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Tuple
+
+import pytest
+
+from bperf.calendar import IBusinessCalendar
+from bperf.curve import SpotCurve
+from bperf.fetcher import SqliteDataPointsFetcher
+from bperf.flows import Flows
+from bperf.money import Money
+from bperf.percent import Percent
+from bperf.priced import PricedFlows
+from bperf.priced.points import PricedPoints
+from bperf.priced.points.weighted import WeightedPricedPoints
+from bperf.priced.points.weighted.sequence import WeightedPricedPointsSequence
+from bperf.priced.points.weighted.table import WeightedPricedPointsTable
+from bperf.rate.continuous import ContinuousRate
+from bperf.term import Term
+from bperf.termed import Termed
+
+_DATES = ("2022-05-10", "2022-05-11", "2022-05-12")
+_RANGE = (_DATES[0], _DATES[-1])
+
+
+class _Calendar(IBusinessCalendar):
+    def dates(self, range_: Tuple[str, str]) -> Tuple[str, ...]:
+        start, end = range_
+        return tuple(date for date in _DATES if start <= date <= end)
+
+
+def _curve(day: int) -> SpotCurve:
+    return SpotCurve(
+        [
+            Termed(Term(1.0), ContinuousRate(0.01 + 0.001 * day)),
+            Termed(Term(2.0), ContinuousRate(0.02 + 0.001 * day)),
+        ]
+    )
+
+
+def _flows(day: int, cents: int) -> Flows:
+    return Flows(
+        [
+            Termed(Term(1.0 - 0.01 * day), Money(cents // 10)),
+            Termed(Term(2.0 - 0.01 * day), Money(cents)),
+        ]
+    )
+
+
+def _priced(day: int, cents: int) -> PricedFlows:
+    return PricedFlows(_flows(day, cents), _curve(day), ContinuousRate(0.001))
+
+
+def _points(weight: int, start: int, cents: int) -> WeightedPricedPoints:
+    return WeightedPricedPoints(
+        Percent(weight),
+        PricedPoints(_priced(start, cents), _priced(start + 1, cents)),
+    )
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    path = tmp_path / "points.sqlite"
+    SqliteDataPointsFetcher(path, _Calendar()).close()
+    with sqlite3.connect(path) as connection:
+        for day, date in enumerate(_DATES):
+            connection.executemany(
+                "INSERT INTO curves VALUES ('govt', ?, ?, ?)",
+                [
+                    (date, float(termed.term), float(termed.value))
+                    for termed in _curve(day)
+                ],
+            )
+            for security, cents in (("bond", 10000), ("note", 5000)):
+                connection.execute(
+                    "INSERT INTO securities VALUES (?, ?, 'govt', 0.001)",
+                    (security, date),
+                )
+                connection.executemany(
+                    "INSERT INTO flows VALUES (?, ?, ?, ?)",
+                    [
+                        (
+                            security,
+                            date,
+                            float(termed.term),
+                            termed.value.scaled,
+                        )
+                        for termed in _flows(day, cents)
+                    ],
+                )
+        connection.executemany(
+            "INSERT INTO positions VALUES (?, ?, ?, ?)",
+            [
+                ("alpha", _DATES[0], "bond", 10000),
+                ("alpha", _DATES[1], "bond", 4000),
+                ("alpha", _DATES[1], "note", 6000),
+                ("beta", _DATES[0], "note", 10000),
+                ("beta", _DATES[1], "note", 10000),
+            ],
+        )
+    connection.close()
+    return path
+
+
+@pytest.fixture
+def fetcher(path: Path) -> SqliteDataPointsFetcher:
+    return SqliteDataPointsFetcher(path, _Calendar())
+
+
+_ALPHA = WeightedPricedPointsTable(
+    [
+        WeightedPricedPointsSequence([_points(10000, 0, 10000)]),
+        WeightedPricedPointsSequence(
+            [_points(4000, 1, 10000), _points(6000, 1, 5000)]
+        ),
+    ]
+)
+_BETA = WeightedPricedPointsTable(
+    [
+        WeightedPricedPointsSequence([_points(10000, 0, 5000)]),
+        WeightedPricedPointsSequence([_points(10000, 1, 5000)]),
+    ]
+)
+
+
+class TestSqliteDataPointsFetcherInvariants:
+    def test_when_in_memory(self) -> None:
+        with pytest.raises(ValueError, match="file"):
+            SqliteDataPointsFetcher(":memory:", _Calendar())
+
+    def test_creates_schema(self, tmp_path: Path) -> None:
+        path = tmp_path / "empty.sqlite"
+        SqliteDataPointsFetcher(path, _Calendar()).close()
+        with sqlite3.connect(path) as connection:
+            names = {
+                name
+                for name, in connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                )
+            }
+        connection.close()
+        assert names == {"positions", "securities", "flows", "curves"}
+
+
+class TestSqliteDataPointsFetcherFetch:
+    def test(self, fetcher: SqliteDataPointsFetcher) -> None:
+        assert fetcher.fetch("alpha", _RANGE) == _ALPHA
+
+    def test_when_partial_range(self, fetcher: SqliteDataPointsFetcher) -> None:
+        assert fetcher.fetch("alpha", (_DATES[1], _DATES[2])) == _ALPHA[1:]
+
+    def test_when_unknown_identifier(
+        self, fetcher: SqliteDataPointsFetcher
+    ) -> None:
+        with pytest.raises(ValueError, match="joker"):
+            fetcher.fetch("joker", _RANGE)
+
+    def test_when_no_period(self, fetcher: SqliteDataPointsFetcher) -> None:
+        with pytest.raises(ValueError, match="period"):
+            fetcher.fetch("alpha", (_DATES[0], _DATES[0]))
+
+    def test_when_security_missing(
+        self, path: Path, fetcher: SqliteDataPointsFetcher
+    ) -> None:
+        with sqlite3.connect(path) as connection:
+            connection.execute("DELETE FROM securities WHERE security = 'note'")
+        connection.close()
+        with pytest.raises(RuntimeError, match="note"):
+            fetcher.fetch("alpha", _RANGE)
+
+    def test_when_curve_missing(
+        self, path: Path, fetcher: SqliteDataPointsFetcher
+    ) -> None:
+        with sqlite3.connect(path) as connection:
+            connection.execute(
+                "DELETE FROM curves WHERE date = ?", (_DATES[2],)
+            )
+        connection.close()
+        with pytest.raises(RuntimeError, match="govt"):
+            fetcher.fetch("alpha", _RANGE)
+
+    def test_when_weights_invalid(
+        self, path: Path, fetcher: SqliteDataPointsFetcher
+    ) -> None:
+        with sqlite3.connect(path) as connection:
+            connection.execute("UPDATE positions SET weight = 5000")
+        connection.close()
+        with pytest.raises(RuntimeError, match="weights"):
+            fetcher.fetch("alpha", _RANGE)
+
+    def test_when_cents_overflow(
+        self, path: Path, fetcher: SqliteDataPointsFetcher
+    ) -> None:
+        with sqlite3.connect(path) as connection:
+            connection.execute("UPDATE flows SET cents = 1e20")
+        connection.close()
+        with pytest.raises(RuntimeError, match="too large"):
+            fetcher.fetch("alpha", _RANGE)
+
+    def test_when_matured(
+        self, path: Path, fetcher: SqliteDataPointsFetcher
+    ) -> None:
+        with sqlite3.connect(path) as connection:
+            connection.execute("DELETE FROM flows WHERE date = ?", (_DATES[2],))
+        connection.close()
+        table = fetcher.fetch("beta", _RANGE)
+        assert table[0] == _BETA[0]
+        assert len(table[1][0].points.final.flows) == 0
+
+
+class TestSqliteDataPointsFetcherFetchMany:
+    def test(self, fetcher: SqliteDataPointsFetcher) -> None:
+        tables = fetcher.fetch_many(["beta", "alpha"], _RANGE)
+        assert tables == {"alpha": _ALPHA, "beta": _BETA}
+
+    def test_when_duplicated_identifiers(
+        self, fetcher: SqliteDataPointsFetcher
+    ) -> None:
+        tables = fetcher.fetch_many(["alpha", "alpha"], _RANGE)
+        assert tables == {"alpha": _ALPHA}
+
+    def test_shares_curves(self, fetcher: SqliteDataPointsFetcher) -> None:
+        tables = fetcher.fetch_many(["alpha", "beta"], _RANGE)
+        alpha, beta = tables["alpha"][0][0], tables["beta"][0][0]
+        assert alpha.points.final.spot is beta.points.final.spot
+
+    def test_when_unknown_identifier(
+        self, fetcher: SqliteDataPointsFetcher
+    ) -> None:
+        with pytest.raises(ValueError, match="joker"):
+            fetcher.fetch_many(["alpha", "joker"], _RANGE)
+
+    def test_from_threads(self, fetcher: SqliteDataPointsFetcher) -> None:
+        with ThreadPoolExecutor(4) as executor:
+            tables = list(
+                executor.map(
+                    lambda identifier: fetcher.fetch(identifier, _RANGE),
+                    ["alpha", "beta"] * 8,
+                )
+            )
+        assert tables == [_ALPHA, _BETA] * 8
+
+
+class TestSqliteDataPointsFetcherLocking:
+    def test_allows_writes_after_fetch(
+        self,
+        fetcher: SqliteDataPointsFetcher,
+        path: Path,
+    ) -> None:
+        fetcher.fetch("alpha", _RANGE)
+        connection = sqlite3.connect(path, timeout=0.0)
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT INTO securities VALUES "
+                    "('bill', '2022-05-10', 'govt', 0.0)"
+                )
+        finally:
+            connection.close()
+
+
+class TestSqliteDataPointsFetcherClose:
+    def test_reopens(self, fetcher: SqliteDataPointsFetcher) -> None:
+        fetcher.close()
+        assert fetcher.fetch("beta", _RANGE) == _BETA
@@ -1,4 +1,5 @@
 from math import isclose
+from unittest.mock import patch
 
 import pytest
 
@@ -140,3 +141,44 @@ class TestTwoPointsCarryEffectCalculator:
         points = PricedPoints(initial, final)
         result = calculator.calculate(points)
         assert isclose(result, expected, rel_tol=1e-8, abs_tol=1e-8)
+
+    def test_reprices_with(
+        self,
+        calculator: TwoPointsCarryEffectCalculator,
+    ) -> None:
+        assert calculator.reprices_with() == (True, False, False)
+
+    def test_reprice(
+        self,
+        calculator: TwoPointsCarryEffectCalculator,
+        initial: PricedFlows,
+        offset: ContinuousRate,
+    ) -> None:
+        final = PricedFlows(
+            Flows([Termed(Term(1.0), Money(-1))]),
+            initial.spot.add(offset),
+            initial.spread + offset,
+        )
+        points = PricedPoints(initial, final)
+        assert calculator.reprice(points) == (
+            initial.update_flows(final.flows),
+            points.payments,
+        )
+
+    def test_when_unchanged(
+        self,
+        calculator: TwoPointsCarryEffectCalculator,
+        initial: PricedFlows,
+        offset: ContinuousRate,
+    ) -> None:
+        final = PricedFlows(
+            initial.flows,
+            initial.spot.add(offset),
+            initial.spread + offset,
+        )
+        points = PricedPoints(initial, final)
+        assert calculator.reprice(points) == (initial, Money(0))
+        assert calculator.reprice(points)[0] is initial
+        with patch.object(Flows, "pv") as mocked:
+            assert calculator.calculate(points) == PeriodicRate(0.0)
+        mocked.assert_not_called()
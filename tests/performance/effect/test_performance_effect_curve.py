@@ -1,4 +1,5 @@
 from math import isclose
+from unittest.mock import patch
 
 import pytest
 
@@ -79,3 +80,44 @@ class TestTwoPointsCurveEffectCalculator:
         result = calculator.calculate(points)
         expected = PeriodicRate(0.0399908472461074)
         assert isclose(result, expected, rel_tol=1e-8, abs_tol=1e-8)
+
+    def test_reprices_with(
+        self,
+        calculator: TwoPointsCurveEffectCalculator,
+    ) -> None:
+        assert calculator.reprices_with() == (False, True, False)
+
+    def test_reprice(
+        self,
+        calculator: TwoPointsCurveEffectCalculator,
+        initial: PricedFlows,
+        offset: ContinuousRate,
+    ) -> None:
+        final = PricedFlows(
+            Flows([Termed(Term(1.0), Money(-1))]),
+            initial.spot.add(offset),
+            initial.spread + offset,
+        )
+        points = PricedPoints(initial, final)
+        assert calculator.reprice(points) == (
+            initial.update_spot(final.spot),
+            Money(0),
+        )
+
+    def test_when_unchanged(
+        self,
+        calculator: TwoPointsCurveEffectCalculator,
+        initial: PricedFlows,
+        offset: ContinuousRate,
+    ) -> None:
+        final = PricedFlows(
+            Flows([Termed(Term(1.0), Money(-1))]),
+            SpotCurve.from_tuples(zip(initial.spot.terms, initial.spot.rates)),
+            initial.spread + offset,
+        )
+        points = PricedPoints(initial, final)
+        assert calculator.reprice(points) == (initial, Money(0))
+        assert calculator.reprice(points)[0] is initial
+        with patch.object(Flows, "pv") as mocked:
+            assert calculator.calculate(points) == PeriodicRate(0.0)
+        mocked.assert_not_called()
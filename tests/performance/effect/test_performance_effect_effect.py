@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 from unittest.mock import MagicMock, call, patch
 
@@ -23,6 +24,7 @@ from bperf.priced.points.weighted.table import WeightedPricedPointsTable
 from bperf.priced.priced import PricedFlows
 from bperf.rate.continuous import ContinuousRate
 from bperf.rate.periodic import PeriodicRate
+from bperf.rate.periodic.sequence import PeriodicRateSequence
 from bperf.term import Term
 from bperf.termed import Termed
 
@@ -83,11 +85,21 @@ class TestITwoPointsEffectCalculator:
 
 
 class TestIEffectsCalculator:
+    def test_names(self) -> None:
+        calculator = IEffectsCalculator()
+        with pytest.raises(NotImplementedError):
+            calculator.names
+
     def test(self, table: WeightedPricedPointsTable) -> None:
         calculator = IEffectsCalculator()
         with pytest.raises(NotImplementedError):
             calculator.calculate(table)
 
+    def test_rates(self, table: WeightedPricedPointsTable) -> None:
+        calculator = IEffectsCalculator()
+        with pytest.raises(NotImplementedError):
+            calculator.rates(table)
+
 
 class TestEffectsCalculatorInvariants:
     def test_frozen(self) -> None:
@@ -153,3 +165,131 @@ class TestEffectsCalculatorCalculate:
         assert calculator.calculate(table) == expected
         for mock in calculators.values():
             assert mock.method_calls == [call.calculate(table)]
+
+    def test_names(self) -> None:
+        calculators = {
+            name: MagicMock(spec=LongitudinalPerformanceCalculator)
+            for name in ("one", "two")
+        }
+        calculator = EffectsCalculator(calculators)  # type: ignore[arg-type]
+        assert calculator.names == ("one", "two")
+
+    def test_when_outputs(
+        self,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        calculators = {
+            name: MagicMock(
+                spec=LongitudinalPerformanceCalculator,
+                **{"calculate.return_value": self._EFFECT},
+            )
+            for name in ("one", "two")
+        }
+        calculator = EffectsCalculator(calculators)  # type: ignore[arg-type]
+        assert calculator.calculate(table, outputs=["two"]) == {
+            "two": self._PERCENT,
+        }
+        assert calculators["one"].method_calls == []
+        assert calculators["two"].method_calls == [call.calculate(table)]
+
+    def test_with_executor(
+        self,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        expected = {"one": self._PERCENT, "two": Percent(3)}
+        calculators = {
+            name: MagicMock(
+                spec=LongitudinalPerformanceCalculator,
+                **{"calculate.return_value": PeriodicRate(effect)},
+            )
+            for name, effect in expected.items()
+        }
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            calculator = EffectsCalculator(
+                calculators,  # type: ignore[arg-type]
+                executor=executor,
+            )
+            effects = calculator.calculate(table)
+        assert effects == expected
+        assert list(effects) == list(expected)
+
+    def test_with_executor_when_errors(
+        self,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        calculators = {
+            name: MagicMock(
+                spec=LongitudinalPerformanceCalculator,
+                **{"calculate.side_effect": OverflowError(name)},
+            )
+            for name in ("one", "two")
+        }
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            calculator = EffectsCalculator(
+                calculators,  # type: ignore[arg-type]
+                executor=executor,
+            )
+            with pytest.raises(OverflowError, match="one"):
+                calculator.calculate(table)
+
+    def test_when_unknown_outputs(
+        self,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        calculator = EffectsCalculator({})
+        with pytest.raises(ValueError, match="outputs"):
+            calculator.calculate(table, outputs=["unknown"])
+
+
+class TestEffectsCalculatorRates:
+    def test_when_no_calculators(
+        self,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        calculator = EffectsCalculator({})
+        assert calculator.rates(table) == {}
+
+    def test_when_multiple_calculators(
+        self,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        expected = {
+            "one": PeriodicRateSequence([PeriodicRate(0.01)]),
+            "two": PeriodicRateSequence([PeriodicRate(0.02)]),
+        }
+        calculators = {
+            name: MagicMock(
+                spec=LongitudinalPerformanceCalculator,
+                **{"rates.return_value": rates},
+            )
+            for name, rates in expected.items()
+        }
+        calculator = EffectsCalculator(calculators)  # type: ignore[arg-type]
+        assert calculator.rates(table) == expected
+        assert list(calculator.rates(table)) == list(expected)
+        for mock in calculators.values():
+            assert mock.method_calls == [call.rates(table)] * 2
+
+    def test_with_executor(
+        self,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        expected = {
+            "one": PeriodicRateSequence([PeriodicRate(0.01)]),
+            "two": PeriodicRateSequence([PeriodicRate(0.02)]),
+        }
+        calculators = {
+            name: MagicMock(
+                spec=LongitudinalPerformanceCalculator,
+                **{"rates.return_value": rates},
+            )
+            for name, rates in expected.items()
+        }
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            calculator = EffectsCalculator(
+                calculators,  # type: ignore[arg-type]
+                executor=executor,
+            )
+            rates = calculator.rates(table)
+        assert rates == expected
+        assert list(rates) == list(expected)
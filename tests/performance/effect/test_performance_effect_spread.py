@@ -1,4 +1,5 @@
 from math import isclose
+from unittest.mock import patch
 
 import pytest
 
@@ -76,3 +77,44 @@ class TestTwoPointsSpreadEffectCalculator:
         result = calculator.calculate(points)
         expected = PeriodicRate(-0.171016327678981)
         assert isclose(result, expected, rel_tol=1e-8, abs_tol=1e-8)
+
+    def test_reprices_with(
+        self,
+        calculator: TwoPointsSpreadEffectCalculator,
+    ) -> None:
+        assert calculator.reprices_with() == (False, False, True)
+
+    def test_reprice(
+        self,
+        calculator: TwoPointsSpreadEffectCalculator,
+        initial: PricedFlows,
+        offset: ContinuousRate,
+    ) -> None:
+        final = PricedFlows(
+            Flows([Termed(Term(1.0), Money(-1))]),
+            initial.spot.add(offset),
+            initial.spread + offset,
+        )
+        points = PricedPoints(initial, final)
+        assert calculator.reprice(points) == (
+            initial.update_spread(final.spread),
+            Money(0),
+        )
+
+    def test_when_unchanged(
+        self,
+        calculator: TwoPointsSpreadEffectCalculator,
+        initial: PricedFlows,
+        offset: ContinuousRate,
+    ) -> None:
+        final = PricedFlows(
+            Flows([Termed(Term(1.0), Money(-1))]),
+            initial.spot.add(offset),
+            initial.spread + ContinuousRate(0.0),
+        )
+        points = PricedPoints(initial, final)
+        assert calculator.reprice(points) == (initial, Money(0))
+        assert calculator.reprice(points)[0] is initial
+        with patch.object(Flows, "pv") as mocked:
+            assert calculator.calculate(points) == PeriodicRate(0.0)
+        mocked.assert_not_called()
@@ -1,3 +1,5 @@
+from math import isclose
+from typing import Any, Type
 from unittest.mock import MagicMock, call, patch
 
 import pytest
@@ -6,13 +8,20 @@ from bperf.curve import SpotCurve
 from bperf.flows import Flows
 from bperf.money import Money
 from bperf.percent import Percent
+from bperf.performance.effect.carry import TwoPointsCarryEffectCalculator
+from bperf.performance.effect.curve import TwoPointsCurveEffectCalculator
+from bperf.performance.effect.spread import TwoPointsSpreadEffectCalculator
 from bperf.performance.generic import (
     CrossSectionalPerformanceCalculator,
+    HoldingsLongitudinalPerformanceCalculator,
     ITwoPointsPerformanceCalculator,
     LongitudinalPerformanceCalculator,
+    MatrixCrossSectionalPerformanceCalculator,
 )
+from bperf.performance.total import TwoPointsTotalPerformanceCalculator
 from bperf.priced.points import PricedPoints
 from bperf.priced.points.weighted import WeightedPricedPoints
+from bperf.priced.points.weighted.holdings import WeightedPricedPointsHoldings
 from bperf.priced.points.weighted.sequence import WeightedPricedPointsSequence
 from bperf.priced.points.weighted.table import WeightedPricedPointsTable
 from bperf.priced.priced import PricedFlows
@@ -71,12 +80,27 @@ def table(sequence: WeightedPricedPointsSequence) -> WeightedPricedPointsTable:
     return WeightedPricedPointsTable([sequence, sequence[::-1]])
 
 
+class _DoubledTotalPerformanceCalculator(TwoPointsTotalPerformanceCalculator):
+    # overrides calculate only, hence doesn't reprice as reported
+    def calculate(self, points: PricedPoints) -> PeriodicRate:
+        return PeriodicRate(2.0 * float(super().calculate(points)))
+
+
 class TestITwoPointsPerformanceCalculator:
     def test(self, points: PricedPoints) -> None:
         calculator = ITwoPointsPerformanceCalculator()
         with pytest.raises(NotImplementedError):
             calculator.calculate(points)
 
+    def test_reprice(self, points: PricedPoints) -> None:
+        calculator = ITwoPointsPerformanceCalculator()
+        with pytest.raises(NotImplementedError):
+            calculator.reprice(points)
+
+    def test_reprices_with(self) -> None:
+        calculator = ITwoPointsPerformanceCalculator()
+        assert calculator.reprices_with() is None
+
 
 class TestCrossSectionalPerformanceCalculator:
     _RATES = PeriodicRateSequence(
@@ -103,6 +127,150 @@ class TestCrossSectionalPerformanceCalculator:
         assert calculator.calculate(sequence) == expected
         assert mocked.mock_calls == [call(points) for points in sequence.points]
 
+    @pytest.mark.parametrize(
+        "cross",
+        [
+            CrossSectionalPerformanceCalculator,
+            MatrixCrossSectionalPerformanceCalculator,
+        ],
+    )
+    def test_when_initial_price_is_zero(
+        self,
+        cross: Type[CrossSectionalPerformanceCalculator[Any]],
+        initial: PricedFlows,
+    ) -> None:
+        zero = initial.update_flows(Flows([Termed(Term(1.0), Money(0))]))
+        sequence = WeightedPricedPointsSequence(
+            [
+                WeightedPricedPoints(
+                    Percent(10000),
+                    PricedPoints(zero, initial, deferred=True),
+                ),
+            ]
+        )
+        calculator = cross(TwoPointsTotalPerformanceCalculator())
+        with pytest.raises(ValueError, match="initial price"):
+            calculator.calculate(sequence)
+
+
+class TestCrossSectionalPerformanceCalculatorRepricesWith:
+    def test(self) -> None:
+        calculator = CrossSectionalPerformanceCalculator(
+            TwoPointsCarryEffectCalculator()
+        )
+        assert calculator.reprices_with() == (True, False, False)
+
+    def test_when_sub_calculator_does_not_reprice(self) -> None:
+        calculator = CrossSectionalPerformanceCalculator(
+            ITwoPointsPerformanceCalculator()
+        )
+        assert calculator.reprices_with() is None
+
+    def test_when_sub_calculator_overrides_calculate_only(self) -> None:
+        calculator = CrossSectionalPerformanceCalculator(
+            _DoubledTotalPerformanceCalculator()
+        )
+        assert calculator.reprices_with() is None
+
+    def test_when_overrides_calculate_only(self) -> None:
+        class Calculator(CrossSectionalPerformanceCalculator[Any]):
+            def calculate(
+                self,
+                sequence: WeightedPricedPointsSequence,
+            ) -> PeriodicRate:
+                return PeriodicRate(0.0)
+
+        calculator = Calculator(TwoPointsTotalPerformanceCalculator())
+        assert calculator.reprices_with() is None
+
+    def test_when_matrix(self) -> None:
+        calculator = MatrixCrossSectionalPerformanceCalculator(
+            TwoPointsTotalPerformanceCalculator()
+        )
+        assert calculator.reprices_with() == (True, True, True)
+
+
+class TestMatrixCrossSectionalPerformanceCalculator:
+    @pytest.mark.parametrize(
+        "calculator",
+        [
+            TwoPointsTotalPerformanceCalculator(),
+            TwoPointsCarryEffectCalculator(),
+            TwoPointsCurveEffectCalculator(),
+            TwoPointsSpreadEffectCalculator(),
+        ],
+    )
+    def test(
+        self,
+        calculator: ITwoPointsPerformanceCalculator,
+        sequence: WeightedPricedPointsSequence,
+    ) -> None:
+        expected = CrossSectionalPerformanceCalculator(calculator).calculate(
+            sequence
+        )
+        result = MatrixCrossSectionalPerformanceCalculator(
+            calculator
+        ).calculate(sequence)
+        assert isclose(result, expected, rel_tol=1e-12, abs_tol=1e-15)
+
+    def test_when_empty(self) -> None:
+        calculator = MatrixCrossSectionalPerformanceCalculator(
+            TwoPointsTotalPerformanceCalculator()
+        )
+        result = calculator.calculate(WeightedPricedPointsSequence([]))
+        assert result == PeriodicRate(0.0)
+
+    @patch.object(
+        ITwoPointsPerformanceCalculator,
+        "calculate",
+        side_effect=TestCrossSectionalPerformanceCalculator._RATES,
+    )
+    def test_when_reprice_not_implemented(
+        self,
+        mocked: MagicMock,
+        sequence: WeightedPricedPointsSequence,
+    ) -> None:
+        calculator = MatrixCrossSectionalPerformanceCalculator(
+            ITwoPointsPerformanceCalculator()
+        )
+        expected = TestCrossSectionalPerformanceCalculator._RATES.dot(
+            sequence.percents
+        )
+        assert calculator.calculate(sequence) == expected
+        assert mocked.mock_calls == [call(points) for points in sequence.points]
+
+    def test_when_sub_calculator_overrides_calculate_only(
+        self,
+        sequence: WeightedPricedPointsSequence,
+    ) -> None:
+        calculator = _DoubledTotalPerformanceCalculator()
+        expected = CrossSectionalPerformanceCalculator(calculator).calculate(
+            sequence
+        )
+        result = MatrixCrossSectionalPerformanceCalculator(
+            calculator
+        ).calculate(sequence)
+        assert result == expected
+
+    def test_when_overflow(
+        self,
+        initial: PricedFlows,
+    ) -> None:
+        final = initial.update_spread(ContinuousRate(-1000.0))
+        sequence = WeightedPricedPointsSequence(
+            [
+                WeightedPricedPoints(
+                    Percent(10000),
+                    PricedPoints(initial, final),
+                ),
+            ]
+        )
+        calculator = MatrixCrossSectionalPerformanceCalculator(
+            TwoPointsTotalPerformanceCalculator()
+        )
+        with pytest.raises(OverflowError, match="discount"):
+            calculator.calculate(sequence)
+
 
 class TestLongitudinalPerformanceCalculator:
     _RATES = PeriodicRateSequence(
@@ -125,3 +293,176 @@ class TestLongitudinalPerformanceCalculator:
         )
         assert calculator.calculate(table) == self._RATES.compound()
         assert mocked.mock_calls == [call(sequence) for sequence in table]
+
+    @patch.object(
+        CrossSectionalPerformanceCalculator,
+        "calculate",
+        side_effect=_RATES,
+    )
+    def test_rates(
+        self,
+        mocked: MagicMock,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        calculator = LongitudinalPerformanceCalculator(
+            CrossSectionalPerformanceCalculator(
+                ITwoPointsPerformanceCalculator()
+            ),
+        )
+        assert calculator.rates(table) == self._RATES
+        assert mocked.mock_calls == [call(sequence) for sequence in table]
+
+
+class TestHoldingsLongitudinalPerformanceCalculator:
+    @pytest.mark.parametrize(
+        "calculator",
+        [
+            TwoPointsTotalPerformanceCalculator(),
+            TwoPointsCarryEffectCalculator(),
+            TwoPointsCurveEffectCalculator(),
+            TwoPointsSpreadEffectCalculator(),
+        ],
+    )
+    def test_rates(
+        self,
+        calculator: ITwoPointsPerformanceCalculator,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        expected = LongitudinalPerformanceCalculator(
+            CrossSectionalPerformanceCalculator(calculator)
+        ).rates(table)
+        result = HoldingsLongitudinalPerformanceCalculator(
+            CrossSectionalPerformanceCalculator(calculator)
+        ).rates(table)
+        assert len(result) == len(expected)
+        for rate, expected_rate in zip(result, expected):
+            assert isclose(rate, expected_rate, rel_tol=1e-12, abs_tol=1e-15)
+
+    @patch.object(CrossSectionalPerformanceCalculator, "calculate")
+    def test_rates_at_once(
+        self,
+        mocked: MagicMock,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        calculator = HoldingsLongitudinalPerformanceCalculator(
+            CrossSectionalPerformanceCalculator(
+                TwoPointsTotalPerformanceCalculator()
+            ),
+        )
+        calculator.rates(table)
+        mocked.assert_not_called()
+
+    def test_rates_when_empty(self) -> None:
+        calculator = HoldingsLongitudinalPerformanceCalculator(
+            CrossSectionalPerformanceCalculator(
+                TwoPointsTotalPerformanceCalculator()
+            ),
+        )
+        table = WeightedPricedPointsTable([WeightedPricedPointsSequence([])])
+        assert calculator.rates(table) == PeriodicRateSequence(
+            [PeriodicRate(0.0)]
+        )
+
+    def test_converts_table_once(
+        self, table: WeightedPricedPointsTable
+    ) -> None:
+        table = table[:]
+        calculators = [
+            HoldingsLongitudinalPerformanceCalculator(
+                CrossSectionalPerformanceCalculator(calculator)
+            )
+            for calculator in (
+                TwoPointsTotalPerformanceCalculator(),
+                TwoPointsCarryEffectCalculator(),
+            )
+        ]
+        with patch.object(
+            WeightedPricedPointsHoldings,
+            "__init__",
+            autospec=True,
+            side_effect=WeightedPricedPointsHoldings.__init__,
+        ) as mocked:
+            for calculator in calculators:
+                calculator.rates(table)
+        mocked.assert_called_once()
+
+    @patch.object(
+        CrossSectionalPerformanceCalculator,
+        "calculate",
+        side_effect=TestLongitudinalPerformanceCalculator._RATES,
+    )
+    def test_rates_when_reprices_with_none(
+        self,
+        mocked: MagicMock,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        calculator = HoldingsLongitudinalPerformanceCalculator(
+            CrossSectionalPerformanceCalculator(
+                ITwoPointsPerformanceCalculator()
+            ),
+        )
+        expected = TestLongitudinalPerformanceCalculator._RATES
+        assert calculator.rates(table) == expected
+        assert mocked.mock_calls == [call(sequence) for sequence in table]
+
+    def test_rates_when_overflow(self, initial: PricedFlows) -> None:
+        final = initial.update_spread(ContinuousRate(-1000.0))
+        table = WeightedPricedPointsTable(
+            [
+                WeightedPricedPointsSequence(
+                    [
+                        WeightedPricedPoints(
+                            Percent(10000),
+                            PricedPoints(initial, final),
+                        ),
+                    ]
+                )
+            ]
+        )
+        calculator = HoldingsLongitudinalPerformanceCalculator(
+            CrossSectionalPerformanceCalculator(
+                TwoPointsTotalPerformanceCalculator()
+            ),
+        )
+        with pytest.raises(OverflowError, match="discount"):
+            calculator.rates(table)
+
+    def test_rates_when_initial_price_is_zero(
+        self,
+        initial: PricedFlows,
+    ) -> None:
+        zero = PricedFlows(
+            Flows([Termed(Term(1.0), Money(0))]),
+            initial.spot,
+            initial.spread,
+        )
+        table = WeightedPricedPointsTable(
+            [
+                WeightedPricedPointsSequence(
+                    [
+                        WeightedPricedPoints(
+                            Percent(10000),
+                            PricedPoints(zero, initial, deferred=True),
+                        ),
+                    ]
+                )
+            ]
+        )
+        calculator = HoldingsLongitudinalPerformanceCalculator(
+            CrossSectionalPerformanceCalculator(
+                TwoPointsTotalPerformanceCalculator()
+            ),
+        )
+        with pytest.raises(ValueError, match="zero"):
+            calculator.rates(table)
+
+    def test_rates_when_sub_calculator_overrides_calculate_only(
+        self,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        cross = CrossSectionalPerformanceCalculator(
+            _DoubledTotalPerformanceCalculator()
+        )
+        expected = LongitudinalPerformanceCalculator(cross).rates(table)
+        result = HoldingsLongitudinalPerformanceCalculator(cross).rates(table)
+        assert result == expected
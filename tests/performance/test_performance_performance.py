@@ -1,5 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Iterable, Tuple, Union
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
@@ -9,7 +10,7 @@ from bperf.money import Money
 from bperf.percent import Percent
 from bperf.performance import IPerformanceCalculator, PerformanceCalculator
 from bperf.performance.effect import IEffectsCalculator
-from bperf.performance.residual import IResidualCalculator
+from bperf.performance.residual import IResidualCalculator, ResidualCalculator
 from bperf.performance.total import ITotalPerformanceCalculator
 from bperf.priced import PricedFlows
 from bperf.priced.points import PricedPoints
@@ -17,6 +18,8 @@ from bperf.priced.points.weighted import WeightedPricedPoints
 from bperf.priced.points.weighted.sequence import WeightedPricedPointsSequence
 from bperf.priced.points.weighted.table import WeightedPricedPointsTable
 from bperf.rate.continuous import ContinuousRate
+from bperf.rate.periodic import PeriodicRate
+from bperf.rate.periodic.sequence import PeriodicRateSequence
 from bperf.term import Term
 from bperf.termed import Termed
 
@@ -68,11 +71,31 @@ def table(sequence: WeightedPricedPointsSequence) -> WeightedPricedPointsTable:
 
 
 class TestIPerformanceCalculator:
+    def test_names(self) -> None:
+        calculator = IPerformanceCalculator()
+        with pytest.raises(NotImplementedError):
+            calculator.names
+
+    def test_rate_names(self) -> None:
+        calculator = IPerformanceCalculator()
+        with pytest.raises(NotImplementedError):
+            calculator.rate_names
+
     def test(self, table: WeightedPricedPointsTable) -> None:
         calculator = IPerformanceCalculator()
         with pytest.raises(NotImplementedError):
             calculator.calculate(table)
 
+    def test_rates(self, table: WeightedPricedPointsTable) -> None:
+        calculator = IPerformanceCalculator()
+        with pytest.raises(NotImplementedError):
+            calculator.rates(table)
+
+    def test_compound(self) -> None:
+        calculator = IPerformanceCalculator()
+        with pytest.raises(NotImplementedError):
+            calculator.compound({})
+
 
 class TestPerformanceCalculator:
     _TOTAL = Percent(1)
@@ -123,6 +146,233 @@ class TestPerformanceCalculator:
             self._EFFECTS.values(),
         )
 
+    @patch.object(
+        IEffectsCalculator,
+        "names",
+        new_callable=PropertyMock,
+        return_value=tuple(_EFFECTS),
+    )
+    def test_rate_names(self, _: MagicMock) -> None:
+        calculator = PerformanceCalculator(
+            ITotalPerformanceCalculator(),
+            IEffectsCalculator(),
+            IResidualCalculator(),
+        )
+        assert calculator.rate_names == (
+            PerformanceCalculator._TOTAL_NAME,
+            *self._EFFECTS,
+        )
+
+    @patch.object(
+        IEffectsCalculator,
+        "names",
+        new_callable=PropertyMock,
+        return_value=tuple(_EFFECTS),
+    )
+    def test_names(self, _: MagicMock) -> None:
+        calculator = PerformanceCalculator(
+            ITotalPerformanceCalculator(),
+            IEffectsCalculator(),
+            IResidualCalculator(),
+        )
+        assert calculator.names == (
+            PerformanceCalculator._TOTAL_NAME,
+            *self._EFFECTS,
+            PerformanceCalculator._RESIDUAL_NAME,
+        )
+
+    @patch.object(
+        IEffectsCalculator,
+        "names",
+        new_callable=PropertyMock,
+        return_value=tuple(_EFFECTS),
+    )
+    @patch.object(IResidualCalculator, "calculate")
+    @patch.object(IEffectsCalculator, "calculate")
+    @patch.object(
+        ITotalPerformanceCalculator,
+        "calculate",
+        return_value=_TOTAL,
+    )
+    def test_when_outputs_without_residual(
+        self,
+        total: MagicMock,
+        effects: MagicMock,
+        residual: MagicMock,
+        _: MagicMock,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        calculator = PerformanceCalculator(
+            ITotalPerformanceCalculator(),
+            IEffectsCalculator(),
+            IResidualCalculator(),
+        )
+        outputs = [PerformanceCalculator._TOTAL_NAME]
+        assert calculator.calculate(table, outputs=outputs) == {
+            PerformanceCalculator._TOTAL_NAME: self._TOTAL,
+        }
+        total.assert_called_once_with(table)
+        effects.assert_not_called()
+        residual.assert_not_called()
+
+    @patch.object(
+        IEffectsCalculator,
+        "names",
+        new_callable=PropertyMock,
+        return_value=tuple(_EFFECTS),
+    )
+    @patch.object(IResidualCalculator, "calculate")
+    @patch.object(
+        IEffectsCalculator,
+        "calculate",
+        return_value={"two": _EFFECTS["two"]},
+    )
+    @patch.object(ITotalPerformanceCalculator, "calculate")
+    def test_when_outputs_with_effects_only(
+        self,
+        total: MagicMock,
+        effects: MagicMock,
+        residual: MagicMock,
+        _: MagicMock,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        calculator = PerformanceCalculator(
+            ITotalPerformanceCalculator(),
+            IEffectsCalculator(),
+            IResidualCalculator(),
+        )
+        assert calculator.calculate(table, outputs=["two"]) == {
+            "two": self._EFFECTS["two"],
+        }
+        total.assert_not_called()
+        effects.assert_called_once_with(table, outputs=["two"])
+        residual.assert_not_called()
+
+    @patch.object(
+        IEffectsCalculator,
+        "names",
+        new_callable=PropertyMock,
+        return_value=tuple(_EFFECTS),
+    )
+    @patch.object(
+        IResidualCalculator,
+        "calculate",
+        return_value=_RESIDUAL,
+    )
+    @patch.object(
+        IEffectsCalculator,
+        "calculate",
+        return_value=_EFFECTS,
+    )
+    @patch.object(
+        ITotalPerformanceCalculator,
+        "calculate",
+        return_value=_TOTAL,
+    )
+    def test_when_outputs_with_residual(
+        self,
+        total: MagicMock,
+        effects: MagicMock,
+        residual: MagicMock,
+        _: MagicMock,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        calculator = PerformanceCalculator(
+            ITotalPerformanceCalculator(),
+            IEffectsCalculator(),
+            IResidualCalculator(),
+        )
+        outputs = [PerformanceCalculator._RESIDUAL_NAME]
+        assert calculator.calculate(table, outputs=outputs) == {
+            PerformanceCalculator._RESIDUAL_NAME: self._RESIDUAL,
+        }
+        total.assert_called_once_with(table)
+        effects.assert_called_once_with(table)
+        assert residual.call_count == 1
+
+    @patch.object(
+        IEffectsCalculator,
+        "names",
+        new_callable=PropertyMock,
+        return_value=tuple(_EFFECTS),
+    )
+    def test_when_unknown_outputs(
+        self,
+        _: MagicMock,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        calculator = PerformanceCalculator(
+            ITotalPerformanceCalculator(),
+            IEffectsCalculator(),
+            IResidualCalculator(),
+        )
+        with pytest.raises(ValueError, match="outputs"):
+            calculator.calculate(table, outputs=["unknown"])
+
+    @patch.object(
+        IResidualCalculator,
+        "calculate",
+        return_value=_RESIDUAL,
+    )
+    @patch.object(
+        IEffectsCalculator,
+        "calculate",
+        return_value=_EFFECTS,
+    )
+    @patch.object(
+        ITotalPerformanceCalculator,
+        "calculate",
+        return_value=_TOTAL,
+    )
+    def test_with_executor(
+        self,
+        total: MagicMock,
+        effects: MagicMock,
+        _: MagicMock,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            calculator = PerformanceCalculator(
+                ITotalPerformanceCalculator(),
+                IEffectsCalculator(),
+                IResidualCalculator(),
+                executor=executor,
+            )
+            performance = calculator.calculate(table)
+        assert list(performance) == [
+            PerformanceCalculator._TOTAL_NAME,
+            *self._EFFECTS,
+            PerformanceCalculator._RESIDUAL_NAME,
+        ]
+        total.assert_called_once_with(table)
+        effects.assert_called_once_with(table)
+
+    @patch.object(
+        IEffectsCalculator,
+        "calculate",
+        side_effect=OverflowError("effects"),
+    )
+    @patch.object(
+        ITotalPerformanceCalculator,
+        "calculate",
+        side_effect=OverflowError("total"),
+    )
+    def test_with_executor_when_errors(
+        self,
+        _: MagicMock,
+        __: MagicMock,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            calculator = PerformanceCalculator(
+                ITotalPerformanceCalculator(),
+                IEffectsCalculator(),
+                IResidualCalculator(),
+                executor=executor,
+            )
+            with pytest.raises(OverflowError, match="total"):
+                calculator.calculate(table)
+
     def _assert_residual_called_once_with(
         self,
         residual: MagicMock,
@@ -142,3 +392,94 @@ class TestPerformanceCalculator:
         return tuple(
             tuple(arg) if isinstance(arg, Iterable) else arg for arg in args
         )
+
+
+class TestPerformanceCalculatorRates:
+    _TOTAL = PeriodicRateSequence([PeriodicRate(0.01), PeriodicRate(0.02)])
+    _EFFECTS = {
+        "one": PeriodicRateSequence([PeriodicRate(0.03), PeriodicRate(0.0)]),
+        "two": PeriodicRateSequence([PeriodicRate(0.0), PeriodicRate(-0.01)]),
+    }
+
+    @patch.object(
+        IEffectsCalculator,
+        "rates",
+        return_value=_EFFECTS,
+    )
+    @patch.object(
+        ITotalPerformanceCalculator,
+        "rates",
+        return_value=_TOTAL,
+    )
+    def test_rates(
+        self,
+        total: MagicMock,
+        effects: MagicMock,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        calculator = PerformanceCalculator(
+            ITotalPerformanceCalculator(),
+            IEffectsCalculator(),
+            ResidualCalculator(),
+        )
+        expected = {PerformanceCalculator._TOTAL_NAME: self._TOTAL}
+        expected.update(self._EFFECTS)
+        assert calculator.rates(table) == expected
+        total.assert_called_once_with(table)
+        effects.assert_called_once_with(table)
+
+    @patch.object(
+        IEffectsCalculator,
+        "rates",
+        return_value=_EFFECTS,
+    )
+    @patch.object(
+        ITotalPerformanceCalculator,
+        "rates",
+        return_value=_TOTAL,
+    )
+    def test_rates_with_executor(
+        self,
+        _: MagicMock,
+        __: MagicMock,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            calculator = PerformanceCalculator(
+                ITotalPerformanceCalculator(),
+                IEffectsCalculator(),
+                ResidualCalculator(),
+                executor=executor,
+            )
+            rates = calculator.rates(table)
+        expected = {PerformanceCalculator._TOTAL_NAME: self._TOTAL}
+        expected.update(self._EFFECTS)
+        assert rates == expected
+        assert list(rates) == list(expected)
+
+    def test_compound(self) -> None:
+        calculator = PerformanceCalculator(
+            ITotalPerformanceCalculator(),
+            IEffectsCalculator(),
+            ResidualCalculator(),
+        )
+        rates = {PerformanceCalculator._TOTAL_NAME: self._TOTAL}
+        rates.update(self._EFFECTS)
+        expected = {
+            PerformanceCalculator._TOTAL_NAME: Percent(302),
+            "one": Percent(300),
+            "two": Percent(-100),
+            PerformanceCalculator._RESIDUAL_NAME: Percent(102),
+        }
+        result = calculator.compound(rates)
+        assert result == expected
+        assert list(result) == list(expected)
+
+    def test_compound_when_missing_total(self) -> None:
+        calculator = PerformanceCalculator(
+            ITotalPerformanceCalculator(),
+            IEffectsCalculator(),
+            ResidualCalculator(),
+        )
+        with pytest.raises(KeyError):
+            calculator.compound(self._EFFECTS)
@@ -24,6 +24,7 @@ from bperf.priced.points.weighted.sequence import WeightedPricedPointsSequence
 from bperf.priced.points.weighted.table import WeightedPricedPointsTable
 from bperf.rate.continuous import ContinuousRate
 from bperf.rate.periodic import PeriodicRate
+from bperf.rate.periodic.sequence import PeriodicRateSequence
 from bperf.term import Term
 from bperf.termed import Termed
 
@@ -180,6 +181,40 @@ class TestTwoPointsTotalPerformanceCalculator:
         result = calculator.calculate(points)
         assert isclose(result, expected, rel_tol=1e-8, abs_tol=1e-8)
 
+    def test_reprices_with(
+        self,
+        calculator: TwoPointsTotalPerformanceCalculator,
+    ) -> None:
+        assert calculator.reprices_with() == (True, True, True)
+
+    def test_reprice(
+        self,
+        calculator: TwoPointsTotalPerformanceCalculator,
+        initial: PricedFlows,
+        offset: ContinuousRate,
+    ) -> None:
+        final = PricedFlows(
+            Flows([Termed(Term(1.0), Money(-1))]),
+            initial.spot.add(offset),
+            initial.spread + offset,
+        )
+        points = PricedPoints(initial, final)
+        assert calculator.reprice(points) == (final, points.payments)
+
+    def test_when_unchanged(
+        self,
+        calculator: TwoPointsTotalPerformanceCalculator,
+        initial: PricedFlows,
+        offset: ContinuousRate,
+    ) -> None:
+        final = PricedFlows(initial.flows, initial.spot, initial.spread)
+        points = PricedPoints(initial, final)
+        assert calculator.reprice(points) == (initial, Money(0))
+        assert calculator.reprice(points)[0] is initial
+        with patch.object(Flows, "pv") as mocked:
+            assert calculator.calculate(points) == PeriodicRate(0.0)
+        mocked.assert_not_called()
+
 
 class TestITotalPerformanceCalculator:
     def test(self, table: WeightedPricedPointsTable) -> None:
@@ -187,6 +222,11 @@ class TestITotalPerformanceCalculator:
         with pytest.raises(NotImplementedError):
             calculator.calculate(table)
 
+    def test_rates(self, table: WeightedPricedPointsTable) -> None:
+        calculator = ITotalPerformanceCalculator()
+        with pytest.raises(NotImplementedError):
+            calculator.rates(table)
+
 
 class TestTotalPerformanceCalculator:
     _TOTAL = PeriodicRate(0.02)
@@ -207,3 +247,24 @@ class TestTotalPerformanceCalculator:
         )
         assert calculator.calculate(table) == self._PERCENT
         mocked.assert_called_once_with(table)
+
+    @patch.object(
+        LongitudinalPerformanceCalculator,
+        "rates",
+        return_value=PeriodicRateSequence([_TOTAL, _TOTAL]),
+    )
+    def test_rates(
+        self,
+        mocked: MagicMock,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        calculator = TotalPerformanceCalculator(
+            LongitudinalPerformanceCalculator(
+                CrossSectionalPerformanceCalculator(
+                    ITwoPointsTotalPerformanceCalculator(),
+                )
+            )
+        )
+        expected = PeriodicRateSequence([self._TOTAL, self._TOTAL])
+        assert calculator.rates(table) == expected
+        mocked.assert_called_once_with(table)
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from bperf.curve import SpotCurve
@@ -83,6 +85,57 @@ class TestPricedPointsInvariants:
         )
         PricedPoints(initial, final)  # does not raise
 
+    def test_when_deferred(
+        self,
+        final: PricedFlows,
+        spot: SpotCurve,
+        spread: ContinuousRate,
+    ) -> None:
+        initial = PricedFlows(
+            Flows(
+                [
+                    Termed(Term(1.0), Money(0)),
+                ]
+            ),
+            spot,
+            spread,
+        )
+        with patch.object(Flows, "pv") as mocked:
+            points = PricedPoints(initial, final, deferred=True)
+        mocked.assert_not_called()
+        assert not points.is_validated
+        with pytest.raises(ValueError, match="initial price"):
+            points.validate()
+        with pytest.raises(ValueError, match="initial price"):
+            # noinspection PyStatementEffect
+            points.initial
+        assert not points.is_validated
+
+    def test_when_deferred_and_validated(
+        self,
+        final: PricedFlows,
+        spot: SpotCurve,
+        spread: ContinuousRate,
+    ) -> None:
+        initial = PricedFlows(
+            Flows(
+                [
+                    Termed(Term(1.0), Money(1)),
+                ]
+            ),
+            spot,
+            spread,
+        )
+        points = PricedPoints(initial, final, deferred=True)
+        assert points.initial is initial
+        assert points.is_validated
+        with patch.object(PricedPoints, "_raise_if_initial_price_is_zero") as m:
+            points.validate()
+        m.assert_not_called()
+
+    def test_when_not_deferred(self, final: PricedFlows) -> None:
+        assert PricedPoints(final, final).is_validated
+
 
 @pytest.fixture(scope="module")
 def initial() -> PricedFlows:
@@ -139,6 +192,28 @@ class TestPricedPointsEqual:
     def test_when_different_object(self, points: PricedPoints) -> None:
         assert points != "a"
 
+    def test_when_same_object(
+        self,
+        initial: PricedFlows,
+        final: PricedFlows,
+    ) -> None:
+        points = PricedPoints(initial, final)
+        with patch.object(PricedFlows, "__eq__") as mocked:
+            assert points == points
+        mocked.assert_not_called()
+
+    def test_when_different_hashes(
+        self,
+        initial: PricedFlows,
+        final: PricedFlows,
+    ) -> None:
+        points = PricedPoints(initial, final)
+        other = PricedPoints(initial, initial)
+        hash(points), hash(other)
+        with patch.object(PricedFlows, "__eq__") as mocked:
+            assert points != other
+        mocked.assert_not_called()
+
 
 class TestPricedPointsHash:
     def test_when_equal(
@@ -170,6 +245,12 @@ class TestPricedPointsHash:
         other = PricedPoints(initial, final_)
         assert hash(other) != hash(points)
 
+    def test_is_kept(self, initial: PricedFlows, final: PricedFlows) -> None:
+        points = PricedPoints(initial, final)
+        with patch.object(PricedFlows, "__hash__", return_value=0) as mocked:
+            assert hash(points) == hash(points)
+        assert mocked.call_count == 2
+
 
 class TestPricedPointsRepresentation:
     def test(self, points: PricedPoints) -> None:
@@ -0,0 +1,69 @@
+from unittest.mock import patch
+
+import pytest
+
+from bperf.curve import SpotCurve
+from bperf.flows import Flows
+from bperf.money import Money
+from bperf.priced import PricedFlows
+from bperf.priced.points import PricedPoints
+from bperf.priced.points.sequence import PricedPointsSequence
+from bperf.rate.continuous import ContinuousRate
+from bperf.term import Term
+from bperf.termed import Termed
+
+
+def _priced(cents: int, spread: float = 0.01) -> PricedFlows:
+    return PricedFlows(
+        Flows(
+            [
+                Termed(Term(1.0), Money(cents)),
+            ]
+        ),
+        SpotCurve(
+            [
+                Termed(Term(1.0), ContinuousRate(0.02)),
+            ]
+        ),
+        ContinuousRate(spread),
+    )
+
+
+class TestPricedPointsSequenceValidate:
+    def test(self) -> None:
+        sequence = PricedPointsSequence(
+            PricedPoints(_priced(cents), _priced(cents), deferred=True)
+            for cents in (1, 2, -3)
+        )
+        sequence.validate()
+        assert all(points.is_validated for points in sequence)
+
+    def test_when_validated(self) -> None:
+        sequence = PricedPointsSequence(
+            [
+                PricedPoints(_priced(1), _priced(1)),
+            ]
+        )
+        with patch.object(PricedPoints, "validate") as mocked:
+            sequence.validate()
+        mocked.assert_not_called()
+
+    def test_when_initial_price_is_zero(self) -> None:
+        sequence = PricedPointsSequence(
+            PricedPoints(_priced(cents), _priced(1), deferred=True)
+            for cents in (1, 0)
+        )
+        with pytest.raises(ValueError, match="initial price"):
+            sequence.validate()
+
+    def test_when_overflow(self) -> None:
+        sequence = PricedPointsSequence(
+            [
+                PricedPoints(_priced(1), _priced(1), deferred=True),
+                PricedPoints(_priced(1, -1e308), _priced(1), deferred=True),
+            ]
+        )
+        with pytest.raises(OverflowError):
+            sequence.validate()
+        assert sequence[0].is_validated
+        assert not sequence[1].is_validated
@@ -0,0 +1,59 @@
+import pytest
+
+from bperf.curve import SpotCurve
+from bperf.flows import Flows
+from bperf.money import Money
+from bperf.percent import Percent
+from bperf.priced import PricedFlows
+from bperf.priced.points import PricedPoints
+from bperf.priced.points.weighted import WeightedPricedPoints
+from bperf.priced.points.weighted.sequence import WeightedPricedPointsSequence
+from bperf.priced.points.weighted.table import WeightedPricedPointsTable
+from bperf.rate.continuous import ContinuousRate
+from bperf.term import Term
+from bperf.termed import Termed
+
+
+def _leg(security: int, day: int) -> PricedFlows:
+    # a new, equal, instance on each call
+    return PricedFlows(
+        Flows(
+            [
+                Termed(Term(1.0 - 0.01 * day), Money(100 * security)),
+                Termed(Term(2.0 - 0.01 * day), Money(10000)),
+            ]
+        ),
+        SpotCurve(
+            [
+                Termed(Term(1.0), ContinuousRate(0.01 + 0.001 * day)),
+                Termed(Term(2.0), ContinuousRate(0.02)),
+            ]
+        ),
+        ContinuousRate(0.001 * security),
+    )
+
+
+def _points(weight: int, security: int, day: int) -> WeightedPricedPoints:
+    return WeightedPricedPoints(
+        Percent(weight),
+        PricedPoints(_leg(security, day), _leg(security, day + 1)),
+    )
+
+
+@pytest.fixture(scope="module")
+def table() -> WeightedPricedPointsTable:
+    return WeightedPricedPointsTable(
+        [
+            WeightedPricedPointsSequence(
+                [_points(4000, 1, 0), _points(6000, 2, 0)]
+            ),
+            WeightedPricedPointsSequence(
+                [_points(4000, 1, 1), _points(6000, 2, 1)]
+            ),
+            WeightedPricedPointsSequence(
+                [_points(7000, 2, 2), _points(3000, 3, 2)]
+            ),
+            WeightedPricedPointsSequence([]),
+            WeightedPricedPointsSequence([_points(10000, 3, 4)]),
+        ]
+    )
@@ -0,0 +1,125 @@
+from typing import Tuple
+
+import numpy as np
+import pytest
+
+from bperf.priced.points.weighted.assembler import (
+    Rows,
+    WeightedPricedPointsAssembler,
+)
+
+_DATES = ("2024-01-01", "2024-01-02", "2024-01-03")
+
+
+def _rows(*rows: Tuple[object, ...]) -> Rows:
+    columns = list(zip(*rows)) if rows else [(), (), (), ()]
+    return (
+        np.array(columns[0]),
+        np.array(columns[1], dtype=np.int64),
+        np.array(columns[2]),
+        np.array(columns[3]),
+    )
+
+
+@pytest.fixture(scope="module")
+def assembler() -> WeightedPricedPointsAssembler:
+    return WeightedPricedPointsAssembler(2, _DATES)
+
+
+@pytest.fixture(scope="module")
+def positions() -> Rows:
+    return _rows(
+        (0, 0, "bond", 10000),
+        (0, 1, "bond", 10000),
+        (1, 1, "bond", 10000),
+    )
+
+
+@pytest.fixture(scope="module")
+def securities() -> Rows:
+    return _rows(*(("bond", date, "curve", 0.001) for date in range(3)))
+
+
+@pytest.fixture(scope="module")
+def flows() -> Rows:
+    return _rows(
+        ("bond", 0, 1.0, 10100),
+        ("bond", 1, 0.9, 10100),
+        ("bond", 2, 0.8, 10100),
+    )
+
+
+@pytest.fixture(scope="module")
+def curves() -> Rows:
+    return _rows(
+        *(
+            ("curve", date, tenor, 0.01)
+            for date in range(3)
+            for tenor in (1.0, 2.0)
+        )
+    )
+
+
+class TestWeightedPricedPointsAssemblerColumns:
+    def test(
+        self,
+        assembler: WeightedPricedPointsAssembler,
+        positions: Rows,
+        securities: Rows,
+        flows: Rows,
+        curves: Rows,
+    ) -> None:
+        columns = assembler.columns(positions, securities, flows, curves)
+        arrays = columns.arrays
+        assert arrays["periods"].tolist() == [0, 1, 2, 2, 3]
+        assert arrays["weights"].tolist() == [10000] * 3
+        assert arrays["terms"].tolist() == [1.0, 0.9, 0.9, 0.8, 0.9, 0.8]
+        assert arrays["curves"].tolist() == [0, 2, 4, 6]
+
+    def test_when_security_missing(
+        self,
+        assembler: WeightedPricedPointsAssembler,
+        positions: Rows,
+        flows: Rows,
+        curves: Rows,
+    ) -> None:
+        securities = _rows(("bond", 0, "curve", 0.001))
+        with pytest.raises(ValueError, match="^security bond is missing"):
+            assembler.columns(positions, securities, flows, curves)
+
+    def test_when_curve_missing(
+        self,
+        assembler: WeightedPricedPointsAssembler,
+        positions: Rows,
+        securities: Rows,
+        flows: Rows,
+    ) -> None:
+        curves = _rows(("curve", 0, 1.0, 0.01))
+        with pytest.raises(ValueError, match="^curve curve is missing"):
+            assembler.columns(positions, securities, flows, curves)
+
+    def test_when_cents_overflow(
+        self,
+        assembler: WeightedPricedPointsAssembler,
+        positions: Rows,
+        securities: Rows,
+        curves: Rows,
+    ) -> None:
+        flows = _rows(*(("bond", date, 1.0, 10**20) for date in range(3)))
+        with pytest.raises(ValueError, match="^cents must fit"):
+            assembler.columns(positions, securities, flows, curves)
+
+
+class TestWeightedPricedPointsAssemblerAssemble:
+    def test(
+        self,
+        assembler: WeightedPricedPointsAssembler,
+        positions: Rows,
+        securities: Rows,
+        flows: Rows,
+        curves: Rows,
+    ) -> None:
+        tables = assembler.assemble(positions, securities, flows, curves)
+        assert [len(table) for table in tables] == [2, 2]
+        assert [len(sequence) for sequence in tables[0]] == [1, 1]
+        assert [len(sequence) for sequence in tables[1]] == [0, 1]
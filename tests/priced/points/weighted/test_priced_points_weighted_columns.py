@@ -0,0 +1,286 @@
+import pickle
+from typing import Any, Dict
+from unittest.mock import PropertyMock, patch
+
+import numpy as np
+import pytest
+
+from bperf.curve import SpotCurve
+from bperf.flows import Flows
+from bperf.money import Money
+from bperf.percent import Percent
+from bperf.priced import PricedFlows
+from bperf.priced.points import PricedPoints
+from bperf.priced.points.weighted import WeightedPricedPoints
+from bperf.priced.points.weighted.columns import WeightedPricedPointsColumns
+from bperf.priced.points.weighted.sequence import WeightedPricedPointsSequence
+from bperf.priced.points.weighted.table import WeightedPricedPointsTable
+from bperf.rate.continuous import ContinuousRate
+from bperf.term import Term
+from bperf.termed import Termed
+from bperf.utilities.sequence import LazyValues
+
+
+@pytest.fixture(scope="module")
+def spot() -> SpotCurve:
+    return SpotCurve(
+        [
+            Termed(Term(1.0), ContinuousRate(0.01)),
+            Termed(Term(2.0), ContinuousRate(0.02)),
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def initial(spot: SpotCurve) -> PricedFlows:
+    return PricedFlows(
+        Flows(
+            [
+                Termed(Term(1.0), Money(100)),
+                Termed(Term(1.5), Money(10100)),
+            ]
+        ),
+        spot,
+        ContinuousRate(0.002),
+    )
+
+
+@pytest.fixture(scope="module")
+def final(initial: PricedFlows, spot: SpotCurve) -> PricedFlows:
+    return PricedFlows(
+        Flows(
+            [
+                Termed(Term(0.5), Money(10100)),
+            ]
+        ),
+        SpotCurve(spot),  # equal, but distinct
+        ContinuousRate(0.003),
+    )
+
+
+@pytest.fixture(scope="module")
+def table(
+    initial: PricedFlows,
+    final: PricedFlows,
+) -> WeightedPricedPointsTable:
+    return WeightedPricedPointsTable(
+        [
+            WeightedPricedPointsSequence(
+                [
+                    WeightedPricedPoints(
+                        Percent(2500),
+                        PricedPoints(initial, final),
+                    ),
+                    WeightedPricedPoints(
+                        Percent(7500),
+                        PricedPoints(final, initial),
+                    ),
+                ]
+            ),
+            WeightedPricedPointsSequence([]),
+            WeightedPricedPointsSequence(
+                [
+                    WeightedPricedPoints(
+                        Percent(10000),
+                        PricedPoints(initial, initial),
+                    ),
+                ]
+            ),
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def columns(table: WeightedPricedPointsTable) -> WeightedPricedPointsColumns:
+    return WeightedPricedPointsColumns.from_table(table)
+
+
+class TestWeightedPricedPointsColumnsFromTable:
+    def test_arrays(self, columns: WeightedPricedPointsColumns) -> None:
+        arrays = columns.arrays
+        assert set(arrays) == set(WeightedPricedPointsColumns.NAMES)
+        assert arrays["periods"].tolist() == [0, 2, 2, 3]
+        assert arrays["weights"].tolist() == [2500, 7500, 10000]
+        assert arrays["flows"].tolist() == [0, 2, 3, 4, 6, 8, 10]
+        assert arrays["cents"].tolist()[:3] == [100, 10100, 10100]
+
+    def test_pools_equal_curves(
+        self,
+        columns: WeightedPricedPointsColumns,
+    ) -> None:
+        arrays = columns.arrays
+        assert arrays["curves"].tolist() == [0, 2]
+        assert arrays["spots"].tolist() == [0] * 6
+
+    def test_len(
+        self,
+        columns: WeightedPricedPointsColumns,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        assert len(columns) == len(table)
+
+    def test_when_empty(self) -> None:
+        table = WeightedPricedPointsTable([])
+        columns = WeightedPricedPointsColumns.from_table(table)
+        assert len(columns) == 0
+        assert columns.table() == table
+
+
+class TestWeightedPricedPointsColumnsPickle:
+    def test(self, columns: WeightedPricedPointsColumns) -> None:
+        loaded = pickle.loads(pickle.dumps(columns))
+        assert loaded.table() == columns.table()
+
+    def test_table(self, table: WeightedPricedPointsTable) -> None:
+        loaded = pickle.loads(pickle.dumps(table))
+        assert isinstance(loaded._values, LazyValues)
+        assert loaded == table
+
+    def test_sequence(self, table: WeightedPricedPointsTable) -> None:
+        loaded = pickle.loads(pickle.dumps(table[0]))
+        assert loaded == table[0]
+
+    def test_when_flows_do_not_fit_in_64_bits(
+        self,
+        initial: PricedFlows,
+    ) -> None:
+        large = initial.update_flows(
+            Flows([Termed(Term(1.0), Money(2**70))]),
+        )
+        table = WeightedPricedPointsTable(
+            [
+                WeightedPricedPointsSequence(
+                    [
+                        WeightedPricedPoints(
+                            Percent(10000),
+                            PricedPoints(large, initial),
+                        )
+                    ]
+                )
+            ]
+        )
+        assert pickle.loads(pickle.dumps(table)) == table
+        assert pickle.loads(pickle.dumps(table[0])) == table[0]
+
+    def test_does_not_price(self, initial: PricedFlows) -> None:
+        points = PricedPoints(
+            initial.update_flows(initial.flows),
+            initial,
+            deferred=True,
+        )
+        table = WeightedPricedPointsTable(
+            [
+                WeightedPricedPointsSequence(
+                    [WeightedPricedPoints(Percent(10000), points)],
+                )
+            ]
+        )
+        with patch.object(
+            PricedFlows,
+            "price",
+            new_callable=PropertyMock,
+        ) as mocked:
+            pickle.dumps(table)
+        mocked.assert_not_called()
+
+
+class TestWeightedPricedPointsColumnsTable:
+    def test_eq(
+        self,
+        columns: WeightedPricedPointsColumns,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        assert columns.table() == table
+        assert table == columns.table()
+        assert hash(columns.table()) == hash(table)
+
+    def test_sequence(
+        self,
+        columns: WeightedPricedPointsColumns,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        for period, sequence in enumerate(table):
+            assert columns.sequence(period) == sequence
+        assert columns.sequence(-1) == table[-1]
+
+    def test_sequence_defers_validation(
+        self,
+        columns: WeightedPricedPointsColumns,
+    ) -> None:
+        sequence = columns.sequence(0)
+        assert not any(points.is_validated for points in sequence.points)
+
+    def test_sequence_when_out_of_bounds(
+        self,
+        columns: WeightedPricedPointsColumns,
+    ) -> None:
+        with pytest.raises(IndexError):
+            columns.sequence(len(columns))
+
+    def test_shares_curves(self, columns: WeightedPricedPointsColumns) -> None:
+        table = columns.table()
+        assert table[0][0].points.initial.spot is table[2][0].points.final.spot
+
+    def test_slice(
+        self,
+        columns: WeightedPricedPointsColumns,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        with patch.object(
+            WeightedPricedPointsColumns,
+            "sequence",
+            autospec=True,
+            side_effect=WeightedPricedPointsColumns.sequence,
+        ) as mocked:
+            sliced = columns.table()[1:]
+            mocked.assert_not_called()
+            assert sliced == table[1:]
+        assert mocked.call_count == len(table) - 1
+
+
+class TestWeightedPricedPointsColumnsValidate:
+    def test_when_valid(self, columns: WeightedPricedPointsColumns) -> None:
+        arrays: Dict[str, Any] = columns.arrays
+        WeightedPricedPointsColumns(**arrays)  # does not raise
+
+    @pytest.mark.parametrize(
+        "name, update, match",
+        [
+            ("periods", lambda a: a[:-1], "periods"),
+            ("flows", lambda a: a + 1, "flows"),
+            ("spots", lambda a: a + 1, "spots"),
+            ("spreads", lambda a: a[:-1], "lengths"),
+            ("terms", lambda a: -a, "terms"),
+            ("terms", lambda a: a[::-1].copy(), "increasing"),
+            ("rates", lambda a: a * np.inf, "finite"),
+            ("tenors", lambda a: np.zeros_like(a), "strictly positive"),
+            ("weights", lambda a: a + 1, "sum"),
+            ("curves", lambda a: np.array([0, 0, 2]), "non-empty"),
+            ("weights", lambda a: a.reshape(1, -1), "one-dimensional"),
+            ("weights", lambda a: a.astype(np.float64), "integers"),
+            ("spots", lambda a: a.astype(np.float64), "integers"),
+            ("cents", lambda a: a.astype(np.float64), "integers"),
+            ("curves", lambda a: a.astype(np.float64), "integers"),
+            ("terms", lambda a: a.astype(np.int64), "floating-point"),
+            ("rates", lambda a: a.astype(str), "floating-point"),
+        ],
+    )
+    def test_when_invalid(
+        self,
+        columns: WeightedPricedPointsColumns,
+        name: str,
+        update: Any,
+        match: str,
+    ) -> None:
+        arrays: Dict[str, Any] = columns.arrays
+        arrays[name] = update(arrays[name])
+        with pytest.raises(ValueError, match=match):
+            WeightedPricedPointsColumns(**arrays)
+
+    def test_when_not_validated(
+        self,
+        columns: WeightedPricedPointsColumns,
+    ) -> None:
+        arrays: Dict[str, Any] = columns.arrays
+        arrays["weights"] = arrays["weights"] + 1
+        WeightedPricedPointsColumns(**arrays, validate=False)  # does not raise
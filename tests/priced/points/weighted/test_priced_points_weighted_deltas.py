@@ -0,0 +1,94 @@
+import pickle
+from typing import List
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+from bperf.priced import PricedFlows
+from bperf.priced.points.weighted.deltas import WeightedPricedPointsDeltas
+from bperf.priced.points.weighted.table import WeightedPricedPointsTable
+
+
+@pytest.fixture(scope="module")
+def deltas(table: WeightedPricedPointsTable) -> WeightedPricedPointsDeltas:
+    return WeightedPricedPointsDeltas.from_table(table)
+
+
+class TestWeightedPricedPointsDeltasFromTable:
+    def test_arrays(self, deltas: WeightedPricedPointsDeltas) -> None:
+        arrays = deltas.arrays
+        assert set(arrays) == set(WeightedPricedPointsDeltas.NAMES)
+        assert arrays["periods"].tolist() == [0, 2, 4, 6, 6, 7]
+        assert arrays["continued"].tolist() == [0, 2, 2, 4, 4, 5]
+        assert arrays["sources"].tolist() == [-1, -1, 1, -1, -1]
+        assert arrays["changed"].tolist() == [0, 2, 2, 4, 4, 5]
+        assert arrays["weights"].tolist() == [4000, 6000, 7000, 3000, 10000]
+
+    def test_pools_equal_legs(self, deltas: WeightedPricedPointsDeltas) -> None:
+        arrays = deltas.arrays
+        assert len(arrays["spots"]) == 11  # 4 + 4 + 3 legs
+        assert arrays["curves"].tolist() == [0, 2, 4, 6, 8, 10, 12]
+
+    def test_nbytes(self, deltas: WeightedPricedPointsDeltas) -> None:
+        arrays = deltas.arrays
+        assert deltas.nbytes == sum(array.nbytes for array in arrays.values())
+
+    def test_len(
+        self,
+        deltas: WeightedPricedPointsDeltas,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        assert len(deltas) == len(table)
+
+
+class TestWeightedPricedPointsDeltasTable:
+    def test_eq(
+        self,
+        deltas: WeightedPricedPointsDeltas,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        assert deltas.table() == table
+
+    @pytest.mark.parametrize("order", [[4, 2, 0, 3, 1], [1, 1, 0, 4]])
+    def test_sequence_when_accessed_out_of_order(
+        self,
+        table: WeightedPricedPointsTable,
+        order: List[int],
+    ) -> None:
+        deltas = WeightedPricedPointsDeltas.from_table(table)
+        for period in order:
+            assert deltas.sequence(period) == table[period]
+
+    def test_sequence_defers_validation(
+        self,
+        deltas: WeightedPricedPointsDeltas,
+    ) -> None:
+        sequence = deltas.sequence(1)
+        assert not any(points.is_validated for points in sequence.points)
+
+    def test_sequence_when_out_of_bounds(
+        self,
+        deltas: WeightedPricedPointsDeltas,
+    ) -> None:
+        with pytest.raises(IndexError):
+            deltas.sequence(5)
+
+    def test_shares_legs(self, deltas: WeightedPricedPointsDeltas) -> None:
+        table = deltas.table()
+        assert table[1][1].points.initial is table[0][1].points.final
+        assert table[2][0].points.initial is table[1][1].points.final
+
+
+class TestWeightedPricedPointsDeltasPickle:
+    def test(self, deltas: WeightedPricedPointsDeltas) -> None:
+        loaded = pickle.loads(pickle.dumps(deltas))
+        assert loaded.table() == deltas.table()
+
+    def test_does_not_price(self, table: WeightedPricedPointsTable) -> None:
+        with patch.object(
+            PricedFlows,
+            "price",
+            new_callable=PropertyMock,
+        ) as mocked:
+            WeightedPricedPointsDeltas.from_table(table)
+        mocked.assert_not_called()
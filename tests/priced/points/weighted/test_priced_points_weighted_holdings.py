@@ -0,0 +1,208 @@
+import gc
+import pickle
+import weakref
+from typing import List, Tuple
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+from bperf.priced import PricedFlows
+from bperf.priced.points import PricedPoints
+from bperf.priced.points.weighted.holdings import (
+    _KEPT,
+    WeightedPricedPointsHoldings,
+)
+from bperf.priced.points.weighted.table import WeightedPricedPointsTable
+
+
+@pytest.fixture(scope="module")
+def holdings(
+    table: WeightedPricedPointsTable,
+) -> WeightedPricedPointsHoldings:
+    return WeightedPricedPointsHoldings._trusted(
+        WeightedPricedPointsHoldings.from_table(table).arrays
+    )
+
+
+def _rows(
+    holdings: WeightedPricedPointsHoldings,
+    table: WeightedPricedPointsTable,
+) -> List[PricedPoints]:
+    arrays = holdings.arrays
+    return [
+        table[period][position].points
+        for period, position in zip(
+            arrays["periods"].tolist(), arrays["positions"].tolist()
+        )
+    ]
+
+
+class TestWeightedPricedPointsHoldingsFromTable:
+    def test_arrays(self, holdings: WeightedPricedPointsHoldings) -> None:
+        arrays = holdings.arrays
+        assert set(arrays) == set(WeightedPricedPointsHoldings.NAMES)
+        assert arrays["lengths"].tolist() == [2, 2, 2, 0, 1]
+        assert arrays["holdings"].tolist() == [0, 2, 5, 6, 7]
+        assert arrays["periods"].tolist() == [0, 1, 0, 1, 2, 2, 4]
+        assert arrays["positions"].tolist() == [0, 0, 1, 1, 0, 1, 0]
+        assert arrays["weights"].tolist() == [
+            4000,
+            4000,
+            6000,
+            6000,
+            7000,
+            3000,
+            10000,
+        ]
+
+    def test_stores_legs_by_holding(
+        self,
+        holdings: WeightedPricedPointsHoldings,
+    ) -> None:
+        arrays = holdings.arrays
+        assert len(arrays["spots"]) == 11  # 3 + 4 + 2 + 2 legs
+        assert arrays["spots"].tolist() == [0, 1, 2, 0, 1, 2, 3, 2, 3, 4, 5]
+        assert arrays["curves"].tolist() == [0, 2, 4, 6, 8, 10, 12]
+        assert holdings.initials.tolist() == [0, 1, 3, 4, 5, 7, 9]
+
+    def test_is_kept_by_table(self, table: WeightedPricedPointsTable) -> None:
+        holdings = WeightedPricedPointsHoldings.from_table(table)
+        assert WeightedPricedPointsHoldings.from_table(table) is holdings
+
+    def test_is_forgotten_with_table(
+        self,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        count = len(_KEPT)
+        copy = table[:]
+        holdings = WeightedPricedPointsHoldings.from_table(copy)
+        assert len(_KEPT) == count + 1
+        reference = weakref.ref(copy)
+        del copy
+        gc.collect()
+        assert reference() is None
+        assert len(_KEPT) == count
+        assert len(holdings) == len(table)
+
+    def test_nbytes(self, holdings: WeightedPricedPointsHoldings) -> None:
+        arrays = holdings.arrays
+        assert holdings.nbytes == sum(array.nbytes for array in arrays.values())
+
+    def test_len(
+        self,
+        holdings: WeightedPricedPointsHoldings,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        assert len(holdings) == len(table)
+
+
+class TestWeightedPricedPointsHoldingsTable:
+    def test_eq(
+        self,
+        holdings: WeightedPricedPointsHoldings,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        assert holdings.table() == table
+
+    def test_is_kept(self, holdings: WeightedPricedPointsHoldings) -> None:
+        table = holdings.table()
+        assert holdings.table() is table
+        assert WeightedPricedPointsHoldings.from_table(table) is holdings
+
+    def test_is_recreated_once_collected(
+        self,
+        holdings: WeightedPricedPointsHoldings,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        created = WeightedPricedPointsHoldings._trusted(holdings.arrays)
+        reference = weakref.ref(created.table())
+        gc.collect()
+        assert reference() is None
+        assert created.table() == table
+        assert (
+            WeightedPricedPointsHoldings.from_table(created.table()) is created
+        )
+
+    @pytest.mark.parametrize("order", [[4, 2, 0, 3, 1], [1, 1, 0, 4]])
+    def test_sequence_when_accessed_out_of_order(
+        self,
+        holdings: WeightedPricedPointsHoldings,
+        table: WeightedPricedPointsTable,
+        order: List[int],
+    ) -> None:
+        for period in order:
+            assert holdings.sequence(period) == table[period]
+
+    def test_sequence_defers_validation(
+        self,
+        holdings: WeightedPricedPointsHoldings,
+    ) -> None:
+        sequence = holdings.sequence(1)
+        assert not any(points.is_validated for points in sequence.points)
+
+    def test_sequence_when_out_of_bounds(
+        self,
+        holdings: WeightedPricedPointsHoldings,
+    ) -> None:
+        with pytest.raises(IndexError):
+            holdings.sequence(5)
+
+    def test_shares_legs(self, holdings: WeightedPricedPointsHoldings) -> None:
+        table = holdings.table()
+        assert table[1][1].points.initial is table[0][1].points.final
+        assert table[2][0].points.initial is table[1][1].points.final
+
+
+class TestWeightedPricedPointsHoldingsPrices:
+    @pytest.mark.parametrize(
+        "parts",
+        [
+            (False, False, False),
+            (True, True, True),
+            (True, False, False),
+            (False, True, False),
+            (False, False, True),
+            (True, True, False),
+        ],
+    )
+    def test(
+        self,
+        holdings: WeightedPricedPointsHoldings,
+        table: WeightedPricedPointsTable,
+        parts: Tuple[bool, bool, bool],
+    ) -> None:
+        flows, spot, spread = parts
+        expected = []
+        for points in _rows(holdings, table):
+            initial, final = points.initial, points.final
+            repriced = PricedFlows(
+                final.flows if flows else initial.flows,
+                final.spot if spot else initial.spot,
+                final.spread if spread else initial.spread,
+            )
+            expected.append(float(repriced.price))
+        result = holdings.prices(flows=flows, spot=spot, spread=spread)
+        assert result.tolist() == pytest.approx(expected, rel=1e-12)
+
+    def test_payments(
+        self,
+        holdings: WeightedPricedPointsHoldings,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        expected = [points.payments.scaled for points in _rows(holdings, table)]
+        assert holdings.payments().tolist() == expected
+
+
+class TestWeightedPricedPointsHoldingsPickle:
+    def test(self, holdings: WeightedPricedPointsHoldings) -> None:
+        loaded = pickle.loads(pickle.dumps(holdings))
+        assert loaded.table() == holdings.table()
+
+    def test_does_not_price(self, table: WeightedPricedPointsTable) -> None:
+        with patch.object(
+            PricedFlows,
+            "price",
+            new_callable=PropertyMock,
+        ) as mocked:
+            WeightedPricedPointsHoldings.from_table(table[:])
+        mocked.assert_not_called()
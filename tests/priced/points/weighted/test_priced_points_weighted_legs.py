@@ -0,0 +1,104 @@
+import pickle
+
+import pytest
+
+from bperf.curve import SpotCurve
+from bperf.flows import Flows
+from bperf.money import Money
+from bperf.priced import PricedFlows
+from bperf.priced.points.weighted.legs import (
+    LEGS_NAMES,
+    _LegsEncoder,
+    _PooledLegs,
+)
+from bperf.rate.continuous import ContinuousRate
+from bperf.term import Term
+from bperf.termed import Termed
+
+
+@pytest.fixture(scope="module")
+def spot() -> SpotCurve:
+    return SpotCurve(
+        [
+            Termed(Term(1.0), ContinuousRate(0.01)),
+            Termed(Term(2.0), ContinuousRate(0.02)),
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def leg(spot: SpotCurve) -> PricedFlows:
+    return PricedFlows(
+        Flows(
+            [
+                Termed(Term(1.0), Money(100)),
+                Termed(Term(1.5), Money(10100)),
+            ]
+        ),
+        spot,
+        ContinuousRate(0.002),
+    )
+
+
+@pytest.fixture(scope="module")
+def other(spot: SpotCurve) -> PricedFlows:
+    return PricedFlows(
+        Flows([Termed(Term(0.5), Money(10100))]),
+        SpotCurve(spot),  # equal, but distinct
+        ContinuousRate(0.003),
+    )
+
+
+@pytest.fixture(scope="module")
+def legs(leg: PricedFlows, other: PricedFlows) -> _PooledLegs:
+    encoder = _LegsEncoder()
+    encoder.add(leg)
+    encoder.add(other)
+    return _PooledLegs(**encoder.build())
+
+
+class TestLegsEncoder:
+    def test_add(self, leg: PricedFlows, other: PricedFlows) -> None:
+        encoder = _LegsEncoder()
+        assert encoder.add(leg) == 0
+        assert encoder.add(other) == 1
+        assert len(encoder) == 2
+
+    def test_build(self, legs: _PooledLegs) -> None:
+        arrays = legs.arrays
+        assert set(arrays) == set(LEGS_NAMES)
+        assert arrays["flows"].tolist() == [0, 2, 3]
+        assert arrays["terms"].tolist() == [1.0, 1.5, 0.5]
+        assert arrays["cents"].tolist() == [100, 10100, 10100]
+        assert arrays["spreads"].tolist() == [0.002, 0.003]
+
+    def test_pools_equal_curves(self, legs: _PooledLegs) -> None:
+        arrays = legs.arrays
+        assert arrays["spots"].tolist() == [0, 0]
+        assert arrays["curves"].tolist() == [0, 2]
+        assert arrays["tenors"].tolist() == [1.0, 2.0]
+
+    def test_when_empty(self) -> None:
+        legs = _PooledLegs(**_LegsEncoder().build())
+        assert legs.arrays["flows"].tolist() == [0]
+        assert legs.arrays["curves"].tolist() == [0]
+        assert legs.nbytes == 16
+
+
+class TestPooledLegs:
+    def test_leg(
+        self,
+        legs: _PooledLegs,
+        leg: PricedFlows,
+        other: PricedFlows,
+    ) -> None:
+        assert legs._leg(0) == leg
+        assert legs._leg(1) == other
+
+    def test_shares_spots(self, legs: _PooledLegs) -> None:
+        assert legs._leg(0).spot is legs._leg(1).spot
+
+    def test_pickle(self, legs: _PooledLegs, leg: PricedFlows) -> None:
+        unpickled = pickle.loads(pickle.dumps(legs))
+        assert unpickled._leg(0) == leg
+        assert unpickled.nbytes == legs.nbytes
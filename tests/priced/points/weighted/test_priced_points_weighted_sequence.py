@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 from bperf.curve import SpotCurve
@@ -97,6 +99,57 @@ class TestWeightedPricedPointsSequenceInvariants:
             )
 
 
+class TestWeightedPricedPointsSequenceSlice:
+    @pytest.fixture(scope="class")
+    def sequence(self, points: PricedPoints) -> WeightedPricedPointsSequence:
+        return WeightedPricedPointsSequence(
+            WeightedPricedPoints(Percent(percent), points)
+            for percent in (5000, 0, 5000)
+        )
+
+    @pytest.mark.parametrize("item", [slice(None), slice(None, None, -1)])
+    def test_when_keeps_every_value(
+        self,
+        sequence: WeightedPricedPointsSequence,
+        item: slice,
+    ) -> None:
+        with patch.object(PercentSequence, "sums_to") as mocked:
+            sliced = sequence[item]
+        mocked.assert_not_called()
+        assert list(sliced) == list(sequence)[item]
+
+    def test_when_sums_to_one(
+        self,
+        sequence: WeightedPricedPointsSequence,
+    ) -> None:
+        assert sequence[::2] == WeightedPricedPointsSequence(
+            list(sequence)[::2]
+        )
+
+    def test_when_does_not_sums_to_one(
+        self,
+        sequence: WeightedPricedPointsSequence,
+    ) -> None:
+        with pytest.raises(ValueError, match="sum"):
+            # noinspection PyStatementEffect
+            sequence[1:]
+
+    def test_when_empty(self, sequence: WeightedPricedPointsSequence) -> None:
+        assert sequence[3:] == WeightedPricedPointsSequence([])
+
+
+class TestWeightedPricedPointsSequenceValidate:
+    @patch.object(PricedPointsSequence, "validate")
+    def test(self, mocked: MagicMock, points: PricedPoints) -> None:
+        sequence = WeightedPricedPointsSequence(
+            [
+                WeightedPricedPoints(Percent(10000), points),
+            ]
+        )
+        sequence.validate()
+        mocked.assert_called_once_with()
+
+
 class TestWeightedPricedPointsSequenceProperties:
     @pytest.fixture(scope="class")
     def percents(self) -> PercentSequence:
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from bperf.curve import SpotCurve
@@ -85,6 +87,28 @@ class TestWeightedPricedPointsEqual:
     ) -> None:
         assert weighted != "a"
 
+    def test_when_same_object(
+        self,
+        percent: Percent,
+        points: PricedPoints,
+    ) -> None:
+        weighted = WeightedPricedPoints(percent, points)
+        with patch.object(PricedPoints, "__eq__") as mocked:
+            assert weighted == weighted
+        mocked.assert_not_called()
+
+    def test_when_different_hashes(
+        self,
+        percent: Percent,
+        points: PricedPoints,
+    ) -> None:
+        weighted = WeightedPricedPoints(percent, points)
+        other = WeightedPricedPoints(Percent(2), points)
+        hash(weighted), hash(other)
+        with patch.object(PricedPoints, "__eq__") as mocked:
+            assert weighted != other
+        mocked.assert_not_called()
+
 
 class TestWeightedPricedPointsHash:
     def test_when_equal(
@@ -118,6 +142,12 @@ class TestWeightedPricedPointsHash:
         other = WeightedPricedPoints(percent, points_)
         assert hash(other) != hash(weighted)
 
+    def test_is_kept(self, percent: Percent, points: PricedPoints) -> None:
+        weighted = WeightedPricedPoints(percent, points)
+        with patch.object(PricedPoints, "__hash__", return_value=0) as mocked:
+            assert hash(weighted) == hash(weighted)
+        assert mocked.call_count == 1
+
 
 class TestWeightedPricedPointsRepresentation:
     def test(self, weighted: WeightedPricedPoints) -> None:
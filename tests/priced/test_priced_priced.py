@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from bperf.curve import SpotCurve
@@ -87,6 +89,30 @@ class TestPricedFlowsEqual:
     def test_when_different_object(self, priced: PricedFlows) -> None:
         assert priced != "a"
 
+    def test_when_same_object(
+        self,
+        flows: Flows,
+        spot: SpotCurve,
+        spread: ContinuousRate,
+    ) -> None:
+        priced = PricedFlows(flows, spot, spread)
+        with patch.object(Flows, "__eq__") as mocked:
+            assert priced == priced
+        mocked.assert_not_called()
+
+    def test_when_different_hashes(
+        self,
+        flows: Flows,
+        spot: SpotCurve,
+        spread: ContinuousRate,
+    ) -> None:
+        priced = PricedFlows(flows, spot, spread)
+        other = PricedFlows(flows, spot, spread + ContinuousRate(0.01))
+        hash(priced), hash(other)
+        with patch.object(Flows, "__eq__") as mocked:
+            assert priced != other
+        mocked.assert_not_called()
+
 
 class TestPricedFlowsHash:
     def test_when_equal(
@@ -129,6 +155,17 @@ class TestPricedFlowsHash:
         other = PricedFlows(flows, spot, spread + ContinuousRate(0.01))
         assert hash(other) != hash(priced)
 
+    def test_is_kept(
+        self,
+        flows: Flows,
+        spot: SpotCurve,
+        spread: ContinuousRate,
+    ) -> None:
+        priced = PricedFlows(flows, spot, spread)
+        with patch.object(Flows, "__hash__", return_value=0) as mocked:
+            assert hash(priced) == hash(priced)
+        assert mocked.call_count == 1
+
 
 class TestPriceFlowsRepresentation:
     def test(self, priced: PricedFlows) -> None:
@@ -157,6 +194,9 @@ class TestPricedFlowsProperties:
     ) -> None:
         assert priced.price == flows.pv(spot.add(spread))
 
+    def test_price_is_kept(self, priced: PricedFlows) -> None:
+        assert priced.price is priced.price
+
     def test_flows(self, priced: PricedFlows, flows: Flows) -> None:
         assert priced.flows == flows
 
@@ -0,0 +1,99 @@
+from math import isclose
+from unittest.mock import patch
+
+import pytest
+
+from bperf.curve import SpotCurve
+from bperf.flows import Flows
+from bperf.money import Money
+from bperf.priced import PricedFlows
+from bperf.priced.sequence import PricedFlowsSequence
+from bperf.rate.continuous import ContinuousRate
+from bperf.term import Term
+from bperf.termed import Termed
+
+
+def _spot() -> SpotCurve:
+    return SpotCurve(
+        [
+            Termed(Term(0.5), ContinuousRate(0.02)),
+            Termed(Term(3.0), ContinuousRate(0.01)),
+        ]
+    )
+
+
+def _sequence() -> PricedFlowsSequence:
+    flows = Flows(
+        [
+            Termed(Term(1.0), Money(300)),
+            Termed(Term(2.0), Money(-200)),
+        ]
+    )
+    other = Flows(
+        [
+            Termed(Term(0.25), Money(10000)),
+            Termed(Term(1.5), Money(1)),
+            Termed(Term(4.0), Money(50)),
+        ]
+    )
+    steep = SpotCurve(
+        [
+            Termed(Term(1.0), ContinuousRate(-0.01)),
+            Termed(Term(2.0), ContinuousRate(0.05)),
+        ]
+    )
+    return PricedFlowsSequence(
+        [
+            PricedFlows(flows, _spot(), ContinuousRate(-0.03)),
+            PricedFlows(other, steep, ContinuousRate(0.0)),
+            PricedFlows(other, _spot(), ContinuousRate(0.01)),
+            PricedFlows(flows, steep, ContinuousRate(0.02)),
+        ]
+    )
+
+
+class TestPricedFlowsSequencePrices:
+    def test(self) -> None:
+        sequence = _sequence()
+        prices = sequence.prices()
+        assert len(prices) == len(sequence)
+        for price, priced in zip(prices, sequence):
+            expected = priced.flows.pv(priced.spot.add(priced.spread))
+            assert isclose(price, expected, rel_tol=1e-12)
+
+    def test_prices_are_not_kept(self) -> None:
+        sequence = _sequence()
+        sequence.prices()
+        for priced in sequence:
+            expected = priced.flows.pv(priced.spot.add(priced.spread))
+            assert priced.price == expected
+
+    def test_interpolates_once_by_spot(self) -> None:
+        sequence = _sequence()
+        with patch.object(
+            SpotCurve,
+            "_interpolate",
+            autospec=True,
+            side_effect=SpotCurve._interpolate,
+        ) as interpolate:
+            sequence.prices()
+        assert interpolate.call_count == 2
+
+    def test_reuses_prices(self) -> None:
+        sequence = _sequence()
+        expected = [priced.price for priced in sequence]
+        with patch.object(SpotCurve, "_interpolate") as interpolate:
+            prices = sequence.prices()
+        interpolate.assert_not_called()
+        assert list(prices) == expected
+
+    def test_when_empty(self) -> None:
+        assert len(PricedFlowsSequence([]).prices()) == 0
+
+    def test_when_overflow(self) -> None:
+        flows = Flows([Termed(Term(1.0), Money(1))])
+        sequence = PricedFlowsSequence(
+            [PricedFlows(flows, _spot(), ContinuousRate(-1e308))]
+        )
+        with pytest.raises(OverflowError):
+            sequence.prices()
@@ -1,4 +1,4 @@
-from math import prod
+from math import exp, isclose, log1p, prod
 from typing import Any, List, Tuple
 
 import pytest
@@ -39,6 +39,32 @@ class TestPeriodicRateSequenceDot:
         expected = sequence.scale(by).sum()
         assert sequence.dot(iter(by)) == expected
 
+    def test_when_length_mismatch(self) -> None:
+        with pytest.raises(ValueError, match="length"):
+            _MULTIPLE.dot(_BY_ONE)
+
+    def test_when_by_is_not_finite(self) -> None:
+        with pytest.raises(ValueError, match="finite"):
+            _MULTIPLE.dot([1.0, float("inf"), 1.0])
+
+    @pytest.mark.parametrize(
+        "by",
+        [
+            [1.0, 1.0, 1e308],  # overflow of a scaled rate
+            [1e308, 1e308, -5e307],  # overflow of a partial sum
+        ],
+    )
+    def test_when_overflow(self, by: List[float]) -> None:
+        sequence = PeriodicRateSequence(
+            [
+                PeriodicRate(1.0),
+                PeriodicRate(1.0),
+                PeriodicRate(2.0),
+            ]
+        )
+        with pytest.raises(OverflowError):
+            sequence.dot(by)
+
 
 class TestPeriodicRateSequenceScale:
     @pytest.mark.parametrize(
@@ -74,6 +100,17 @@ class TestPeriodicRateSequenceSum:
         expected = sum(sequence, start=PeriodicRate(0.0))
         assert sequence.sum() == expected
 
+    def test_when_overflow(self) -> None:
+        sequence = PeriodicRateSequence(
+            [
+                PeriodicRate(1e308),
+                PeriodicRate(1e308),
+                PeriodicRate(-1e308),
+            ]
+        )
+        with pytest.raises(OverflowError):
+            sequence.sum()
+
 
 class TestPeriodicRateSequenceCompound:
     def test(self, sequence: PeriodicRateSequence) -> None:
@@ -83,6 +120,48 @@ class TestPeriodicRateSequenceCompound:
         ).decrement()  # type: ignore[attr-defined]
         assert sequence.compound() == expected
 
+    def test_when_log(self, sequence: PeriodicRateSequence) -> None:
+        expected = sequence.compound()
+        assert isclose(sequence.compound(log=True), expected, rel_tol=1e-12)
+
+    @pytest.mark.parametrize(
+        "rates, expected",
+        [
+            ([0.0001] * 10000, 1.0001**10000 - 1.0),
+            ([-0.5, -3.0], -2.0),  # negative growth factor
+            ([-0.5, -3.0, -3.0], 1.0),  # negative growth factors
+            ([-1.0, 2.0], -1.0),  # null growth factor
+        ],
+    )
+    def test_when_log_and_rates(
+        self,
+        rates: List[float],
+        expected: float,
+    ) -> None:
+        sequence = PeriodicRateSequence(PeriodicRate(rate) for rate in rates)
+        result = sequence.compound(log=True)
+        assert isclose(result, expected, rel_tol=1e-9)
+        assert isclose(sequence.compound(), result, rel_tol=1e-9)
+
+    @pytest.mark.parametrize("log", [False, True])
+    def test_when_overflow(self, log: bool) -> None:
+        sequence = PeriodicRateSequence(
+            [
+                PeriodicRate(1e200),
+                PeriodicRate(1e200),
+            ]
+        )
+        with pytest.raises(OverflowError):
+            sequence.compound(log=log)
+
+    def test_when_overflow_of_partial_product(self) -> None:
+        rates = [1e200] * 2 + [-0.9999999999] * 20
+        sequence = PeriodicRateSequence(PeriodicRate(rate) for rate in rates)
+        with pytest.raises(OverflowError):
+            sequence.compound()
+        expected = exp(sum(log1p(rate) for rate in rates)) - 1.0
+        assert isclose(sequence.compound(log=True), expected, rel_tol=1e-9)
+
 
 class TestPeriodicRateSequenceEmpty:
     @pytest.fixture(scope="class")
@@ -100,3 +179,4 @@ class TestPeriodicRateSequenceEmpty:
 
     def test_compound(self, sequence: PeriodicRateSequence) -> None:
         assert sequence.compound() == PeriodicRate(0.0)
+        assert sequence.compound(log=True) == PeriodicRate(0.0)
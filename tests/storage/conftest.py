@@ -0,0 +1,49 @@
+import pytest
+
+from bperf.curve import SpotCurve
+from bperf.flows import Flows
+from bperf.money import Money
+from bperf.percent import Percent
+from bperf.priced import PricedFlows
+from bperf.priced.points import PricedPoints
+from bperf.priced.points.weighted import WeightedPricedPoints
+from bperf.priced.points.weighted.sequence import WeightedPricedPointsSequence
+from bperf.priced.points.weighted.table import WeightedPricedPointsTable
+from bperf.rate.continuous import ContinuousRate
+from bperf.term import Term
+from bperf.termed import Termed
+
+
+@pytest.fixture(scope="module")
+def table() -> WeightedPricedPointsTable:
+    priced = PricedFlows(
+        Flows(
+            [
+                Termed(Term(1.0), Money(100)),
+                Termed(Term(2.0), Money(10100)),
+            ]
+        ),
+        SpotCurve(
+            [
+                Termed(Term(1.0), ContinuousRate(0.01)),
+                Termed(Term(3.0), ContinuousRate(0.02)),
+            ]
+        ),
+        ContinuousRate(0.002),
+    )
+    points = PricedPoints(priced, priced.update_spread(ContinuousRate(0.001)))
+    return WeightedPricedPointsTable(
+        [
+            WeightedPricedPointsSequence(
+                [
+                    WeightedPricedPoints(Percent(4000), points),
+                    WeightedPricedPoints(Percent(6000), points),
+                ]
+            ),
+            WeightedPricedPointsSequence(
+                [
+                    WeightedPricedPoints(Percent(10000), points),
+                ]
+            ),
+        ]
+    )
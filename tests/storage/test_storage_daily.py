@@ -0,0 +1,231 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from bperf.curve import SpotCurve
+from bperf.flows import Flows
+from bperf.money import Money
+from bperf.percent import Percent
+from bperf.priced import PricedFlows
+from bperf.priced.points import PricedPoints
+from bperf.priced.points.weighted import WeightedPricedPoints
+from bperf.priced.points.weighted.sequence import WeightedPricedPointsSequence
+from bperf.priced.points.weighted.table import WeightedPricedPointsTable
+from bperf.rate.continuous import ContinuousRate
+from bperf.storage import DailyPointsStore
+from bperf.term import Term
+from bperf.termed import Termed
+
+_DATES = ("2022-05-10", "2022-05-11", "2022-05-12")
+_RANGE = (_DATES[0], _DATES[-1])
+_POSITIONS = [
+    [("alpha", "bond", 10000), ("beta", "note", 10000)],
+    [("alpha", "note", 6000), ("alpha", "bond", 4000)],
+    [("beta", "note", 10000)],
+]
+
+
+def _curve(day: int) -> SpotCurve:
+    return SpotCurve(
+        [
+            Termed(Term(1.0), ContinuousRate(0.01 + 0.001 * day)),
+            Termed(Term(2.0), ContinuousRate(0.02 + 0.001 * day)),
+        ]
+    )
+
+
+def _flows(day: int, cents: int) -> Flows:
+    return Flows(
+        [
+            Termed(Term(1.0 - 0.01 * day), Money(cents // 10)),
+            Termed(Term(2.0 - 0.01 * day), Money(cents)),
+        ]
+    )
+
+
+def _priced(day: int, cents: int) -> PricedFlows:
+    return PricedFlows(_flows(day, cents), _curve(day), ContinuousRate(0.001))
+
+
+def _points(weight: int, start: int, cents: int) -> WeightedPricedPoints:
+    return WeightedPricedPoints(
+        Percent(weight),
+        PricedPoints(_priced(start, cents), _priced(start + 1, cents)),
+    )
+
+
+def _day(day: int) -> Dict[str, Dict[str, List[Any]]]:
+    securities = [("bond", 10000), ("note", 5000)]
+    flows = [
+        (security, float(termed.term), termed.value.scaled)
+        for security, cents in securities
+        for termed in _flows(day, cents)
+    ]
+    return {
+        "positions": {
+            "identifier": [row[0] for row in _POSITIONS[day]],
+            "security": [row[1] for row in _POSITIONS[day]],
+            "weight": [row[2] for row in _POSITIONS[day]],
+        },
+        "securities": {
+            "security": [security for security, _ in securities],
+            "curve": ["govt"] * len(securities),
+            "spread": [0.001] * len(securities),
+        },
+        "flows": {
+            "security": [row[0] for row in flows],
+            "term": [row[1] for row in flows],
+            "cents": [row[2] for row in flows],
+        },
+        "curves": {
+            "curve": ["govt"] * len(_curve(day)),
+            "tenor": [float(termed.term) for termed in _curve(day)],
+            "rate": [float(termed.value) for termed in _curve(day)],
+        },
+    }
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> DailyPointsStore:
+    store = DailyPointsStore(tmp_path / "store")
+    for day, date in enumerate(_DATES):
+        store.append(date, **_day(day))
+    return store
+
+
+_ALPHA = WeightedPricedPointsTable(
+    [
+        WeightedPricedPointsSequence([_points(10000, 0, 10000)]),
+        WeightedPricedPointsSequence(
+            [_points(4000, 1, 10000), _points(6000, 1, 5000)]
+        ),
+    ]
+)
+_BETA = WeightedPricedPointsTable(
+    [
+        WeightedPricedPointsSequence([_points(10000, 0, 5000)]),
+        WeightedPricedPointsSequence([]),
+    ]
+)
+
+
+class TestDailyPointsStoreInvariants:
+    def test_when_unsupported(self, tmp_path: Path) -> None:
+        DailyPointsStore(tmp_path)
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        manifest["version"] = 0
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+        with pytest.raises(ValueError, match="unsupported"):
+            DailyPointsStore(tmp_path)
+
+    def test_when_empty(self, tmp_path: Path) -> None:
+        assert DailyPointsStore(tmp_path).dates == ()
+
+
+class TestDailyPointsStoreAppend:
+    def test_dates(self, store: DailyPointsStore) -> None:
+        assert store.dates == _DATES
+
+    def test_when_not_after(self, store: DailyPointsStore) -> None:
+        with pytest.raises(ValueError, match="greater"):
+            store.append(_DATES[1], **_day(1))
+
+    def test_when_column_missing(self, tmp_path: Path) -> None:
+        day = _day(0)
+        del day["flows"]["cents"]
+        with pytest.raises(ValueError, match="cents"):
+            DailyPointsStore(tmp_path).append(_DATES[0], **day)
+
+    def test_when_lengths_differ(self, tmp_path: Path) -> None:
+        day = _day(0)
+        day["curves"]["rate"].pop()
+        with pytest.raises(ValueError, match="lengths"):
+            DailyPointsStore(tmp_path).append(_DATES[0], **day)
+
+    def test_when_invalid_value(self, tmp_path: Path) -> None:
+        day = _day(0)
+        day["positions"]["weight"][0] = "all"
+        with pytest.raises(ValueError, match="weight"):
+            DailyPointsStore(tmp_path).append(_DATES[0], **day)
+
+    def test_when_weights_invalid(self, tmp_path: Path) -> None:
+        day = _day(0)
+        day["positions"]["weight"][0] = 5000
+        with pytest.raises(ValueError, match="weights"):
+            DailyPointsStore(tmp_path).append(_DATES[0], **day)
+
+    def test_when_held_security_missing(self, tmp_path: Path) -> None:
+        store = DailyPointsStore(tmp_path)
+        store.append(_DATES[0], **_day(0))
+        day = _day(1)
+        day["positions"] = {"identifier": [], "security": [], "weight": []}
+        day["securities"] = {"security": [], "curve": [], "spread": []}
+        with pytest.raises(ValueError, match="bond"):
+            store.append(_DATES[1], **day)
+        assert store.dates == _DATES[:1]
+
+    def test_when_failed_leaves_store(self, store: DailyPointsStore) -> None:
+        day = _day(0)
+        day["curves"] = {"curve": [], "tenor": [], "rate": []}
+        with pytest.raises(ValueError, match="govt"):
+            store.append("2022-05-13", **day)
+        assert store.read("alpha", _RANGE) == _ALPHA
+
+    def test_is_proportional_to_day(self, store: DailyPointsStore) -> None:
+        lengths = json.loads((store.path / "manifest.json").read_text())
+        weights = lengths["lengths"]["weights"]
+        store.append("2022-05-13", **_day(0))
+        lengths = json.loads((store.path / "manifest.json").read_text())
+        assert lengths["lengths"]["weights"] == weights + len(_POSITIONS[2])
+
+
+class TestDailyPointsStoreRead:
+    def test(self, store: DailyPointsStore) -> None:
+        assert store.read("alpha", _RANGE) == _ALPHA
+
+    def test_when_no_position(self, store: DailyPointsStore) -> None:
+        assert store.read("beta", _RANGE) == _BETA
+
+    def test_when_partial_range(self, store: DailyPointsStore) -> None:
+        assert store.read("alpha", (_DATES[1], _DATES[2])) == _ALPHA[1:]
+
+    def test_when_reopened(self, store: DailyPointsStore) -> None:
+        assert DailyPointsStore(store.path).read("alpha", _RANGE) == _ALPHA
+
+    def test_is_memory_mapped(self, store: DailyPointsStore) -> None:
+        store.read("alpha", _RANGE)
+        # noinspection PyProtectedMember
+        columns = store._mapped()
+        assert all(
+            isinstance(array, np.memmap) for array in columns.arrays.values()
+        )
+
+    def test_when_unknown_identifier(self, store: DailyPointsStore) -> None:
+        with pytest.raises(ValueError, match="joker"):
+            store.read("joker", _RANGE)
+
+    def test_when_date_not_stored(self, store: DailyPointsStore) -> None:
+        with pytest.raises(ValueError, match="2022-05-13"):
+            store.read("alpha", (_DATES[0], "2022-05-13"))
+
+    def test_when_no_period(self, store: DailyPointsStore) -> None:
+        with pytest.raises(ValueError, match="period"):
+            store.read("alpha", (_DATES[1], _DATES[1]))
+
+    def test_after_append(self, store: DailyPointsStore) -> None:
+        table = store.read("alpha", _RANGE)
+        store.append("2022-05-13", **_day(0))
+        assert table == _ALPHA
+        assert store.read("beta", (_DATES[2], "2022-05-13"))[0] == (
+            WeightedPricedPointsSequence(
+                [
+                    WeightedPricedPoints(
+                        Percent(10000),
+                        PricedPoints(_priced(2, 5000), _priced(0, 5000)),
+                    )
+                ]
+            )
+        )
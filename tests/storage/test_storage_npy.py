@@ -0,0 +1,98 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from bperf.percent import Percent
+from bperf.priced.points.weighted.table import WeightedPricedPointsTable
+from bperf.storage import NpyTableStorage
+
+
+class TestNpyTableStorage:
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_roundtrip(
+        self,
+        tmp_path: Path,
+        table: WeightedPricedPointsTable,
+        mmap: bool,
+    ) -> None:
+        storage = NpyTableStorage(tmp_path / "table")
+        storage.write(table)
+        assert storage.read(mmap=mmap) == table
+
+    def test_memory_maps(
+        self,
+        tmp_path: Path,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        storage = NpyTableStorage(tmp_path)
+        storage.write(table)
+        columns = storage.read_columns()
+        assert all(
+            isinstance(array, np.memmap) for array in columns.arrays.values()
+        )
+
+    def test_overwrites(
+        self,
+        tmp_path: Path,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        storage = NpyTableStorage(tmp_path)
+        storage.write(table)
+        storage.write(table[:1])
+        assert storage.read() == table[:1]
+
+    def test_when_unsupported(
+        self,
+        tmp_path: Path,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        storage = NpyTableStorage(tmp_path)
+        storage.write(table)
+        header = {"format": NpyTableStorage.FORMAT, "version": 0}
+        (tmp_path / "header.json").write_text(json.dumps(header))
+        with pytest.raises(ValueError, match="unsupported"):
+            storage.read()
+
+    def test_when_invalid(
+        self,
+        tmp_path: Path,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        storage = NpyTableStorage(tmp_path)
+        storage.write(table)
+        np.save(tmp_path / "weights.npy", np.array([4000, 6000, 9999]))
+        with pytest.raises(ValueError):
+            storage.read()
+
+    def test_when_weights_are_floats(
+        self,
+        tmp_path: Path,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        storage = NpyTableStorage(tmp_path)
+        storage.write(table)
+        weights = np.load(tmp_path / "weights.npy").astype(np.float64)
+        weights[:2] += [0.5, -0.5]  # still summing to one
+        np.save(tmp_path / "weights.npy", weights)
+        with pytest.raises(ValueError, match="weights must be integers"):
+            storage.read()
+
+    def test_when_invalid_and_not_validated(
+        self,
+        tmp_path: Path,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        storage = NpyTableStorage(tmp_path)
+        storage.write(table)
+        np.save(tmp_path / "weights.npy", np.array([4000, 6000, 9999]))
+        read = storage.read(validate=False)
+        assert read[1][0].percent == Percent(9999)
+
+    def test_when_missing(self, tmp_path: Path) -> None:
+        with pytest.raises(OSError):
+            NpyTableStorage(tmp_path).read()
+
+    def test_path(self, tmp_path: Path) -> None:
+        assert NpyTableStorage(tmp_path).path == tmp_path
@@ -0,0 +1,131 @@
+from pathlib import Path
+from threading import Thread
+from typing import Dict, Iterator
+
+import pytest
+
+from bperf.rate.periodic import PeriodicRate
+from bperf.rate.periodic.sequence import PeriodicRateSequence
+from bperf.storage import IRatesStore, SqliteRatesStore
+
+_PERIODS = [("2022-05-24", "2022-05-25"), ("2022-05-25", "2022-05-26")]
+_RATES = {
+    "total": PeriodicRateSequence([PeriodicRate(0.01), PeriodicRate(-0.02)]),
+    "carry": PeriodicRateSequence([PeriodicRate(0.001), PeriodicRate(0.0)]),
+}
+
+
+def _rates(offset: float) -> Dict[str, PeriodicRateSequence]:
+    return {
+        name: PeriodicRateSequence(
+            PeriodicRate(float(rate) + offset) for rate in rates
+        )
+        for name, rates in _RATES.items()
+    }
+
+
+class TestIRatesStore:
+    def test_stored(self) -> None:
+        with pytest.raises(NotImplementedError):
+            IRatesStore().stored("a", _PERIODS)
+
+    def test_put(self) -> None:
+        with pytest.raises(NotImplementedError):
+            IRatesStore().put("a", _PERIODS, _RATES)
+
+    def test_get(self) -> None:
+        with pytest.raises(NotImplementedError):
+            IRatesStore().get("a", _PERIODS)
+
+
+class TestSqliteRatesStore:
+    @pytest.fixture
+    def store(self) -> Iterator[SqliteRatesStore]:
+        store = SqliteRatesStore(":memory:")
+        yield store
+        store.close()
+
+    def test_when_empty(self, store: SqliteRatesStore) -> None:
+        assert store.stored("a", _PERIODS) == set()
+        with pytest.raises(KeyError, match="not stored"):
+            store.get("a", _PERIODS)
+
+    def test_when_no_periods(self, store: SqliteRatesStore) -> None:
+        assert store.stored("a", []) == set()
+        assert store.get("a", []) == {}
+
+    def test_put_and_get(self, store: SqliteRatesStore) -> None:
+        store.put("a", _PERIODS, _RATES)
+        assert store.stored("a", _PERIODS) == set(_PERIODS)
+        result = store.get("a", _PERIODS)
+        assert result == _RATES
+        assert list(result) == list(_RATES)
+
+    def test_get_subset(self, store: SqliteRatesStore) -> None:
+        store.put("a", _PERIODS, _RATES)
+        expected = {name: rates[1:] for name, rates in _RATES.items()}
+        assert store.get("a", _PERIODS[1:]) == expected
+
+    def test_get_when_partially_stored(self, store: SqliteRatesStore) -> None:
+        store.put("a", _PERIODS[:1], {n: r[:1] for n, r in _RATES.items()})
+        assert store.stored("a", _PERIODS) == set(_PERIODS[:1])
+        with pytest.raises(KeyError, match="2022-05-26"):
+            store.get("a", _PERIODS)
+
+    def test_stored_when_name_missing(self, store: SqliteRatesStore) -> None:
+        store.put("a", _PERIODS[:1], {"total": _RATES["total"][:1]})
+        store.put("a", _PERIODS[1:], {n: r[1:] for n, r in _RATES.items()})
+        assert store.stored("a", _PERIODS) == set(_PERIODS[1:])
+        assert store.stored("a", _PERIODS[:1]) == set(_PERIODS[:1])
+        with pytest.raises(KeyError, match="2022-05-25"):
+            store.get("a", _PERIODS)
+
+    def test_stored_with_names(self, store: SqliteRatesStore) -> None:
+        store.put("a", _PERIODS[:1], {"total": _RATES["total"][:1]})
+        store.put("a", _PERIODS[1:], {n: r[1:] for n, r in _RATES.items()})
+        assert store.stored("a", _PERIODS, names=["total"]) == set(_PERIODS)
+        assert store.stored("a", _PERIODS, names=["carry"]) == {_PERIODS[1]}
+        assert store.stored("a", _PERIODS[:1], names=_RATES) == set()
+
+    def test_get_with_names(self, store: SqliteRatesStore) -> None:
+        store.put("a", _PERIODS, _RATES)
+        result = store.get("a", _PERIODS, names=["carry", "total"])
+        assert list(result) == ["carry", "total"]
+        assert result == _RATES
+        with pytest.raises(KeyError, match="not stored"):
+            store.get("a", _PERIODS, names=["curve"])
+
+    def test_put_replaces(self, store: SqliteRatesStore) -> None:
+        store.put("a", _PERIODS, _RATES)
+        store.put("a", _PERIODS, _rates(0.5))
+        assert store.get("a", _PERIODS) == _rates(0.5)
+
+    def test_separates_identifiers(self, store: SqliteRatesStore) -> None:
+        store.put("a", _PERIODS, _RATES)
+        store.put("b", _PERIODS, _rates(0.5))
+        assert store.get("a", _PERIODS) == _RATES
+        assert store.stored("c", _PERIODS) == set()
+
+    def test_put_when_length_mismatch(self, store: SqliteRatesStore) -> None:
+        with pytest.raises(ValueError, match="one rate per period"):
+            store.put("a", _PERIODS[:1], _RATES)
+
+    def test_persists(self, tmp_path: Path) -> None:
+        store = SqliteRatesStore(tmp_path / "rates.sqlite")
+        store.put("a", _PERIODS, _RATES)
+        store.close()
+        assert (
+            SqliteRatesStore(tmp_path / "rates.sqlite").get("a", _PERIODS)
+            == _RATES
+        )
+
+    def test_threads(self, store: SqliteRatesStore) -> None:
+        threads = [
+            Thread(target=store.put, args=(str(index), _PERIODS, _RATES))
+            for index in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert all(store.get(str(i), _PERIODS) == _RATES for i in range(8))
@@ -0,0 +1,70 @@
+import gc
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from bperf.priced.points.weighted.columns import WeightedPricedPointsColumns
+from bperf.priced.points.weighted.table import WeightedPricedPointsTable
+from bperf.storage import SharedTable, SharedTableDescriptor
+
+
+def _count_points(descriptor: SharedTableDescriptor) -> int:
+    shared = SharedTable(descriptor)
+    count = sum(len(sequence) for sequence in shared.table())
+    gc.collect()
+    shared.close()
+    return count
+
+
+class TestSharedTable:
+    def test_roundtrip(self, table: WeightedPricedPointsTable) -> None:
+        with SharedTable.create(table) as shared:
+            attached = SharedTable(shared.descriptor)
+            assert attached.table() == table
+            attached.close()
+
+    def test_when_columns(self, table: WeightedPricedPointsTable) -> None:
+        columns = WeightedPricedPointsColumns.from_table(table)
+        with SharedTable.create(columns) as shared:
+            assert shared.table() == table
+            gc.collect()
+
+    def test_read_only(self, table: WeightedPricedPointsTable) -> None:
+        with SharedTable.create(table) as shared:
+            columns = shared.columns()
+            with pytest.raises(ValueError):
+                columns.arrays["weights"][0] = 0
+            del columns
+
+    def test_when_empty(self) -> None:
+        with SharedTable.create(WeightedPricedPointsTable([])) as shared:
+            assert len(shared.table()) == 0
+            gc.collect()
+
+    def test_descriptor_is_small(
+        self,
+        table: WeightedPricedPointsTable,
+    ) -> None:
+        with SharedTable.create(table) as shared:
+            pickled = pickle.dumps(shared.descriptor)
+            assert pickle.loads(pickled) == shared.descriptor
+            assert len(pickled) < len(pickle.dumps(table))
+
+    def test_when_closed(self, table: WeightedPricedPointsTable) -> None:
+        with SharedTable.create(table) as shared:
+            shared.close()
+            with pytest.raises(ValueError, match="closed"):
+                shared.columns()
+
+    def test_when_unlinked(self, table: WeightedPricedPointsTable) -> None:
+        with SharedTable.create(table) as shared:
+            descriptor = shared.descriptor
+        with pytest.raises(FileNotFoundError):
+            SharedTable(descriptor)
+
+    def test_process_pool(self, table: WeightedPricedPointsTable) -> None:
+        with SharedTable.create(table) as shared:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                count = executor.submit(_count_points, shared.descriptor)
+                assert count.result() == 3
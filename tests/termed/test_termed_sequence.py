@@ -1,4 +1,6 @@
+import pickle
 from typing import Iterable, Tuple
+from unittest.mock import patch
 
 import pytest
 
@@ -86,6 +88,53 @@ class TestTermedSequenceInvariants:
         )  # does not raise
 
 
+class TestTermedSequenceSlice:
+    @pytest.fixture(scope="class")
+    def sequence(self) -> TermedSequence[_T]:
+        return TermedSequence(
+            [
+                Termed(Term(1.0), _T(1)),
+                Termed(Term(2.0), _T(2)),
+                Termed(Term(3.0), _T(3)),
+            ]
+        )
+
+    @pytest.mark.parametrize(
+        "item",
+        [
+            slice(1, None),
+            slice(None, None, 2),
+            slice(None, None, -1),
+            slice(None, 0, -2),
+            slice(3, None),
+        ],
+    )
+    def test(self, sequence: TermedSequence[_T], item: slice) -> None:
+        expected = TermedSequence(tuple(sequence)[item])
+        assert sequence[item] == expected
+        assert list(sequence[item]) == list(expected)
+
+    def test_does_not_validate(self, sequence: TermedSequence[_T]) -> None:
+        with patch.object(TermedSequence, "__init__") as mocked:
+            sequence[::-1]
+        mocked.assert_not_called()
+
+
+class TestTermedSequencePickle:
+    def test(self) -> None:
+        sequence = TermedSequence(
+            [Termed(Term(2.0), _T(1)), Termed(Term(1.0), _T(2))]
+        )
+        loaded = pickle.loads(pickle.dumps(sequence))
+        assert loaded == sequence
+        assert loaded._terms_array.tolist() == [1.0, 2.0]
+        assert not loaded._terms_array.flags.writeable
+
+    def test_when_empty(self) -> None:
+        sequence: TermedSequence[_T] = TermedSequence([])
+        assert pickle.loads(pickle.dumps(sequence)) == sequence
+
+
 class TestTermedSequenceAlternativeConstructors:
     @pytest.mark.parametrize(
         "tuples",
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from bperf.term import Term
@@ -74,6 +76,19 @@ class TestTermedEqual:
     def test_when_different_object(self, termed: Termed[_T]) -> None:
         assert termed != "a"
 
+    def test_when_same_object(self, term: Term, value: _T) -> None:
+        termed = Termed(term, value)
+        with patch.object(_T, "__eq__") as mocked:
+            assert termed == termed
+        mocked.assert_not_called()
+
+    def test_when_different_hashes(self, term: Term) -> None:
+        termed, other = Termed(term, _T(1)), Termed(term, _T(2))
+        hash(termed), hash(other)
+        with patch.object(_T, "__eq__") as mocked:
+            assert termed != other
+        mocked.assert_not_called()
+
 
 class TestTermedHash:
     def test_when_equal(
@@ -105,6 +120,12 @@ class TestTermedHash:
         other = Termed(term, value)
         assert hash(other) != hash(termed)
 
+    def test_is_kept(self, term: Term, value: _T) -> None:
+        termed = Termed(term, value)
+        with patch.object(_T, "__hash__", return_value=0) as mocked:
+            assert hash(termed) == hash(termed)
+        assert mocked.call_count == 1
+
 
 class TestTermedRepresentation:
     def test(self, termed: Termed[_T]) -> None:
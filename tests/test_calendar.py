@@ -0,0 +1,10 @@
+import pytest
+
+from bperf.calendar import IBusinessCalendar
+
+
+class TestIBusinessCalendar:
+    def test(self) -> None:
+        calendar = IBusinessCalendar()
+        with pytest.raises(NotImplementedError):
+            calendar.dates(("", ""))
@@ -1,7 +1,9 @@
+import pickle
+
 import numpy as np
 import pytest
 
-from bperf.curve import Curve, SpotCurve
+from bperf.curve import Curve, SpotCurve, SpotCurveInterner
 from bperf.discount.sequence import DiscountSequence
 from bperf.rate.continuous import ContinuousRate
 from bperf.rate.continuous.sequence import ContinuousRateSequence
@@ -15,6 +17,13 @@ class TestCurveInvariants:
         with pytest.raises(ValueError, match="empty"):
             Curve([])
 
+    def test_when_empty_slice(self) -> None:
+        curve = Curve([Termed(Term(1.0), ContinuousRate(0.01))])
+        assert curve[:] == curve
+        with pytest.raises(ValueError, match="empty"):
+            # noinspection PyStatementEffect
+            curve[1:]
+
 
 class TestCurveProperties:
     @pytest.fixture(scope="class")
@@ -47,6 +56,20 @@ class TestCurveProperties:
         assert curve.rates == rates
 
 
+class TestCurvePickle:
+    def test(self) -> None:
+        curve = SpotCurve(
+            [
+                Termed(Term(1.0), ContinuousRate(0.01)),
+                Termed(Term(3.0), ContinuousRate(0.02)),
+            ]
+        )
+        loaded = pickle.loads(pickle.dumps(curve))
+        assert isinstance(loaded, SpotCurve)
+        assert loaded == curve
+        assert loaded._rates_array.tolist() == [0.01, 0.02]
+
+
 class TestSpotCurveDiscountAt:
     @pytest.mark.parametrize(
         "spot",
@@ -160,3 +183,49 @@ class TestSpotCurveAdd:
         )
         new = spot.add(ContinuousRate(0.0))
         assert new is not spot
+
+
+class TestSpotCurveInterner:
+    @pytest.fixture
+    def spot(self) -> SpotCurve:
+        return SpotCurve(
+            [
+                Termed(Term(1.0), ContinuousRate(0.01)),
+                Termed(Term(2.0), ContinuousRate(0.02)),
+            ]
+        )
+
+    def test_when_equal(self, spot: SpotCurve) -> None:
+        interner = SpotCurveInterner()
+        equal = SpotCurve.from_tuples(zip(spot.terms, spot.rates))
+        assert interner.intern(spot) is spot
+        assert interner.intern(equal) is spot
+        assert len(interner) == 1
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            SpotCurve(
+                [
+                    Termed(Term(1.0), ContinuousRate(0.01)),
+                    Termed(Term(3.0), ContinuousRate(0.02)),
+                ]
+            ),
+            SpotCurve(
+                [
+                    Termed(Term(1.0), ContinuousRate(0.01)),
+                    Termed(Term(2.0), ContinuousRate(0.03)),
+                ]
+            ),
+            SpotCurve(
+                [
+                    Termed(Term(1.0), ContinuousRate(0.01)),
+                ]
+            ),
+        ],
+    )
+    def test_when_different(self, spot: SpotCurve, other: SpotCurve) -> None:
+        interner = SpotCurveInterner()
+        interner.intern(spot)
+        assert interner.intern(other) is other
+        assert len(interner) == 2
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from bperf.curve import SpotCurve
@@ -27,6 +29,25 @@ class TestFlowsProperties:
         assert flows.monies == monies
 
 
+class TestFlowsPickle:
+    def test(self) -> None:
+        flows = Flows(
+            [
+                Termed(Term(1.0), Money(3)),
+                Termed(Term(2.0), Money(-2)),
+            ]
+        )
+        assert pickle.loads(pickle.dumps(flows)) == flows
+
+    def test_packs(self) -> None:
+        flows = Flows(Termed(Term(i + 1.0), Money(i)) for i in range(100))
+        assert len(pickle.dumps(flows)) < 2 * 100 * 8 + 200
+
+    def test_when_monies_do_not_fit_in_64_bits(self) -> None:
+        flows = Flows([Termed(Term(1.0), Money(2**70))])
+        assert pickle.loads(pickle.dumps(flows)) == flows
+
+
 class TestFlowsPv:
     @pytest.mark.parametrize(
         "flows",
@@ -0,0 +1,89 @@
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+import bperf
+from bperf.curve import SpotCurve
+from bperf.flows import Flows
+from bperf.money import Money
+from bperf.profiling import Profile, Profiler
+from bperf.rate.continuous import ContinuousRate
+from bperf.term import Term
+from bperf.termed import Termed
+
+_ROOT = Path(bperf.__file__).parent
+
+
+def _price() -> None:
+    flows = Flows(
+        [
+            Termed(Term(1.0), Money(100)),
+            Termed(Term(2.0), Money(10000)),
+        ]
+    )
+    spot = SpotCurve(
+        [
+            Termed(Term(1.0), ContinuousRate(0.01)),
+            Termed(Term(3.0), ContinuousRate(0.02)),
+        ]
+    )
+    flows.pv(spot)
+
+
+class TestProfileComponentOf:
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            (_ROOT / "curve.py", "curve"),
+            (_ROOT / "flows.py", "flows"),
+            (_ROOT / "priced" / "priced.py", "priced"),
+            (_ROOT / "performance" / "effect" / "carry.py", "performance"),
+            (Path("~").expanduser() / "other.py", Profile.EXTERNAL),
+            ("<built-in method builtins.sum>", Profile.EXTERNAL),
+        ],
+    )
+    def test(self, filename: Path, expected: str) -> None:
+        assert Profile.component_of(str(filename)) == expected
+
+
+class TestProfiler:
+    def test_when_not_exited(self) -> None:
+        profiler = Profiler()
+        with pytest.raises(RuntimeError, match="not exited"):
+            profiler.profile
+
+    def test_aggregates_by_component(self) -> None:
+        with Profiler() as profiler:
+            _price()
+        profile = profiler.profile
+        assert {"curve", "flows"} <= set(profile.times)
+        assert profile.calls["curve"] > 0
+        assert sum(profile.times.values()) >= 0.0
+        assert profile.peak > 0
+
+    def test_when_no_memory(self) -> None:
+        with Profiler(memory=False) as profiler:
+            _price()
+        assert profiler.profile.memory == {}
+        assert profiler.profile.peak == 0
+
+    def test_stops_tracing_when_started(self) -> None:
+        assert not tracemalloc.is_tracing()
+        with Profiler():
+            assert tracemalloc.is_tracing()
+        assert not tracemalloc.is_tracing()
+
+    def test_keeps_tracing_when_already_tracing(self) -> None:
+        tracemalloc.start()
+        try:
+            with Profiler():
+                _price()
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+    def test_str(self) -> None:
+        with Profiler() as profiler:
+            _price()
+        assert "peak" in str(profiler.profile)
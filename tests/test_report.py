@@ -1,11 +1,24 @@
-from unittest.mock import MagicMock, patch
+from typing import Any, Dict, Iterator, Tuple
+from unittest.mock import MagicMock, PropertyMock, call, patch
 
+import numpy as np
 import pytest
 
+from bperf.calendar import IBusinessCalendar
 from bperf.percent import Percent
 from bperf.performance import IPerformanceCalculator
+from bperf.priced.points.weighted.sequence import WeightedPricedPointsSequence
 from bperf.priced.points.weighted.table import WeightedPricedPointsTable
-from bperf.report import IDataPointsFetcher, PerformanceReportGenerator
+from bperf.profiling import Profile
+from bperf.rate.periodic import PeriodicRate
+from bperf.rate.periodic.sequence import PeriodicRateSequence
+from bperf.report import (
+    IDataPointsFetcher,
+    IncrementalPerformanceReportGenerator,
+    PerformanceReportGenerator,
+    PerformanceReportTable,
+)
+from bperf.storage import SqliteRatesStore
 
 
 class TestIDataPointsFetcher:
@@ -14,6 +27,22 @@ class TestIDataPointsFetcher:
         with pytest.raises(NotImplementedError):
             fetcher.fetch("", ("", ""))
 
+    def test_fetch_many(self) -> None:
+        fetcher = IDataPointsFetcher()
+        with pytest.raises(NotImplementedError):
+            fetcher.fetch_many([""], ("", ""))
+
+    def test_fetch_many_fetches_by_identifier(self) -> None:
+        tables = {"a": WeightedPricedPointsTable([])}
+        with patch.object(
+            IDataPointsFetcher,
+            "fetch",
+            side_effect=lambda identifier, _: tables[identifier],
+        ) as fetch:
+            fetched = IDataPointsFetcher().fetch_many(["a"], ("", ""))
+        assert fetched == tables
+        fetch.assert_called_once_with("a", ("", ""))
+
 
 class TestPerformanceReportGenerator:
     _TABLE = WeightedPricedPointsTable([])
@@ -42,3 +71,508 @@ class TestPerformanceReportGenerator:
         assert generator.generate(identifier, range_) == expected
         fetcher.assert_called_once_with(identifier, range_)
         calculator.assert_called_once_with(self._TABLE)
+
+    @patch.object(
+        IPerformanceCalculator,
+        "calculate",
+        return_value=_PERFORMANCE,
+    )
+    @patch.object(
+        IDataPointsFetcher,
+        "fetch",
+        return_value=_TABLE,
+    )
+    def test_with_profile(
+        self,
+        fetcher: MagicMock,
+        calculator: MagicMock,
+    ) -> None:
+        generator = PerformanceReportGenerator(
+            IDataPointsFetcher(),
+            IPerformanceCalculator(),
+        )
+        identifier = "batman"
+        range_ = ("2022-05-25", "2022-05-26")
+        report, profile = generator.generate_with_profile(identifier, range_)
+        assert report == generator.generate(identifier, range_)
+        assert isinstance(profile, Profile)
+        assert "report" in profile.times
+
+    @patch.object(
+        IPerformanceCalculator,
+        "calculate",
+        return_value=_PERFORMANCE,
+    )
+    @patch.object(
+        IDataPointsFetcher,
+        "fetch",
+        return_value=_TABLE,
+    )
+    def test_when_outputs(
+        self,
+        fetcher: MagicMock,
+        calculator: MagicMock,
+    ) -> None:
+        generator = PerformanceReportGenerator(
+            IDataPointsFetcher(),
+            IPerformanceCalculator(),
+        )
+        outputs = ["one"]
+        generator.generate(
+            "batman", ("2022-05-25", "2022-05-26"), outputs=outputs
+        )
+        calculator.assert_called_once_with(self._TABLE, outputs=outputs)
+
+    @patch.object(
+        IPerformanceCalculator,
+        "calculate",
+        return_value=_PERFORMANCE,
+    )
+    @patch.object(
+        IDataPointsFetcher,
+        "fetch",
+        return_value=_TABLE,
+    )
+    def test_bps(self, fetcher: MagicMock, calculator: MagicMock) -> None:
+        generator = PerformanceReportGenerator(
+            IDataPointsFetcher(),
+            IPerformanceCalculator(),
+        )
+        identifier = "batman"
+        range_ = ("2022-05-25", "2022-05-26")
+        assert generator.generate_bps(identifier, range_) == {"one": 1}
+        fetcher.assert_called_once_with(identifier, range_)
+        calculator.assert_called_once_with(self._TABLE)
+
+
+class _BaselineCalculator(IPerformanceCalculator):
+    # calculator implementing calculate without outputs, nor names
+    def calculate(  # type: ignore[override]
+        self,
+        table: WeightedPricedPointsTable,
+    ) -> Dict[str, Percent]:
+        return {"one": Percent(1), "two": Percent(-2)}
+
+
+class TestPerformanceReportGeneratorWithBaselineCalculator:
+    @pytest.fixture
+    def generator(self) -> Iterator[PerformanceReportGenerator]:
+        with patch.object(
+            IDataPointsFetcher,
+            "fetch",
+            return_value=WeightedPricedPointsTable([]),
+        ):
+            yield PerformanceReportGenerator(
+                IDataPointsFetcher(),
+                _BaselineCalculator(),
+            )
+
+    def test(self, generator: PerformanceReportGenerator) -> None:
+        report = generator.generate("batman", _RANGE)
+        assert report == {"one": "0.0001", "two": "-0.0002"}
+
+    def test_bps(self, generator: PerformanceReportGenerator) -> None:
+        assert generator.generate_bps("batman", _RANGE) == {"one": 1, "two": -2}
+
+    def test_table(self, generator: PerformanceReportGenerator) -> None:
+        table = generator.generate_table(["batman", "robin"], _RANGE)
+        assert table.names == ("one", "two")
+        np.testing.assert_array_equal(table.bps, [[1, -2], [1, -2]])
+
+    def test_many(self, generator: PerformanceReportGenerator) -> None:
+        reports = dict(generator.generate_many(["batman"], _RANGE))
+        assert reports == {"batman": {"one": "0.0001", "two": "-0.0002"}}
+
+    def test_with_profile(self, generator: PerformanceReportGenerator) -> None:
+        report, _ = generator.generate_with_profile("batman", _RANGE)
+        assert report == {"one": "0.0001", "two": "-0.0002"}
+
+
+_RANGE = ("2022-05-25", "2022-05-26")
+_PERFORMANCE = {
+    "batman": {"one": Percent(1), "two": Percent(-2)},
+    "robin": {"one": Percent(3), "two": Percent(4)},
+}
+
+
+@pytest.fixture
+def generator() -> Iterator[PerformanceReportGenerator]:
+    def fetch(
+        identifier: str,
+        range_: Tuple[str, str],
+    ) -> WeightedPricedPointsTable:
+        if identifier not in tables:
+            raise ValueError(identifier)
+        return tables[identifier]
+
+    def calculate(
+        table: WeightedPricedPointsTable,
+        *,
+        outputs: Any = None,
+    ) -> Dict[str, Percent]:
+        performance = _PERFORMANCE[identifiers[id(table)]]
+        return {
+            name: percent
+            for name, percent in performance.items()
+            if outputs is None or name in outputs
+        }
+
+    tables = {
+        identifier: WeightedPricedPointsTable([]) for identifier in _PERFORMANCE
+    }
+    identifiers = {id(table): name for name, table in tables.items()}
+    with patch.object(
+        IDataPointsFetcher,
+        "fetch",
+        side_effect=fetch,
+    ), patch.object(
+        IPerformanceCalculator,
+        "calculate",
+        side_effect=calculate,
+    ), patch.object(
+        IPerformanceCalculator,
+        "names",
+        new_callable=PropertyMock,
+        return_value=("one", "two"),
+    ):
+        yield PerformanceReportGenerator(
+            IDataPointsFetcher(),
+            IPerformanceCalculator(),
+        )
+
+
+class TestPerformanceReportGeneratorGenerateTable:
+    def test(self, generator: PerformanceReportGenerator) -> None:
+        table = generator.generate_table(["robin", "batman"], _RANGE)
+        assert table.identifiers == ("robin", "batman")
+        assert table.names == ("one", "two")
+        np.testing.assert_array_equal(table.bps, [[3, 4], [1, -2]])
+
+    def test_when_outputs(self, generator: PerformanceReportGenerator) -> None:
+        table = generator.generate_table(
+            ["batman"],
+            _RANGE,
+            outputs=["two"],
+        )
+        assert table.names == ("two",)
+        np.testing.assert_array_equal(table.bps, [[-2]])
+
+    def test_when_no_identifiers(
+        self,
+        generator: PerformanceReportGenerator,
+    ) -> None:
+        table = generator.generate_table([], _RANGE)
+        assert len(table) == 0
+        assert table.bps.shape == (0, 0)
+
+    def test_when_no_identifiers_and_outputs(
+        self,
+        generator: PerformanceReportGenerator,
+    ) -> None:
+        table = generator.generate_table([], _RANGE, outputs=["two"])
+        assert table.names == ("two",)
+        assert table.bps.shape == (0, 1)
+
+    def test_when_unknown_outputs(
+        self,
+        generator: PerformanceReportGenerator,
+    ) -> None:
+        with pytest.raises(ValueError, match="outputs"):
+            generator.generate_table([], _RANGE, outputs=["unknown"])
+
+    def test_with_prefetch(self, generator: PerformanceReportGenerator) -> None:
+        table = generator.generate_table(
+            ["robin", "batman"],
+            _RANGE,
+            prefetch=1,
+        )
+        np.testing.assert_array_equal(table.bps, [[3, 4], [1, -2]])
+
+
+class TestPerformanceReportGeneratorGenerateMany:
+    @pytest.mark.parametrize("prefetch", [0, 1, 2, 5])
+    def test(
+        self,
+        generator: PerformanceReportGenerator,
+        prefetch: int,
+    ) -> None:
+        identifiers = ["robin", "batman", "robin"]
+        reports = generator.generate_many(
+            identifiers,
+            _RANGE,
+            prefetch=prefetch,
+        )
+        assert list(reports) == [
+            (identifier, generator.generate(identifier, _RANGE))
+            for identifier in identifiers
+        ]
+
+    def test_when_outputs(self, generator: PerformanceReportGenerator) -> None:
+        reports = generator.generate_many(["batman"], _RANGE, outputs=["one"])
+        assert list(reports) == [("batman", {"one": str(Percent(1))})]
+
+    def test_is_bounded(self, generator: PerformanceReportGenerator) -> None:
+        fetch = IDataPointsFetcher.fetch
+        reports = generator.generate_many(["robin"] * 10, _RANGE, prefetch=2)
+        next(reports)
+        assert fetch.call_count <= 3  # type: ignore[attr-defined]
+        assert len(list(reports)) == 9
+
+    def test_when_fetch_fails(
+        self,
+        generator: PerformanceReportGenerator,
+    ) -> None:
+        reports = generator.generate_many(
+            ["robin", "joker", "batman"],
+            _RANGE,
+            prefetch=2,
+        )
+        assert next(reports)[0] == "robin"
+        with pytest.raises(ValueError, match="joker"):
+            next(reports)
+
+    def test_when_negative_prefetch(
+        self,
+        generator: PerformanceReportGenerator,
+    ) -> None:
+        with pytest.raises(ValueError, match="prefetch"):
+            generator.generate_many(["robin"], _RANGE, prefetch=-1)
+
+    @pytest.mark.parametrize("prefetch", [0, 2])
+    def test_when_batch(
+        self,
+        generator: PerformanceReportGenerator,
+        prefetch: int,
+    ) -> None:
+        identifiers = ["robin", "batman", "robin"]
+        with patch.object(
+            IDataPointsFetcher,
+            "fetch_many",
+            autospec=True,
+            side_effect=IDataPointsFetcher.fetch_many,
+        ) as fetch_many:
+            reports = list(
+                generator.generate_many(
+                    identifiers,
+                    _RANGE,
+                    prefetch=prefetch,
+                    batch=2,
+                )
+            )
+        assert [identifier for identifier, _ in reports] == identifiers
+        assert [call.args[1] for call in fetch_many.call_args_list] == [
+            ["robin", "batman"],
+            ["robin"],
+        ]
+        fetch = IDataPointsFetcher.fetch
+        assert fetch.call_count == 3  # type: ignore[attr-defined]
+
+    def test_fetches_many_by_default(
+        self,
+        generator: PerformanceReportGenerator,
+    ) -> None:
+        identifiers = ["robin", "batman"]
+        with patch.object(
+            IDataPointsFetcher,
+            "fetch_many",
+            autospec=True,
+            side_effect=IDataPointsFetcher.fetch_many,
+        ) as fetch_many:
+            reports = list(generator.generate_many(identifiers, _RANGE))
+        assert [identifier for identifier, _ in reports] == identifiers
+        assert [call.args[1] for call in fetch_many.call_args_list] == [
+            ["robin"],
+            ["batman"],
+        ]
+
+    def test_when_invalid_batch(
+        self,
+        generator: PerformanceReportGenerator,
+    ) -> None:
+        with pytest.raises(ValueError, match="batch"):
+            generator.generate_many(["robin"], _RANGE, batch=0)
+
+
+class TestPerformanceReportTable:
+    @pytest.fixture(scope="class")
+    def table(self) -> PerformanceReportTable:
+        return PerformanceReportTable(
+            ["batman", "robin"],
+            ["one", "two"],
+            np.array([[1, 2], [3, 4]]),
+        )
+
+    def test_when_shape_mismatches(self) -> None:
+        with pytest.raises(ValueError, match="shape"):
+            PerformanceReportTable(["batman"], ["one"], np.array([[1, 2]]))
+
+    def test_read_only(self, table: PerformanceReportTable) -> None:
+        with pytest.raises(ValueError):
+            table.bps[0, 0] = 0
+
+    def test_column(self, table: PerformanceReportTable) -> None:
+        np.testing.assert_array_equal(table.column("two"), [2, 4])
+
+    def test_column_when_unknown(self, table: PerformanceReportTable) -> None:
+        with pytest.raises(KeyError):
+            table.column("unknown")
+
+    def test_records(self, table: PerformanceReportTable) -> None:
+        records = table.records()
+        assert records.dtype.names == ("identifier", "one", "two")
+        assert records[1]["identifier"] == "robin"
+        assert records[1]["two"] == 4
+
+
+_DATES = ("2022-05-24", "2022-05-25", "2022-05-26", "2022-05-27")
+
+
+class _Calendar(IBusinessCalendar):
+    def dates(self, range_: Tuple[str, str]) -> Tuple[str, ...]:
+        start, end = range_
+        return tuple(date for date in _DATES if start <= date <= end)
+
+
+class TestIncrementalPerformanceReportGenerator:
+    _PERFORMANCE = {"total": Percent(3), "residual": Percent(0)}
+
+    @staticmethod
+    def _rates(
+        table: WeightedPricedPointsTable,
+    ) -> Dict[str, PeriodicRateSequence]:
+        return {
+            "total": PeriodicRateSequence(PeriodicRate(0.001) for _ in table)
+        }
+
+    @pytest.fixture
+    def fetcher(self) -> MagicMock:
+        def fetch(_: str, range_: Tuple[str, str]) -> WeightedPricedPointsTable:
+            dates = _Calendar().dates(range_)
+            return WeightedPricedPointsTable(
+                WeightedPricedPointsSequence([]) for _ in dates[1:]
+            )
+
+        return MagicMock(
+            spec=IDataPointsFetcher,
+            **{"fetch.side_effect": fetch},
+        )
+
+    @pytest.fixture
+    def calculator(self) -> MagicMock:
+        return MagicMock(
+            spec=IPerformanceCalculator,
+            **{
+                "rate_names": ("total",),
+                "rates.side_effect": self._rates,
+                "compound.return_value": self._PERFORMANCE,
+            },
+        )
+
+    @pytest.fixture
+    def store(self) -> Iterator[SqliteRatesStore]:
+        store = SqliteRatesStore(":memory:")
+        yield store
+        store.close()
+
+    @pytest.fixture
+    def generator(
+        self,
+        fetcher: MagicMock,
+        calculator: MagicMock,
+        store: SqliteRatesStore,
+    ) -> IncrementalPerformanceReportGenerator:
+        return IncrementalPerformanceReportGenerator(
+            fetcher,
+            calculator,
+            _Calendar(),
+            store,
+        )
+
+    def test_when_nothing_stored(
+        self,
+        generator: IncrementalPerformanceReportGenerator,
+        fetcher: MagicMock,
+        calculator: MagicMock,
+        store: SqliteRatesStore,
+    ) -> None:
+        range_ = (_DATES[0], _DATES[2])
+        expected = {name: str(p) for name, p in self._PERFORMANCE.items()}
+        assert generator.generate("a", range_) == expected
+        assert fetcher.method_calls == [call.fetch("a", range_)]
+        periods = list(zip(_DATES[:2], _DATES[1:3]))
+        calculator.compound.assert_called_once_with(store.get("a", periods))
+
+    def test_computes_missing_periods_only(
+        self,
+        generator: IncrementalPerformanceReportGenerator,
+        fetcher: MagicMock,
+        calculator: MagicMock,
+    ) -> None:
+        generator.generate("a", (_DATES[1], _DATES[2]))
+        fetcher.reset_mock()
+        calculator.reset_mock()
+        generator.generate("a", (_DATES[0], _DATES[3]))
+        assert fetcher.method_calls == [
+            call.fetch("a", (_DATES[0], _DATES[1])),
+            call.fetch("a", (_DATES[2], _DATES[3])),
+        ]
+        compounded = calculator.compound.call_args.args[0]
+        assert len(compounded["total"]) == 3
+
+    def test_when_all_stored(
+        self,
+        generator: IncrementalPerformanceReportGenerator,
+        fetcher: MagicMock,
+    ) -> None:
+        generator.generate("a", (_DATES[0], _DATES[3]))
+        fetcher.reset_mock()
+        generator.generate("a", (_DATES[1], _DATES[2]))
+        assert fetcher.method_calls == []
+
+    @staticmethod
+    def _rates_with_carry(
+        table: WeightedPricedPointsTable,
+    ) -> Dict[str, PeriodicRateSequence]:
+        rates = TestIncrementalPerformanceReportGenerator._rates(table)
+        return {**rates, "carry": rates["total"]}
+
+    def test_when_calculator_gains_effect(
+        self,
+        generator: IncrementalPerformanceReportGenerator,
+        fetcher: MagicMock,
+        calculator: MagicMock,
+    ) -> None:
+        range_ = (_DATES[0], _DATES[2])
+        generator.generate("a", range_)
+        calculator.rate_names = ("total", "carry")
+        calculator.rates.side_effect = self._rates_with_carry
+        fetcher.reset_mock()
+        generator.generate("a", range_)
+        assert fetcher.method_calls == [call.fetch("a", range_)]
+        compounded = calculator.compound.call_args.args[0]
+        assert list(compounded) == ["total", "carry"]
+        assert len(compounded["carry"]) == 2
+
+    def test_when_calculator_loses_effect(
+        self,
+        generator: IncrementalPerformanceReportGenerator,
+        fetcher: MagicMock,
+        calculator: MagicMock,
+    ) -> None:
+        range_ = (_DATES[0], _DATES[2])
+        calculator.rate_names = ("total", "carry")
+        calculator.rates.side_effect = self._rates_with_carry
+        generator.generate("a", range_)
+        calculator.rate_names = ("total",)
+        fetcher.reset_mock()
+        generator.generate("a", range_)
+        assert fetcher.method_calls == []
+        compounded = calculator.compound.call_args.args[0]
+        assert list(compounded) == ["total"]
+
+    def test_when_no_period(
+        self,
+        generator: IncrementalPerformanceReportGenerator,
+    ) -> None:
+        with pytest.raises(ValueError, match="period"):
+            generator.generate("a", (_DATES[1], _DATES[1]))
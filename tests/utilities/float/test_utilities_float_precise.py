@@ -152,6 +152,14 @@ class TestPreciseCasting:
     def test_float(self, precise: Precise, expected: float) -> None:
         assert float(precise) == expected
 
+    @pytest.mark.parametrize("value", [-1, 0, 1, 1523])
+    def test_scaled(self, value: int) -> None:
+        assert Precise(value, 2).scaled == value
+
+    def test_int(self) -> None:
+        with pytest.raises(TypeError):
+            int(Precise(3, 2))  # type: ignore[call-overload]
+
 
 class TestPreciseAlternativeConstructors:
     class _Int:
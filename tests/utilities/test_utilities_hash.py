@@ -0,0 +1,66 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Hashable
+from unittest.mock import patch
+
+from bperf.utilities.hash import CachedHash
+
+
+class _Keyed(CachedHash):
+    def __init__(self, key: Hashable):
+        self._k = key
+
+    def _key(self) -> Hashable:
+        return (self._k,)
+
+
+class _OtherKeyed(_Keyed):
+    pass
+
+
+def _hashed(key: Hashable) -> _Keyed:
+    keyed = _Keyed(key)
+    hash(keyed)
+    return keyed
+
+
+class TestCachedHash:
+    def test_eq(self) -> None:
+        assert _Keyed(1) == _Keyed(1)
+        assert _Keyed(1) != _Keyed(2)
+
+    def test_eq_when_other_class(self) -> None:
+        assert _Keyed(1) != 1
+        assert _OtherKeyed(1).__eq__(_Keyed(1)) is NotImplemented
+
+    def test_hash(self) -> None:
+        assert hash(_Keyed(1)) == hash(_Keyed(1)) == hash((1,))
+
+    def test_hash_is_cached(self) -> None:
+        keyed = _Keyed(1)
+        hash(keyed)
+        with patch.object(_Keyed, "_key") as key:
+            assert hash(keyed) == hash((1,))
+        key.assert_not_called()
+
+    def test_eq_when_hashes_differ(self) -> None:
+        keyed, other = _Keyed(1), _Keyed(2)
+        hash(keyed), hash(other)
+        with patch.object(_Keyed, "_key") as key:
+            assert keyed != other
+        key.assert_not_called()
+
+    def test_pickle(self) -> None:
+        keyed = _hashed("key")
+        unpickled = pickle.loads(pickle.dumps(keyed))
+        assert unpickled._hash is None
+        assert unpickled == keyed
+
+    def test_eq_after_roundtrip_through_process(self) -> None:
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=get_context("spawn")
+        ) as executor:
+            unpickled = executor.submit(_hashed, "key").result()
+        assert unpickled == _hashed("key")
+        assert hash(unpickled) == hash(_hashed("key"))
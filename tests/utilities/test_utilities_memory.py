@@ -0,0 +1,65 @@
+import sys
+
+import numpy as np
+
+from bperf.curve import SpotCurve
+from bperf.flows import Flows
+from bperf.money import Money
+from bperf.priced import PricedFlows
+from bperf.rate.continuous import ContinuousRate
+from bperf.term import Term
+from bperf.termed import Termed
+from bperf.utilities.memory import deep_sizeof
+
+
+class _Slotted:
+    __slots__ = "value"
+
+    def __init__(self, value: object):
+        self.value = value
+
+
+class TestDeepSizeof:
+    def test_when_scalar(self) -> None:
+        assert deep_sizeof(1.0) == sys.getsizeof(1.0)
+
+    def test_when_container(self) -> None:
+        values = ["a" * 100, "b" * 100]
+        expected = sys.getsizeof(values) + sum(map(sys.getsizeof, values))
+        assert deep_sizeof(values) == expected
+
+    def test_when_shared(self) -> None:
+        value = "a" * 100
+        expected = sys.getsizeof((value, value)) + sys.getsizeof(value)
+        assert deep_sizeof((value, value)) == expected
+
+    def test_when_slotted(self) -> None:
+        value = "a" * 100
+        expected = sys.getsizeof(_Slotted(value)) + sys.getsizeof(value)
+        assert deep_sizeof(_Slotted(value)) == expected
+
+    def test_when_array(self) -> None:
+        array = np.zeros(1000)
+        assert deep_sizeof(array) >= array.nbytes
+
+    def test_when_view(self) -> None:
+        array = np.zeros(1000)
+        assert deep_sizeof(array[:10]) >= array.nbytes
+
+    def test_when_cyclic(self) -> None:
+        values: list[object] = []
+        values.append(values)
+        assert deep_sizeof(values) == sys.getsizeof(values)
+
+
+class TestDeepSizeofContainers:
+    def test_sequence(self) -> None:
+        curve = SpotCurve([Termed(Term(1.0), ContinuousRate(0.01))])
+        assert curve.deep_sizeof() == deep_sizeof(curve)
+        assert curve.deep_sizeof() > sys.getsizeof(curve)
+
+    def test_priced(self) -> None:
+        flows = Flows([Termed(Term(1.0), Money(100))])
+        curve = SpotCurve([Termed(Term(1.0), ContinuousRate(0.01))])
+        priced = PricedFlows(flows, curve, ContinuousRate(0.0))
+        assert priced.deep_sizeof() > flows.deep_sizeof() + curve.deep_sizeof()
@@ -0,0 +1,23 @@
+from typing import List, Set
+
+import pytest
+
+from bperf.utilities.runs import missing_runs
+
+
+class TestMissingRuns:
+    @pytest.mark.parametrize(
+        "present, expected",
+        [
+            (set(), [[1, 2, 3, 4, 5]]),
+            ({1, 2, 3, 4, 5}, []),
+            ({3}, [[1, 2], [4, 5]]),
+            ({1, 5}, [[2, 3, 4]]),
+            ({2, 4}, [[1], [3], [5]]),
+        ],
+    )
+    def test(self, present: Set[int], expected: List[List[int]]) -> None:
+        assert missing_runs([1, 2, 3, 4, 5], present) == expected
+
+    def test_when_no_keys(self) -> None:
+        assert missing_runs([], set()) == []
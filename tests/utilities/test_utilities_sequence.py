@@ -1,9 +1,11 @@
+import pickle
 from random import sample
-from typing import Any, Callable, Tuple
+from typing import Any, Callable, List, Tuple
+from unittest.mock import patch
 
 import pytest
 
-from bperf.utilities.sequence import Sequence
+from bperf.utilities.sequence import LazyValues, Sequence, SlicedValues
 
 
 class _T:
@@ -96,6 +98,19 @@ class TestSequenceEqual:
     def test_when_different_object(self, sequence: Sequence[_T]) -> None:
         assert sequence != "a"
 
+    def test_when_same_object(self, values: Tuple[_T, ...]) -> None:
+        sequence = Sequence(values)
+        with patch.object(_T, "__eq__") as mocked:
+            assert sequence == sequence
+        mocked.assert_not_called()
+
+    def test_when_different_hashes(self, values: Tuple[_T, ...]) -> None:
+        sequence, other = Sequence(values), Sequence(values[::-1])
+        hash(sequence), hash(other)
+        with patch.object(_T, "__eq__") as mocked:
+            assert sequence != other
+        mocked.assert_not_called()
+
 
 class TestSequenceHash:
     def test_when_equal(
@@ -127,6 +142,29 @@ class TestSequenceHash:
         other = Sequence(shuffle(values))
         assert hash(other) != hash(sequence)
 
+    def test_is_kept(self, values: Tuple[_T, ...]) -> None:
+        sequence = Sequence(values)
+        with patch.object(_T, "__hash__", return_value=0) as mocked:
+            assert hash(sequence) == hash(sequence)
+        assert mocked.call_count == len(values)
+
+
+class TestSequencePickle:
+    def test(self, sequence: Sequence[_T]) -> None:
+        assert pickle.loads(pickle.dumps(sequence)) == sequence
+
+    def test_materializes_slices(self, sequence: Sequence[_T]) -> None:
+        sliced = sequence[::2]
+        loaded = pickle.loads(pickle.dumps(sliced))
+        assert loaded == sliced
+        assert isinstance(loaded._values, tuple)
+
+    def test_is_not_validated(self, sequence: Sequence[_T]) -> None:
+        pickled = pickle.dumps(sequence)
+        with patch.object(Sequence, "__init__") as mocked:
+            pickle.loads(pickled)
+        mocked.assert_not_called()
+
 
 class TestSequenceRepresentation:
     def test(self, sequence: Sequence[_T]) -> None:
@@ -150,6 +188,15 @@ class TestSequenceIsSequence:
         values: Tuple[_T, ...],
     ) -> None:
         assert sequence[1:] == Sequence(values[1:])
+        assert sequence[::-2] == Sequence(values[::-2])
+
+    def test_getitem_when_slice_shares_values(
+        self,
+        sequence: Sequence[_T],
+    ) -> None:
+        sliced = sequence[1:][::-1]
+        assert isinstance(sliced._values, SlicedValues)
+        assert sliced._values._values is sequence._values
 
     def test_getitem_when_int(
         self,
@@ -168,6 +215,11 @@ class TestSequenceAlternativeConstructors:
     def test_empty(self) -> None:
         assert Sequence.empty() == Sequence([])
 
+    def test_trusted(self, values: Tuple[_T, ...]) -> None:
+        sequence: Sequence[_T] = Sequence._trusted(values)
+        assert sequence == Sequence(values)
+        assert sequence._values is values
+
 
 class TestSequenceIsEmpty:
     def test_when_non_empty(self, sequence: Sequence[_T]) -> None:
@@ -214,3 +266,116 @@ class TestSequenceEmpty:
 
     def test_is_empty(self, sequence: Sequence[_T]) -> None:
         assert sequence.is_empty()
+
+
+class TestLazyValues:
+    @pytest.fixture
+    def calls(self) -> List[int]:
+        return []
+
+    @pytest.fixture
+    def lazy(self, calls: List[int]) -> LazyValues[_T]:
+        def factory(index: int) -> _T:
+            calls.append(index)
+            return _T(index)
+
+        return LazyValues(3, factory)
+
+    def test_creates_on_first_access(
+        self,
+        lazy: LazyValues[_T],
+        calls: List[int],
+    ) -> None:
+        assert calls == []
+        assert lazy[1] == _T(1)
+        assert lazy[-1] == _T(2)
+        assert lazy[1] is lazy[1]
+        assert calls == [1, 2]
+
+    def test_len(self, lazy: LazyValues[_T], calls: List[int]) -> None:
+        assert len(lazy) == 3
+        assert calls == []
+
+    def test_getitem_when_slice(
+        self,
+        lazy: LazyValues[_T],
+        values: Tuple[_T, ...],
+    ) -> None:
+        assert lazy[1:] == values[1:]
+
+    def test_getitem_when_slice_is_lazy(
+        self,
+        lazy: LazyValues[_T],
+        calls: List[int],
+    ) -> None:
+        sliced = lazy[1:]
+        assert calls == []
+        assert sliced[0] == _T(1)
+        assert calls == [1]
+
+    def test_getitem_when_out_of_bounds(self, lazy: LazyValues[_T]) -> None:
+        with pytest.raises(IndexError):
+            # noinspection PyStatementEffect
+            lazy[3]
+
+    def test_eq(self, lazy: LazyValues[_T], values: Tuple[_T, ...]) -> None:
+        assert lazy == values
+        assert values == lazy
+        assert lazy != values[1:]
+        assert lazy != "abc"
+
+    def test_hash(self, lazy: LazyValues[_T], values: Tuple[_T, ...]) -> None:
+        assert hash(lazy) == hash(values)
+
+    def test_in_sequence(
+        self,
+        lazy: LazyValues[_T],
+        sequence: Sequence[_T],
+    ) -> None:
+        other: Sequence[_T] = Sequence._trusted(lazy)
+        assert other == sequence
+        assert sequence == other
+        assert hash(other) == hash(sequence)
+
+
+class TestSlicedValues:
+    @pytest.mark.parametrize(
+        "item",
+        [
+            slice(None),
+            slice(1, None),
+            slice(None, -1),
+            slice(None, None, -1),
+            slice(2, 0, -2),
+            slice(5, 10),
+        ],
+    )
+    def test(self, values: Tuple[_T, ...], item: slice) -> None:
+        sliced = SlicedValues(values, item)
+        assert len(sliced) == len(values[item])
+        assert list(sliced) == list(values[item])
+        assert sliced == values[item]
+        assert values[item] == sliced
+        assert hash(sliced) == hash(values[item])
+
+    def test_getitem_when_int(self, values: Tuple[_T, ...]) -> None:
+        sliced = SlicedValues(values, slice(None, None, -1))
+        assert sliced[0] is values[-1]
+        assert sliced[-1] is values[0]
+        with pytest.raises(IndexError):
+            # noinspection PyStatementEffect
+            sliced[3]
+
+    def test_getitem_when_slice(self, values: Tuple[_T, ...]) -> None:
+        sliced = SlicedValues(values, slice(None, None, -1))[1:]
+        assert sliced == values[::-1][1:]
+        assert isinstance(sliced, SlicedValues)
+        assert sliced._values is values
+
+    def test_step(self, values: Tuple[_T, ...]) -> None:
+        assert SlicedValues(values, slice(None, None, -2)).step == -2
+
+    def test_eq_when_different(self, values: Tuple[_T, ...]) -> None:
+        sliced = SlicedValues(values, slice(1, None))
+        assert sliced != values
+        assert sliced != "abc"